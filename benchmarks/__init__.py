@@ -0,0 +1,11 @@
+# coding=utf-8
+"""
+基准测试
+
+- synthetic: 合成数据生成器（抓取数据、频率词配置）
+- bench_analyzer: 分析流程基准，输出 JSON 便于在不同提交之间对比
+- bench_report: HTML 报告渲染基准（输出格式同上）
+
+运行：python -m benchmarks.bench_analyzer --help
+      python -m benchmarks.bench_report --help
+"""
@@ -0,0 +1,265 @@
+# coding=utf-8
+"""
+分析流程基准测试
+
+用合成数据（见 benchmarks/synthetic.py）测量：
+- load_frequency_words（冷启动：解析 + 编译；热缓存）
+- matches_word_groups（当天所有标题各匹配一次）
+- read_all_today_titles_from_storage（汇总模式的数据读取）
+- count_word_frequency（daily / current / incremental 三种模式）
+- prepare_report_data
+
+用法：
+    python -m benchmarks.bench_analyzer --platforms 20 --crawls 48 --groups 500 --output result.json
+    python -m benchmarks.bench_analyzer --output new.json --compare old.json
+
+结果为 JSON（每项的最小值、中位数、平均值，单位秒），附带提交号、Python 版本和数据规模，
+--compare 按中位数输出与基线结果的对比。
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.synthetic import generate_day, generate_frequency_words
+from trendradar.core import frequency
+from trendradar.core.analyzer import HAS_NUMPY, count_word_frequency
+from trendradar.core.data import (
+    detect_latest_new_titles_from_storage,
+    read_all_today_titles_from_storage,
+)
+from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.report.generator import prepare_report_data
+from trendradar.storage.base import convert_crawl_results_to_news_data
+from trendradar.storage.local import LocalStorageBackend
+from trendradar.utils.time import DEFAULT_TIMEZONE, format_date_folder
+
+
+WEIGHT_CONFIG = {
+    "RANK_WEIGHT": 0.6,
+    "FREQUENCY_WEIGHT": 0.3,
+    "HOTNESS_WEIGHT": 0.1,
+}
+
+
+def _measure(func: Callable, repeat: int, warmup: int = 1, setup: Optional[Callable] = None) -> Dict:
+    """重复执行 func，返回耗时统计（秒）；func 的输出被丢弃"""
+    timings = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for run in range(warmup + repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            if run >= warmup:
+                timings.append(elapsed)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "runs": len(timings),
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _clear_frequency_caches() -> None:
+    frequency._FREQUENCY_CACHE.clear()
+    frequency._MATCHER_CACHE.clear()
+
+
+def run_benchmarks(args: argparse.Namespace) -> Dict:
+    """生成数据并运行所有基准，返回结果字典"""
+    results: Dict[str, Dict] = {}
+
+    with tempfile.TemporaryDirectory(prefix="trendradar-bench-") as work_dir:
+        work_path = Path(work_dir)
+
+        # 频率词配置
+        content, keywords = generate_frequency_words(groups=args.groups, seed=args.seed)
+        frequency_file = work_path / "frequency_words.txt"
+        frequency_file.write_text(content, encoding="utf-8")
+
+        # 写入一天的抓取数据（与正常运行相同的存储路径）
+        id_to_name, day = generate_day(
+            platforms=args.platforms,
+            crawls=args.crawls,
+            titles_per_crawl=args.titles,
+            churn=args.churn,
+            edit_rate=args.edit_rate,
+            keywords=keywords,
+            keyword_rate=args.keyword_rate,
+            seed=args.seed,
+        )
+        date_folder = format_date_folder(timezone=DEFAULT_TIMEZONE)
+        storage = LocalStorageBackend(
+            data_dir=str(work_path / "output"),
+            enable_txt=False,
+            enable_html=False,
+            timezone=DEFAULT_TIMEZONE,
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            for crawl_time, crawl_results in day:
+                storage.save_news_data(convert_crawl_results_to_news_data(
+                    crawl_results, id_to_name, [], crawl_time, date_folder
+                ))
+
+            all_results, names, title_info = read_all_today_titles_from_storage(storage)
+            new_titles = detect_latest_new_titles_from_storage(storage)
+        word_groups, filter_words, global_filters = load_frequency_words(str(frequency_file))
+        all_titles: List[str] = [title for titles in all_results.values() for title in titles]
+
+        # === 频率词 ===
+        results["load_frequency_words.cold"] = _measure(
+            lambda: load_frequency_words(str(frequency_file)),
+            args.repeat,
+            setup=_clear_frequency_caches,
+        )
+        results["load_frequency_words.warm"] = _measure(
+            lambda: load_frequency_words(str(frequency_file)), args.repeat
+        )
+        word_groups, filter_words, global_filters = load_frequency_words(str(frequency_file))
+
+        def match_all():
+            for title in all_titles:
+                matches_word_groups(title, word_groups, filter_words, global_filters)
+
+        results["matches_word_groups"] = _measure(match_all, args.repeat)
+
+        # === 数据读取 ===
+        results["read_all_today_titles"] = _measure(
+            lambda: read_all_today_titles_from_storage(storage), args.repeat
+        )
+
+        # === 统计 ===
+        def count(mode: str, is_first: bool = False):
+            return count_word_frequency(
+                all_results,
+                word_groups,
+                filter_words,
+                names,
+                title_info,
+                rank_threshold=5,
+                new_titles=new_titles,
+                mode=mode,
+                global_filters=global_filters,
+                weight_config=WEIGHT_CONFIG,
+                is_first_crawl_func=lambda: is_first,
+            )
+
+        for mode in ("daily", "current", "incremental"):
+            results[f"count_word_frequency.{mode}"] = _measure(lambda: count(mode), args.repeat)
+
+        # === 报告数据 ===
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats, _ = count("daily")
+        results["prepare_report_data"] = _measure(
+            lambda: prepare_report_data(
+                stats,
+                [],
+                new_titles,
+                names,
+                mode="daily",
+                rank_threshold=5,
+                matches_word_groups_func=matches_word_groups,
+                load_frequency_words_func=lambda: load_frequency_words(str(frequency_file)),
+            ),
+            args.repeat,
+        )
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            storage.cleanup()
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": HAS_NUMPY,
+        },
+        "params": {
+            "platforms": args.platforms,
+            "crawls": args.crawls,
+            "titles_per_crawl": args.titles,
+            "churn": args.churn,
+            "edit_rate": args.edit_rate,
+            "keyword_rate": args.keyword_rate,
+            "groups": args.groups,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "day_titles": len(all_titles),
+            "matched_groups": sum(1 for stat in stats if stat["count"] > 0),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict) -> str:
+    """按中位数对比两次结果，返回文本表格"""
+    lines = []
+    if current.get("params") != baseline.get("params"):
+        lines.append("注意：两次结果的数据规模参数不同")
+    lines.append(f"{'benchmark':<34}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    for name, stats in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            lines.append(f"{name:<34}{'-':>12}{stats['median']:>12.4f}{'-':>8}")
+            continue
+        ratio = stats["median"] / base["median"] if base["median"] else float("inf")
+        lines.append(f"{name:<34}{base['median']:>12.4f}{stats['median']:>12.4f}{ratio:>8.2f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="TrendRadar 分析流程基准测试")
+    parser.add_argument("--platforms", type=int, default=10, help="平台数量")
+    parser.add_argument("--crawls", type=int, default=24, help="当天抓取次数")
+    parser.add_argument("--titles", type=int, default=50, help="每个平台每次抓取的榜单长度")
+    parser.add_argument("--churn", type=float, default=0.2, help="每次抓取被替换的条目比例")
+    parser.add_argument("--edit-rate", type=float, default=0.02, help="标题被编辑的概率")
+    parser.add_argument("--keyword-rate", type=float, default=0.3, help="标题包含关键词的概率")
+    parser.add_argument("--groups", type=int, default=50, help="频率词词组数量")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--repeat", type=int, default=5, help="每项重复次数")
+    parser.add_argument("--output", help="结果 JSON 输出路径（默认输出到标准输出）")
+    parser.add_argument("--compare", help="基线结果 JSON，按中位数输出对比")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        print(f"基准结果已保存: {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(compare(report, baseline), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+# coding=utf-8
+"""
+HTML 报告渲染基准测试
+
+用合成数据（见 benchmarks/synthetic.py）构造一天的统计结果，测量：
+- render_html_content（渲染为完整字符串）
+- render_html_chunks（渲染为片段列表）
+- generate_html_report（准备报告数据 + 渲染 + 写入文件）
+
+用法：
+    python -m benchmarks.bench_report --titles 5000 --output result.json
+    python -m benchmarks.bench_report --output new.json --compare old.json
+
+输出格式与 benchmarks.bench_analyzer 相同，可用 --compare 对比基线结果。
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.bench_analyzer import _git_commit, _measure, compare
+from benchmarks.synthetic import generate_day
+from trendradar.report import html as report_html
+from trendradar.report.generator import generate_html_report, prepare_report_data
+from trendradar.report.html import render_html_content
+
+
+def build_stats(
+    titles: int, groups: int, new_rate: float, seed: int
+) -> Tuple[List[Dict], Dict, Dict]:
+    """
+    构造与 count_word_frequency 输出格式一致的统计结果
+
+    Returns:
+        (stats, new_titles, id_to_name)
+    """
+    platforms = 10
+    id_to_name, day = generate_day(
+        platforms=platforms,
+        crawls=1,
+        titles_per_crawl=max(titles // platforms, 1),
+        seed=seed,
+    )
+    rnd = random.Random(seed)
+    stats = [
+        {"word": f"词组{index}", "count": 0, "position": index, "titles": [], "percentage": 0}
+        for index in range(groups)
+    ]
+    new_titles: Dict[str, Dict] = {}
+
+    _, results = day[0]
+    for source_id, items in results.items():
+        for title, data in items.items():
+            is_new = rnd.random() < new_rate
+            stat = stats[rnd.randrange(groups)]
+            stat["titles"].append({
+                "title": title,
+                "source_name": id_to_name[source_id],
+                "first_time": "08-00",
+                "last_time": "09-30",
+                "time_display": "[08:00 ~ 09:30]",
+                "count": rnd.randint(1, 12),
+                "ranks": data["ranks"],
+                "rank_threshold": 5,
+                "url": data["url"],
+                "mobileUrl": data["mobileUrl"],
+                "is_new": is_new,
+            })
+            stat["count"] += 1
+            if is_new:
+                new_titles.setdefault(source_id, {})[title] = data
+
+    return stats, new_titles, id_to_name
+
+
+def run_benchmarks(args: argparse.Namespace) -> Dict:
+    """生成数据并运行所有基准，返回结果字典"""
+    results: Dict[str, Dict] = {}
+    stats, new_titles, id_to_name = build_stats(args.titles, args.groups, args.new_rate, args.seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        report_data = prepare_report_data(stats, ["bench-failed"], new_titles, id_to_name, mode="daily")
+    total_titles = sum(stat["count"] for stat in stats)
+
+    results["render_html_content"] = _measure(
+        lambda: render_html_content(report_data, total_titles), args.repeat
+    )
+    # 旧版本没有 render_html_chunks，对比时该项显示为 "-"
+    render_html_chunks = getattr(report_html, "render_html_chunks", None)
+    if render_html_chunks is not None:
+        results["render_html_chunks"] = _measure(
+            lambda: render_html_chunks(report_data, total_titles), args.repeat
+        )
+    render_func = render_html_chunks or render_html_content
+
+    with tempfile.TemporaryDirectory(prefix="trendradar-bench-") as work_dir:
+        results["generate_html_report"] = _measure(
+            lambda: generate_html_report(
+                stats,
+                total_titles,
+                failed_ids=["bench-failed"],
+                new_titles=new_titles,
+                id_to_name=id_to_name,
+                mode="daily",
+                output_dir=work_dir,
+                date_folder="bench",
+                time_filename="report",
+                render_html_func=render_func,
+                enable_index_copy=False,
+            ),
+            args.repeat,
+        )
+        html_bytes = (Path(work_dir) / "bench" / "html" / "report.html").stat().st_size
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "params": {
+            "titles": args.titles,
+            "groups": args.groups,
+            "new_rate": args.new_rate,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "html_bytes": html_bytes,
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="TrendRadar HTML 报告渲染基准测试")
+    parser.add_argument("--titles", type=int, default=5000, help="报告中的标题数量")
+    parser.add_argument("--groups", type=int, default=50, help="词组数量")
+    parser.add_argument("--new-rate", type=float, default=0.1, help="新增标题比例")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--repeat", type=int, default=10, help="每项重复次数")
+    parser.add_argument("--output", help="结果 JSON 输出路径（默认输出到标准输出）")
+    parser.add_argument("--compare", help="基线结果 JSON，按中位数输出对比")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        print(f"基准结果已保存: {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(compare(report, baseline), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
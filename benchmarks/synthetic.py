@@ -0,0 +1,183 @@
+# coding=utf-8
+"""
+合成数据生成器
+
+生成接近真实的一天抓取数据和频率词配置，供基准测试使用：
+
+- generate_day: N 个平台 × M 次抓取，榜单有进有出、排名随机游走、部分标题被编辑，
+  标题为中英文混合，部分平台没有 URL（走标题哈希去重路径）
+- generate_frequency_words: 指定规模的频率词配置（普通词、必须词、过滤词、@数量限制、全局过滤）
+
+同一 seed 生成的数据完全相同，便于在不同提交之间对比。
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+
+_ZH_WORDS = [
+    "发布", "回应", "官方", "最新", "进展", "曝光", "宣布", "突破", "市场", "政策",
+    "调整", "上涨", "下跌", "会议", "报告", "数据", "用户", "网友", "热议", "首次",
+    "全球", "国内", "城市", "经济", "科技", "教育", "医疗", "消费", "产品", "价格",
+    "计划", "合作", "项目", "比赛", "冠军", "电影", "票房", "手机", "芯片", "汽车",
+    "新能源", "人工智能", "大模型", "互联网", "平台", "公司", "财报", "季度", "增长", "投资",
+]
+
+_EN_WORDS = [
+    "launch", "report", "market", "update", "release", "record", "global", "deal",
+    "growth", "policy", "model", "chip", "open", "source", "earnings", "quarter",
+    "price", "users", "team", "wins", "new", "first", "data", "cloud", "AI", "app",
+]
+
+_SYLLABLES = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _keyword_vocabulary(size: int, seed: int) -> List[str]:
+    """生成关键词表（公司名/代码风格的英文词 + 中文词组合），不与普通词重复"""
+    rnd = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        if rnd.random() < 0.5:
+            length = rnd.randint(3, 7)
+            word = "".join(rnd.choice(_SYLLABLES) for _ in range(length)).capitalize()
+        else:
+            word = rnd.choice(_ZH_WORDS) + rnd.choice(_ZH_WORDS) + str(rnd.randint(1, 99))
+        words.add(word)
+    return sorted(words)
+
+
+def generate_frequency_words(
+    groups: int = 50,
+    seed: int = 0,
+    filter_ratio: float = 0.1,
+    required_ratio: float = 0.2,
+    global_filters: int = 5,
+) -> Tuple[str, List[str]]:
+    """
+    生成频率词配置文件内容
+
+    Args:
+        groups: 词组数量
+        seed: 随机种子
+        filter_ratio: 带过滤词的词组比例
+        required_ratio: 带必须词的词组比例
+        global_filters: 全局过滤词数量
+
+    Returns:
+        (配置文件内容, 关键词表)，关键词表供 generate_day 在标题中注入
+    """
+    rnd = random.Random(seed)
+    keywords = _keyword_vocabulary(max(groups * 3, 10), seed)
+    sections = []
+
+    if global_filters:
+        sections.append("[GLOBAL_FILTER]\n" + "\n".join(
+            f"屏蔽{rnd.randint(1000, 9999)}" for _ in range(global_filters)
+        ))
+
+    blocks = []
+    for index in range(groups):
+        lines = rnd.sample(keywords, rnd.randint(1, 3))
+        if rnd.random() < required_ratio:
+            lines.append("+" + rnd.choice(_ZH_WORDS + _EN_WORDS))
+        if rnd.random() < filter_ratio:
+            lines.append("!" + rnd.choice(_ZH_WORDS + _EN_WORDS))
+        if index % 7 == 0:
+            lines.append(f"@{rnd.randint(3, 20)}")
+        blocks.append("\n".join(lines))
+    sections.append("[WORD_GROUPS]\n" + "\n\n".join(blocks))
+
+    return "\n\n".join(sections) + "\n", keywords
+
+
+def _make_title(rnd: random.Random, keywords: List[str], keyword_rate: float) -> str:
+    if rnd.random() < 0.3:
+        words = [rnd.choice(_EN_WORDS) for _ in range(rnd.randint(4, 9))]
+        if keywords and rnd.random() < keyword_rate:
+            words.insert(rnd.randrange(len(words)), rnd.choice(keywords))
+        return " ".join(words)
+
+    words = [rnd.choice(_ZH_WORDS) for _ in range(rnd.randint(4, 8))]
+    if keywords and rnd.random() < keyword_rate:
+        words.insert(rnd.randrange(len(words)), rnd.choice(keywords))
+    if rnd.random() < 0.2:
+        words.insert(rnd.randrange(len(words)), rnd.choice(_EN_WORDS))
+    return "".join(words)
+
+
+def generate_day(
+    platforms: int = 10,
+    crawls: int = 24,
+    titles_per_crawl: int = 50,
+    churn: float = 0.2,
+    edit_rate: float = 0.02,
+    keywords: List[str] = None,
+    keyword_rate: float = 0.3,
+    seed: int = 0,
+    interval_minutes: int = 60,
+) -> Tuple[Dict[str, str], List[Tuple[str, Dict]]]:
+    """
+    生成一天的抓取数据
+
+    Args:
+        platforms: 平台数量
+        crawls: 抓取次数
+        titles_per_crawl: 每个平台每次抓取的榜单长度
+        churn: 每次抓取被替换的条目比例
+        edit_rate: 在榜条目标题被编辑的概率（URL 不变）
+        keywords: 注入标题的关键词表（通常来自 generate_frequency_words）
+        keyword_rate: 标题包含关键词的概率
+        seed: 随机种子
+        interval_minutes: 抓取间隔（分钟）
+
+    Returns:
+        (id_to_name, [(crawl_time, results), ...])，results 与爬虫输出格式一致：
+        {source_id: {title: {"ranks": [...], "url": ..., "mobileUrl": ...}}}
+    """
+    rnd = random.Random(seed)
+    keywords = keywords or []
+    id_to_name = {f"bench-{p}": f"平台{p}" for p in range(platforms)}
+
+    # 每个平台的在榜条目：[story_id, title, score]
+    boards: Dict[str, List[List]] = {}
+    next_story = 0
+    for source_id in id_to_name:
+        board = []
+        for _ in range(titles_per_crawl):
+            board.append([next_story, _make_title(rnd, keywords, keyword_rate), rnd.random()])
+            next_story += 1
+        boards[source_id] = board
+
+    start = datetime(2000, 1, 1, 0, 0)
+    day = []
+    for crawl in range(crawls):
+        crawl_time = (start + timedelta(minutes=crawl * interval_minutes)).strftime("%H-%M")
+        results = {}
+        for p, (source_id, board) in enumerate(boards.items()):
+            if crawl:
+                # 榜单变化：部分条目下榜、新条目上榜，标题偶尔被编辑，热度随机游走
+                for _ in range(int(len(board) * churn)):
+                    board.pop(rnd.randrange(len(board)))
+                while len(board) < titles_per_crawl:
+                    board.append([next_story, _make_title(rnd, keywords, keyword_rate), rnd.random()])
+                    next_story += 1
+                for entry in board:
+                    if rnd.random() < edit_rate:
+                        entry[1] = entry[1] + rnd.choice(["（更新）", " | 最新", " (updated)"])
+                    entry[2] += rnd.gauss(0, 0.15)
+
+            board.sort(key=lambda entry: entry[2], reverse=True)
+            source_results = {}
+            for rank, (story_id, title, _) in enumerate(board, 1):
+                # 每三个平台中有一个没有 URL
+                url = "" if p % 3 == 2 else f"https://example.com/{source_id}/{story_id}"
+                source_results[title] = {
+                    "ranks": [rank],
+                    "url": url,
+                    "mobileUrl": url.replace("https://", "https://m.") if url else "",
+                }
+            results[source_id] = source_results
+        day.append((crawl_time, results))
+
+    return id_to_name, day
@@ -9,12 +9,19 @@ import sys
 import subprocess
 import time
 import signal
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 # Web 服务器配置
 WEBSERVER_PORT = int(os.environ.get("WEBSERVER_PORT", "8080"))
 WEBSERVER_DIR = "/app/output"
 WEBSERVER_PID_FILE = "/tmp/webserver.pid"
+# 服务模式：cached = 内置多线程服务器（预压缩 + 缓存头 + 304），simple = python -m http.server
+WEBSERVER_MODE = os.environ.get("WEBSERVER_MODE", "cached").strip().lower()
+# 报告文件会被覆盖更新（如 index.html、当日汇总.html），默认每次向服务器确认，未变化时返回 304
+WEBSERVER_CACHE_CONTROL = os.environ.get("WEBSERVER_CACHE_CONTROL", "no-cache")
 
 
 def run_command(cmd, shell=True, capture_output=True):
@@ -334,7 +341,10 @@ def show_files():
         return
 
     # 显示最近的文件
-    date_dirs = sorted([d for d in output_dir.iterdir() if d.is_dir()], reverse=True)
+    date_dirs = sorted(
+        [d for d in output_dir.iterdir() if d.is_dir() and not d.name.startswith('.')],
+        reverse=True,
+    )
 
     if not date_dirs:
         print("  📭 输出目录为空")
@@ -357,7 +367,7 @@ def show_files():
         for subdir in ["html", "txt"]:
             sub_path = date_dir / subdir
             if sub_path.exists():
-                files = list(sub_path.glob("*"))
+                files = [f for f in sub_path.glob("*") if f.suffix != ".gz"]
                 if files:
                     recent_files = sorted(
                         files, key=lambda x: x.stat().st_mtime, reverse=True
@@ -423,6 +433,114 @@ def restart_supercronic():
         print("  💡 建议重启容器: docker restart trend-radar")
 
 
+class CachedStaticHandler(SimpleHTTPRequestHandler):
+    """
+    静态文件处理器
+
+    - 客户端接受 gzip 且存在不早于原文件的 .gz 副本时，直接返回预压缩内容
+    - 返回 ETag / Last-Modified / Cache-Control，支持 If-None-Match / If-Modified-Since 条件请求（304）
+    - 目录、重定向等其余情况沿用 SimpleHTTPRequestHandler 的行为
+    """
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not self.path.split("?", 1)[0].split("#", 1)[0].endswith("/"):
+                return super().send_head()
+            index_path = os.path.join(path, "index.html")
+            if not os.path.isfile(index_path):
+                return super().send_head()
+            path = index_path
+        if path.endswith("/") or not os.path.isfile(path):
+            return super().send_head()
+
+        try:
+            source_stat = os.stat(path)
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        # 选择预压缩副本
+        serve_path, serve_stat, encoding = path, source_stat, None
+        if self._accepts_gzip():
+            try:
+                gz_stat = os.stat(path + ".gz")
+                if gz_stat.st_mtime >= source_stat.st_mtime:
+                    serve_path, serve_stat, encoding = path + ".gz", gz_stat, "gzip"
+            except OSError:
+                pass
+
+        etag = f'"{serve_stat.st_mtime_ns:x}-{serve_stat.st_size:x}{"-gz" if encoding else ""}"'
+        last_modified = formatdate(int(source_stat.st_mtime), usegmt=True)
+
+        if self._not_modified(etag, int(source_stat.st_mtime)):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_cache_headers(etag, last_modified)
+            self.end_headers()
+            return None
+
+        try:
+            f = open(serve_path, "rb")
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(serve_stat.st_size))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self._send_cache_headers(etag, last_modified)
+        self.end_headers()
+        return f
+
+    def _accepts_gzip(self):
+        for item in self.headers.get("Accept-Encoding", "").split(","):
+            coding, _, params = item.partition(";")
+            if coding.strip().lower() not in ("gzip", "x-gzip", "*"):
+                continue
+            name, _, value = params.replace(" ", "").partition("=")
+            if name.lower() != "q":
+                return True
+            try:
+                return float(value) > 0
+            except ValueError:
+                return False
+        return False
+
+    def _not_modified(self, etag, mtime):
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            # 有 If-None-Match 时忽略 If-Modified-Since（RFC 7232）
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in tags)
+
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                return mtime <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+        return False
+
+    def _send_cache_headers(self, etag, last_modified):
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        self.send_header("Cache-Control", WEBSERVER_CACHE_CONTROL)
+        self.send_header("Vary", "Accept-Encoding")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_webserver():
+    """前台运行内置 Web 服务器（start_webserver 在后台调用）"""
+    handler = lambda *args, **kwargs: CachedStaticHandler(*args, directory=WEBSERVER_DIR, **kwargs)
+    with ThreadingHTTPServer(("0.0.0.0", WEBSERVER_PORT), handler) as httpd:
+        print(f"🌐 Web 服务器运行中: http://0.0.0.0:{WEBSERVER_PORT} (目录: {WEBSERVER_DIR})")
+        httpd.serve_forever()
+
+
 def start_webserver():
     """启动 Web 服务器托管 output 目录"""
     print(f"🌐 启动 Web 服务器 (端口: {WEBSERVER_PORT})...")
@@ -456,10 +574,14 @@ def start_webserver():
 
     try:
         # 启动 HTTP 服务器
-        # 使用 --bind 绑定到 0.0.0.0 使容器内部可访问
+        # 绑定到 0.0.0.0 使容器内部可访问
         # 工作目录限制在 WEBSERVER_DIR，防止访问其他目录
+        if WEBSERVER_MODE == "simple":
+            command = [sys.executable, '-m', 'http.server', str(WEBSERVER_PORT), '--bind', '0.0.0.0']
+        else:
+            command = [sys.executable, os.path.abspath(__file__), 'serve_webserver']
         process = subprocess.Popen(
-            [sys.executable, '-m', 'http.server', str(WEBSERVER_PORT), '--bind', '0.0.0.0'],
+            command,
             cwd=WEBSERVER_DIR,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
@@ -477,6 +599,7 @@ def start_webserver():
 
             print(f"  ✅ Web 服务器已启动 (PID: {process.pid})")
             print(f"  📁 服务目录: {WEBSERVER_DIR} (只读，仅静态文件)")
+            print(f"  ⚙️ 服务模式: {'simple (http.server)' if WEBSERVER_MODE == 'simple' else 'cached (多线程 + gzip 预压缩 + 304)'}")
             print(f"  🌐 访问地址: http://localhost:{WEBSERVER_PORT}")
             print(f"  📄 首页: http://localhost:{WEBSERVER_PORT}/index.html")
             print("  💡 停止服务: python manage.py stop_webserver")
@@ -568,7 +691,8 @@ def show_help():
   files            - 显示输出文件
   logs             - 实时查看日志
   restart          - 重启说明
-  start_webserver  - 启动 Web 服务器托管 output 目录
+  start_webserver  - 启动 Web 服务器托管 output 目录（后台）
+  serve_webserver  - 前台运行内置 Web 服务器
   stop_webserver   - 停止 Web 服务器
   webserver_status - 查看 Web 服务器状态
   help             - 显示此帮助
@@ -609,6 +733,8 @@ def show_help():
      - 停止: stop_webserver
      - 状态: webserver_status
      - 访问: http://localhost:8080
+     - 模式: WEBSERVER_MODE=cached（默认，多线程 + gzip 预压缩 + ETag/304）
+             WEBSERVER_MODE=simple（python -m http.server）
 """
     print(help_text)
 
@@ -627,6 +753,7 @@ def main():
         "logs": show_logs,
         "restart": restart_supercronic,
         "start_webserver": start_webserver,
+        "serve_webserver": serve_webserver,
         "stop_webserver": stop_webserver,
         "webserver_status": webserver_status,
         "help": show_help,
@@ -2,10 +2,11 @@
 文件解析服务
 
 提供txt格式新闻数据和YAML配置文件的解析功能。
-支持从 SQLite 数据库和 TXT 文件两种数据源读取。
+支持从 SQLite 数据库和 TXT 文件两种数据源读取，本地没有数据时可直接范围读取远程数据库。
 """
 
 import json
+import os
 import re
 import sqlite3
 from pathlib import Path
@@ -38,6 +39,10 @@ class ParserService:
         # 初始化缓存服务
         self.cache = get_cache()
 
+        # 远程范围读取使用的存储后端（按需创建）
+        self._remote_backend = None
+        self._remote_checked = False
+
     @staticmethod
     def clean_title(title: str) -> str:
         """
@@ -346,113 +351,187 @@ class ParserService:
         if db_path is None:
             return None
 
-        all_titles = {}
-        id_to_name = {}
-        all_timestamps = {}
-
         try:
             conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            # 检查表是否存在
-            cursor.execute("""
-                SELECT name FROM sqlite_master
-                WHERE type='table' AND name='news_items'
-            """)
-            if not cursor.fetchone():
+            try:
+                return self._query_titles(conn, platform_ids)
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"Warning: 从 SQLite 读取数据失败: {e}")
+            return None
+
+    def _read_from_remote(
+        self,
+        date: datetime = None,
+        platform_ids: Optional[List[str]] = None
+    ) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """
+        通过 HTTP 范围读取直接查询远程数据库（本地没有该日期数据时使用）
+
+        只读取查询用到的页面，无需下载整个数据库。需要 apsw，
+        且远程以未压缩方式存储（storage.remote.compression: none）。
+
+        Args:
+            date: 日期对象，默认为今天
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组，无法远程查询时返回 None
+        """
+        remote_backend = self._get_remote_backend()
+        if remote_backend is None:
+            return None
+
+        date_str = (date or datetime.now()).strftime("%Y-%m-%d")
+        try:
+            conn = remote_backend.open_day_readonly(date_str)
+            if conn is None:
+                return None
+            try:
+                return self._query_titles(conn, platform_ids)
+            finally:
                 conn.close()
+        except Exception as e:
+            print(f"Warning: 远程范围读取失败: {e}")
+            return None
+
+    def _get_remote_backend(self):
+        """获取用于远程范围读取的存储后端（未配置或未启用时返回 None）"""
+        if self._remote_backend is not None or self._remote_checked:
+            return self._remote_backend
+        self._remote_checked = True
+
+        try:
+            from trendradar.storage.remote_vfs import HAS_APSW
+            if not HAS_APSW:
                 return None
 
-            # 构建查询
-            if platform_ids:
-                placeholders = ','.join(['?' for _ in platform_ids])
-                query = f"""
-                    SELECT n.id, n.platform_id, p.name as platform_name, n.title,
-                           n.rank, n.url, n.mobile_url,
-                           n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                    FROM news_items n
-                    LEFT JOIN platforms p ON n.platform_id = p.id
-                    WHERE n.platform_id IN ({placeholders})
-                """
-                cursor.execute(query, platform_ids)
-            else:
-                cursor.execute("""
-                    SELECT n.id, n.platform_id, p.name as platform_name, n.title,
-                           n.rank, n.url, n.mobile_url,
-                           n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                    FROM news_items n
-                    LEFT JOIN platforms p ON n.platform_id = p.id
-                """)
-
-            rows = cursor.fetchall()
-
-            # 收集所有 news_item_id 用于查询历史排名
-            news_ids = [row['id'] for row in rows]
-            rank_history_map = {}
-
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                
-                for rh_row in cursor.fetchall():
-                    news_id = rh_row['news_item_id']
-                    rank = rh_row['rank']
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    rank_history_map[news_id].append(rank)
-
-            for row in rows:
-                news_id = row['id']
-                platform_id = row['platform_id']
-                platform_name = row['platform_name'] or platform_id
-                title = row['title']
-
-                # 更新 id_to_name
-                if platform_id not in id_to_name:
-                    id_to_name[platform_id] = platform_name
-
-                # 初始化平台字典
-                if platform_id not in all_titles:
-                    all_titles[platform_id] = {}
-
-                # 获取排名历史，如果为空则使用当前排名
-                ranks = rank_history_map.get(news_id, [row['rank']])
-
-                # 直接使用数据（已去重）
-                all_titles[platform_id][title] = {
-                    "ranks": ranks,
-                    "url": row['url'] or "",
-                    "mobileUrl": row['mobile_url'] or "",
-                    "first_time": row['first_crawl_time'] or "",
-                    "last_time": row['last_crawl_time'] or "",
-                    "count": row['crawl_count'] or 1,
-                }
-
-            # 获取抓取时间作为 timestamps
-            cursor.execute("""
-                SELECT crawl_time FROM crawl_records
-                ORDER BY crawl_time
-            """)
-            for row in cursor.fetchall():
-                crawl_time = row['crawl_time']
-                all_timestamps[f"{crawl_time}.db"] = 0  # 用虚拟时间戳
-
-            conn.close()
-
-            if not all_titles:
+            config = self.parse_yaml_config()
+            remote_config = config.get("storage", {}).get("remote", {})
+            if not remote_config.get("range_query", True):
                 return None
 
-            return (all_titles, id_to_name, all_timestamps)
+            settings = {
+                "endpoint_url": remote_config.get("endpoint_url") or os.environ.get("S3_ENDPOINT_URL", ""),
+                "bucket_name": remote_config.get("bucket_name") or os.environ.get("S3_BUCKET_NAME", ""),
+                "access_key_id": remote_config.get("access_key_id") or os.environ.get("S3_ACCESS_KEY_ID", ""),
+                "secret_access_key": remote_config.get("secret_access_key") or os.environ.get("S3_SECRET_ACCESS_KEY", ""),
+                "region": remote_config.get("region") or os.environ.get("S3_REGION", ""),
+            }
+            if not (settings["endpoint_url"] and settings["bucket_name"]):
+                return None
 
+            from trendradar.storage.remote import RemoteStorageBackend
+            self._remote_backend = RemoteStorageBackend(
+                timezone=config.get("app", {}).get("timezone", "Asia/Shanghai"),
+                **settings,
+            )
         except Exception as e:
-            print(f"Warning: 从 SQLite 读取数据失败: {e}")
+            print(f"Warning: 创建远程存储后端失败: {e}")
+            self._remote_backend = None
+
+        return self._remote_backend
+
+    @staticmethod
+    def _query_titles(
+        conn,
+        platform_ids: Optional[List[str]] = None
+    ) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """
+        从数据库连接查询标题数据（兼容 sqlite3 与 apsw 连接）
+
+        Args:
+            conn: 数据库连接
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组，没有数据返回 None
+        """
+        all_titles = {}
+        id_to_name = {}
+        all_timestamps = {}
+
+        # 检查表是否存在
+        tables = list(conn.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='news_items'
+        """))
+        if not tables:
             return None
 
+        # 构建查询
+        if platform_ids:
+            placeholders = ','.join(['?' for _ in platform_ids])
+            rows = list(conn.execute(f"""
+                SELECT n.id, n.platform_id, p.name as platform_name, n.title,
+                       n.rank, n.url, n.mobile_url,
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                FROM news_items n
+                LEFT JOIN platforms p ON n.platform_id = p.id
+                WHERE n.platform_id IN ({placeholders})
+            """, platform_ids))
+        else:
+            rows = list(conn.execute("""
+                SELECT n.id, n.platform_id, p.name as platform_name, n.title,
+                       n.rank, n.url, n.mobile_url,
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                FROM news_items n
+                LEFT JOIN platforms p ON n.platform_id = p.id
+            """))
+
+        # 收集所有 news_item_id 用于查询历史排名
+        news_ids = [row[0] for row in rows]
+        rank_history_map = {}
+
+        if news_ids:
+            placeholders = ",".join("?" * len(news_ids))
+            for news_id, rank in conn.execute(f"""
+                SELECT news_item_id, rank FROM rank_history
+                WHERE news_item_id IN ({placeholders})
+                ORDER BY news_item_id, crawl_time
+            """, news_ids):
+                if news_id not in rank_history_map:
+                    rank_history_map[news_id] = []
+                rank_history_map[news_id].append(rank)
+
+        for (news_id, platform_id, platform_name, title, rank, url, mobile_url,
+             first_crawl_time, last_crawl_time, crawl_count) in rows:
+            platform_name = platform_name or platform_id
+
+            # 更新 id_to_name
+            if platform_id not in id_to_name:
+                id_to_name[platform_id] = platform_name
+
+            # 初始化平台字典
+            if platform_id not in all_titles:
+                all_titles[platform_id] = {}
+
+            # 获取排名历史，如果为空则使用当前排名
+            ranks = rank_history_map.get(news_id, [rank])
+
+            # 直接使用数据（已去重）
+            all_titles[platform_id][title] = {
+                "ranks": ranks,
+                "url": url or "",
+                "mobileUrl": mobile_url or "",
+                "first_time": first_crawl_time or "",
+                "last_time": last_crawl_time or "",
+                "count": crawl_count or 1,
+            }
+
+        # 获取抓取时间作为 timestamps
+        for (crawl_time,) in conn.execute("""
+            SELECT crawl_time FROM crawl_records
+            ORDER BY crawl_time
+        """):
+            all_timestamps[f"{crawl_time}.db"] = 0  # 用虚拟时间戳
+
+        if not all_titles:
+            return None
+
+        return (all_titles, id_to_name, all_timestamps)
+
     def read_all_titles_for_date(
         self,
         date: datetime = None,
@@ -501,6 +580,12 @@ class ParserService:
             self.cache.set(cache_key, txt_result)
             return txt_result
 
+        # 本地都不存在，尝试直接范围读取远程数据库
+        remote_result = self._read_from_remote(date, platform_ids)
+        if remote_result:
+            self.cache.set(cache_key, remote_result)
+            return remote_result
+
         # 两种数据源都不存在
         raise DataNotFoundError(
             f"未找到 {date_str} 的数据",
@@ -90,6 +90,7 @@ class StorageSyncTools:
             remote_config = self._get_remote_config()
             config = self._load_config()
             timezone = config.get("app", {}).get("timezone", "Asia/Shanghai")
+            pull_config = self._get_storage_config().get("pull", {})
 
             self._remote_backend = RemoteStorageBackend(
                 bucket_name=remote_config["bucket_name"],
@@ -98,6 +99,7 @@ class StorageSyncTools:
                 endpoint_url=remote_config["endpoint_url"],
                 region=remote_config.get("region", ""),
                 timezone=timezone,
+                pull_workers=pull_config.get("max_workers", 4),
             )
             return self._remote_backend
         except ImportError:
@@ -211,53 +213,30 @@ class StorageSyncTools:
             local_dir = self._get_local_data_dir()
             local_dir.mkdir(parents=True, exist_ok=True)
 
-            # 获取远程可用日期
-            remote_dates = remote_backend.list_remote_dates()
-
-            # 获取本地已有日期
-            local_dates = set(self._get_local_dates())
-
             # 计算需要拉取的日期（最近 N 天）
             from trendradar.utils.time import get_configured_time
             config = self._load_config()
             timezone = config.get("app", {}).get("timezone", "Asia/Shanghai")
             now = get_configured_time(timezone)
 
+            # 旧版中文日期目录中已有的数据不再重复拉取
+            local_dates = set(self._get_local_dates())
+            legacy_dates = []
             target_dates = []
             for i in range(days):
-                date = now - timedelta(days=i)
-                date_str = date.strftime("%Y-%m-%d")
-                if date_str in remote_dates:
+                date_str = (now - timedelta(days=i)).strftime("%Y-%m-%d")
+                if date_str in local_dates and not (local_dir / date_str).exists():
+                    legacy_dates.append(date_str)
+                else:
                     target_dates.append(date_str)
 
-            # 执行拉取
-            synced_dates = []
-            skipped_dates = []
-            failed_dates = []
-
-            for date_str in target_dates:
-                # 检查本地是否已存在
-                if date_str in local_dates:
-                    skipped_dates.append(date_str)
-                    continue
-
-                # 拉取单个日期
-                try:
-                    local_date_dir = local_dir / date_str
-                    local_db_path = local_date_dir / "news.db"
-                    remote_key = f"news/{date_str}.db"
-
-                    local_date_dir.mkdir(parents=True, exist_ok=True)
-                    remote_backend.s3_client.download_file(
-                        remote_backend.bucket_name,
-                        remote_key,
-                        str(local_db_path)
-                    )
-                    synced_dates.append(date_str)
-                    print(f"[存储同步] 已拉取: {date_str}")
-                except Exception as e:
-                    failed_dates.append({"date": date_str, "error": str(e)})
-                    print(f"[存储同步] 拉取失败 ({date_str}): {e}")
+            # 并行拉取（远程不存在的日期忽略，本地已存在且未变化的日期跳过）
+            result = remote_backend.pull_days(target_dates, str(local_dir))
+            synced_dates = result["pulled"]
+            skipped_dates = sorted(
+                result["unchanged"] + result["local"] + legacy_dates, reverse=True
+            )
+            failed_dates = result["failed"]
 
             return {
                 "success": True,
@@ -266,7 +245,7 @@ class StorageSyncTools:
                 "skipped_dates": skipped_dates,
                 "failed_dates": failed_dates,
                 "message": f"成功同步 {len(synced_dates)} 天数据" + (
-                    f"，跳过 {len(skipped_dates)} 天（本地已存在）" if skipped_dates else ""
+                    f"，跳过 {len(skipped_dates)} 天（本地已存在且未变化）" if skipped_dates else ""
                 ) + (
                     f"，失败 {len(failed_dates)} 天" if failed_dates else ""
                 )
@@ -334,10 +313,22 @@ class StorageSyncTools:
                 remote_backend = self._get_remote_backend()
                 if remote_backend:
                     try:
-                        remote_dates = remote_backend.list_remote_dates()
+                        # 远程清单一次读取即可得到日期和概要信息
+                        manifest_dates = remote_backend.get_manifest().get("dates", {})
+                        remote_dates = sorted(manifest_dates, reverse=True)
                         remote_status["date_count"] = len(remote_dates)
                         remote_status["earliest_date"] = remote_dates[-1] if remote_dates else None
                         remote_status["latest_date"] = remote_dates[0] if remote_dates else None
+                        remote_status["total_size"] = sum(
+                            entry.get("size") or 0 for entry in manifest_dates.values()
+                        )
+                        remote_status["total_items"] = sum(
+                            entry.get("item_count") or 0 for entry in manifest_dates.values()
+                        )
+                        if remote_dates:
+                            latest = manifest_dates[remote_dates[0]]
+                            remote_status["latest_crawl_time"] = latest.get("last_crawl_time")
+                            remote_status["latest_crawl_count"] = latest.get("crawl_count")
                     except Exception as e:
                         remote_status["error"] = str(e)
 
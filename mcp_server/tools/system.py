@@ -171,11 +171,14 @@ class SystemManagementTools:
             )
 
             # 初始化存储后端
+            local_config = config_data.get("storage", {}).get("local", {})
             storage = LocalStorageBackend(
                 data_dir=str(self.project_root / "output"),
                 enable_txt=True,
                 enable_html=True,
-                timezone=timezone
+                timezone=timezone,
+                max_read_connections=local_config.get("max_read_connections", 8),
+                idle_timeout=local_config.get("idle_timeout", 300),
             )
 
             # 尝试持久化数据
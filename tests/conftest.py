@@ -0,0 +1,45 @@
+# coding=utf-8
+"""测试公共夹具"""
+
+from typing import Dict
+
+import pytest
+
+from trendradar.storage.base import NewsData, convert_crawl_results_to_news_data
+
+
+ID_TO_NAME = {"weibo": "微博", "zhihu": "知乎", "hn": "Hacker News"}
+
+
+def make_crawl(crawl: int, date: str = "2025-01-01") -> NewsData:
+    """
+    构造第 crawl 次抓取的数据（每次抓取部分标题下榜、部分新上榜，排名变化）
+
+    Args:
+        crawl: 抓取序号（从 0 开始）
+        date: 日期
+
+    Returns:
+        NewsData
+    """
+    results: Dict[str, Dict] = {}
+    for source_id in ID_TO_NAME:
+        titles = {}
+        for rank, story in enumerate(range(crawl * 3, crawl * 3 + 12), 1):
+            # hn 没有 URL，走标题哈希去重
+            url = "" if source_id == "hn" else f"https://example.com/{source_id}/{story}"
+            titles[f"{ID_TO_NAME[source_id]} 新闻 {story} 🔥"] = {
+                "ranks": [rank],
+                "url": url,
+                "mobileUrl": url.replace("https://", "https://m.") if url else "",
+            }
+        results[source_id] = titles
+    return convert_crawl_results_to_news_data(
+        results, ID_TO_NAME, [], f"{8 + crawl:02d}:00", date
+    )
+
+
+@pytest.fixture
+def crawls():
+    """生成第 n 次抓取数据的函数"""
+    return make_crawl
@@ -0,0 +1,175 @@
+# coding=utf-8
+"""
+count_word_frequency 黄金输出测试
+
+输入为录制的一天数据（tests/data/analyzer/input.json：合成数据加 "手动" 平台的手写标题，
+经本地存储写入后读出的 results / title_info / new_titles）
+和词组配置（frequency_words.txt，含必须词、过滤词、@数量限制、全局过滤词）；
+golden.json 为单遍改写之前的实现在同样输入下的输出。
+NumPy 排序、并行匹配、增量状态预计算等路径都必须得到相同结果。
+
+重新录制（仅在有意改变输出时）：python -m tests.test_analyzer_golden
+"""
+
+import contextlib
+import io
+import json
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pytest
+
+from trendradar.core.analyzer import count_word_frequency
+from trendradar.core.frequency import load_frequency_words
+
+
+DATA_DIR = Path(__file__).parent / "data" / "analyzer"
+GOLDEN_PATH = DATA_DIR / "golden.json"
+
+WEIGHT_CONFIG = {
+    "RANK_WEIGHT": 0.6,
+    "FREQUENCY_WEIGHT": 0.3,
+    "HOTNESS_WEIGHT": 0.1,
+}
+
+# 用例名 -> (是否使用"全部新闻"（不配置词组）, 是否当天第一次抓取, 其他参数)
+CASES: Dict[str, Tuple[bool, bool, Dict]] = {
+    "daily": (False, False, {"mode": "daily"}),
+    "daily_all_news": (True, False, {"mode": "daily"}),
+    "daily_limits": (False, False, {"mode": "daily", "max_news_per_keyword": 2, "sort_by_position_first": True}),
+    "current": (False, False, {"mode": "current"}),
+    "current_first": (False, True, {"mode": "current"}),
+    "current_all_news": (True, False, {"mode": "current"}),
+    "incremental": (False, False, {"mode": "incremental"}),
+    "incremental_first": (False, True, {"mode": "incremental"}),
+    "incremental_all_news": (True, False, {"mode": "incremental"}),
+}
+
+
+def load_input() -> Dict:
+    with open(DATA_DIR / "input.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run_case(name: str, data: Dict, **overrides):
+    """运行一个用例，返回可与 golden.json 比较的 [stats, total]"""
+    all_news, is_first, kwargs = CASES[name]
+    if all_news:
+        word_groups, filter_words, global_filters = [], [], []
+    else:
+        word_groups, filter_words, global_filters = load_frequency_words(
+            str(DATA_DIR / "frequency_words.txt")
+        )
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats, total = count_word_frequency(
+            data["results"],
+            word_groups,
+            filter_words,
+            data["id_to_name"],
+            data["title_info"],
+            rank_threshold=5,
+            new_titles=data["new_titles"],
+            global_filters=global_filters,
+            weight_config=WEIGHT_CONFIG,
+            is_first_crawl_func=lambda: is_first,
+            convert_time_func=lambda t: t.replace("-", ":"),
+            **kwargs,
+            **overrides,
+        )
+    # 经 JSON 往返，与录制文件的类型保持一致（元组 -> 列表）
+    return json.loads(json.dumps([stats, total], ensure_ascii=False))
+
+
+@pytest.fixture(scope="module")
+def data():
+    return load_input()
+
+
+@pytest.fixture(scope="module")
+def golden():
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_matches_golden(name, data, golden):
+    assert run_case(name, data) == golden[name]
+
+
+@pytest.mark.parametrize("name", ["daily", "current", "incremental_first"])
+def test_parallel_matching_matches_golden(name, data, golden):
+    assert run_case(name, data, workers=2, parallel_threshold=0) == golden[name]
+
+
+@pytest.mark.parametrize("name", ["daily", "daily_limits", "current_first"])
+def test_numpy_sort_matches_golden(name, data, golden, monkeypatch):
+    from trendradar.core import analyzer
+
+    if not analyzer.HAS_NUMPY:
+        pytest.skip("需要 numpy")
+    # 录制数据的词组都很小，降低阈值让每个词组都走向量化排序
+    monkeypatch.setattr(analyzer, "NUMPY_MIN_TITLES", 0)
+    assert run_case(name, data) == golden[name]
+
+
+@pytest.mark.parametrize("name", ["daily", "daily_limits", "current"])
+def test_precomputed_groups_match_golden(name, data, golden):
+    """增量统计状态传入的词组归属（precomputed_groups）与现场匹配结果一致"""
+    from trendradar.core.analyzer import resolve_word_groups
+    from trendradar.core.frequency import get_word_matcher
+
+    word_groups, filter_words, global_filters = load_frequency_words(
+        str(DATA_DIR / "frequency_words.txt")
+    )
+    word_groups, filter_words = resolve_word_groups(word_groups, filter_words)
+    matcher = get_word_matcher(word_groups, filter_words, global_filters)
+    groups = {
+        source_id: {title: matcher.first_group(title) for title in titles}
+        for source_id, titles in data["results"].items()
+    }
+    assert run_case(name, data, precomputed_groups=groups) == golden[name]
+
+
+def test_required_filter_and_global_filter_words(golden):
+    """必须词、过滤词、全局过滤词、词组顺序的具体结果（录制数据中 "手动" 平台的手写标题）"""
+    matched = {
+        item["title"]: stat["word"]
+        for stat in golden["daily"][0]
+        for item in stat["titles"]
+    }
+    # 必须词全部出现才匹配
+    assert matched["国产芯片厂商发布新一代产品"] == "芯片"
+    assert "芯片价格持续上涨" not in matched
+    assert matched["三季度经济增长超出预期"] == "经济"
+    assert "经济数据今日公布" not in matched
+    # 词组过滤词、全局过滤词
+    assert "人工智能公司打响价格战" not in matched
+    assert "大模型训练细节曝光" not in matched
+    assert "春节档电影票房下跌两成" not in matched
+    # 同时匹配多个词组时归入配置中靠前的词组
+    assert matched["AI芯片发布会今晚举行"] == "芯片"
+    assert matched["经济季度增长放缓 芯片需求回暖"] == "经济"
+    # @3 数量限制
+    assert [len(stat["titles"]) for stat in golden["daily"][0] if stat["word"] == "新能源 汽车"] == [3]
+
+
+def test_all_news_group_keeps_every_title(data, golden):
+    """未配置词组时使用"全部新闻"虚拟词组，不应用任何过滤"""
+    stats, total = golden["daily_all_news"]
+    assert [stat["word"] for stat in stats] == ["全部新闻"]
+    assert stats[0]["count"] == total == sum(len(titles) for titles in data["results"].values())
+    new_stats, _ = golden["incremental_all_news"]
+    assert new_stats[0]["count"] == sum(len(titles) for titles in data["new_titles"].values())
+
+
+def record() -> None:
+    data = load_input()
+    golden = {name: run_case(name, data) for name in CASES}
+    GOLDEN_PATH.write_text(
+        json.dumps(golden, ensure_ascii=False, indent=1) + "\n", encoding="utf-8"
+    )
+    print(f"已录制 {len(golden)} 个用例: {GOLDEN_PATH}")
+
+
+if __name__ == "__main__":
+    record()
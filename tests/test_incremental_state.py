@@ -0,0 +1,94 @@
+# coding=utf-8
+"""增量统计状态（trendradar.core.incremental）测试"""
+
+from pathlib import Path
+
+import pytest
+
+from tests.conftest import ID_TO_NAME
+from trendradar.core.data import read_all_today_titles_from_storage
+from trendradar.core.frequency import load_frequency_words
+from trendradar.core.incremental import DailyAnalysisState, read_today_titles_incremental
+from trendradar.storage.base import convert_crawl_results_to_news_data
+from trendradar.storage.manager import StorageManager
+from trendradar.utils.time import format_date_folder
+
+
+def test_save_prunes_state_files_of_other_days(tmp_path):
+    state_dir = tmp_path / ".analysis"
+    state_dir.mkdir()
+    for name in ("2025-01-01.json", "2025-01-02.json", "2025-01-02.json.tmp"):
+        (state_dir / name).write_text("{}", encoding="utf-8")
+    (state_dir / "notes.txt").write_text("keep", encoding="utf-8")
+
+    DailyAnalysisState(str(state_dir), "2025-01-03").save()
+
+    assert sorted(p.name for p in state_dir.iterdir()) == ["2025-01-03.json", "notes.txt"]
+
+
+def test_saved_state_is_reloaded(tmp_path):
+    state = DailyAnalysisState(str(tmp_path), "2025-01-03")
+    state.crawl_times = ["08-00", "09-00"]
+    state.save()
+
+    reloaded = DailyAnalysisState(str(tmp_path), "2025-01-03")
+    assert reloaded._load()
+    assert reloaded.crawl_times == ["08-00", "09-00"]
+
+
+# 每次抓取：{平台: [(标题, URL)]}，排名按列表顺序
+_CRAWLS = [
+    {
+        "weibo": [("芯片 新闻 1", "https://example.com/weibo/1"), ("AI 新闻 2", "https://example.com/weibo/2")],
+        "zhihu": [("芯片 新闻 3", "https://example.com/zhihu/3")],
+        "hn": [("芯片  新闻 A", ""), ("AI 新闻 B", "")],
+    },
+    {
+        # 同一 URL 标题变化；无 URL 条目只有空白不同
+        "weibo": [("芯片 新闻 1（更新）", "https://example.com/weibo/1")],
+        "zhihu": [("芯片 新闻 3", "https://example.com/zhihu/3"), ("AI 新闻 4", "https://example.com/zhihu/4")],
+        "hn": [("芯片 新闻 A", ""), (" AI 新闻 B ", "")],
+    },
+    {
+        "weibo": [("AI 新闻 2", "https://example.com/weibo/2"), ("芯片 新闻 5", "https://example.com/weibo/5")],
+        "hn": [("芯片 新闻\tA", ""), ("芯片 新闻 C", "")],
+    },
+]
+
+
+def _news_data(crawl: int, date: str):
+    results = {
+        source_id: {
+            title: {"ranks": [rank], "url": url, "mobileUrl": ""}
+            for rank, (title, url) in enumerate(items, 1)
+        }
+        for source_id, items in _CRAWLS[crawl].items()
+    }
+    return convert_crawl_results_to_news_data(results, ID_TO_NAME, [], f"{8 + crawl:02d}:00", date)
+
+
+@pytest.mark.parametrize("platform_ids", [None, ["weibo", "hn"]])
+def test_incremental_titles_match_full_read(tmp_path, platform_ids):
+    word_groups, filter_words, global_filters = load_frequency_words(
+        str(Path(__file__).parent / "data" / "analyzer" / "frequency_words.txt")
+    )
+    storage = StorageManager(backend_type="local", data_dir=str(tmp_path / "output"))
+    date = format_date_folder(None, storage.timezone)
+    state_dir = str(tmp_path / ".analysis")
+
+    for crawl in range(len(_CRAWLS)):
+        assert storage.save_news_data(_news_data(crawl, date))
+
+        expected = read_all_today_titles_from_storage(storage, platform_ids)
+        all_results, id_to_name, title_info, groups = read_today_titles_incremental(
+            storage, state_dir, date, platform_ids, word_groups, filter_words, global_filters
+        )
+
+        assert (all_results, id_to_name, title_info) == expected
+        assert {s: set(titles) for s, titles in groups.items()} == {
+            s: set(titles) for s, titles in expected[0].items()
+        }
+
+    # 空白变体只保留一条（最后一次出现的标题）
+    assert set(all_results["hn"]) == {" AI 新闻 B ", "芯片 新闻\tA", "芯片 新闻 C"}
+    storage.cleanup()
@@ -0,0 +1,123 @@
+# coding=utf-8
+"""SQLite 连接池（trendradar.storage.pool）测试"""
+
+import threading
+import time
+
+from trendradar.storage.pool import SQLiteConnectionPool
+
+
+def _init_tables(conn):
+    conn.execute("CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, value INTEGER)")
+    conn.commit()
+
+
+def test_concurrent_readers_and_writer(tmp_path):
+    db_path = str(tmp_path / "news.db")
+    pool = SQLiteConnectionPool(init_func=_init_tables, max_readers=4)
+    rows_written = 200
+    errors = []
+    done = threading.Event()
+    reader_counts = []
+
+    def writer():
+        try:
+            for i in range(rows_written):
+                with pool.writer(db_path) as conn:
+                    conn.execute("INSERT INTO items (value) VALUES (?)", (i,))
+                    conn.commit()
+        except Exception as e:
+            errors.append(e)
+        finally:
+            done.set()
+
+    def reader():
+        try:
+            last = 0
+            while not done.is_set():
+                with pool.reader(db_path) as conn:
+                    count = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+                # 已提交的写入对后续读取可见，行数不会倒退
+                assert count >= last
+                last = count
+            reader_counts.append(last)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer)] + [
+        threading.Thread(target=reader) for _ in range(6)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=30)
+
+    assert not errors
+    with pool.reader(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == rows_written
+
+    stats = pool.get_stats()
+    # 6 个读线程共用 4 个读连接上限，连接数从未超过上限
+    assert stats["readers"] <= 4
+    assert stats["write_acquires"] == rows_written
+    assert stats["readers_in_use"] == 0
+    pool.close_all()
+
+
+def test_reader_is_reentrant_within_thread(tmp_path):
+    db_path = str(tmp_path / "news.db")
+    pool = SQLiteConnectionPool(init_func=_init_tables, max_readers=1, acquire_timeout=0.1)
+
+    with pool.reader(db_path) as outer:
+        with pool.reader(db_path) as inner:
+            assert inner is outer
+
+    assert pool.get_stats()["reused"] == 1
+    pool.close_all()
+
+
+def test_evict_idle_closes_only_idle_connections(tmp_path):
+    db_a = str(tmp_path / "a.db")
+    db_b = str(tmp_path / "b.db")
+    pool = SQLiteConnectionPool(init_func=_init_tables, idle_timeout=0)
+
+    with pool.reader(db_a):
+        pass
+    with pool.reader(db_b) as busy:
+        # b 的读连接正在使用，a 的读连接和两个写连接都已空闲
+        time.sleep(0.01)
+        assert pool.evict_idle(max_idle=0) == 3
+        busy.execute("SELECT 1")
+
+    stats = pool.get_stats()
+    assert stats["readers"] == 1
+    assert stats["writers"] == 0
+
+    assert pool.evict_idle(max_idle=60) == 0
+    assert pool.evict_idle(max_idle=0) == 1
+    assert pool.get_stats()["readers"] == 0
+
+
+def test_close_path_releases_file_and_reinitializes(tmp_path):
+    db_a = tmp_path / "a.db"
+    db_b = str(tmp_path / "b.db")
+    pool = SQLiteConnectionPool(init_func=_init_tables)
+
+    with pool.writer(str(db_a)) as conn:
+        conn.execute("INSERT INTO items (value) VALUES (1)")
+        conn.commit()
+    with pool.reader(str(db_a)):
+        pass
+    with pool.reader(db_b):
+        pass
+
+    # a 的读连接和写连接都被关闭，b 不受影响
+    assert pool.close_path(str(db_a)) == 2
+    assert pool.get_stats()["readers"] == 1
+
+    db_a.unlink()
+
+    # 文件删除后重新打开时再次执行初始化
+    with pool.reader(str(db_a)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+    pool.close_all()
@@ -0,0 +1,51 @@
+# coding=utf-8
+"""远程数据库缓存（trendradar.storage.cache）测试"""
+
+import json
+
+from trendradar.storage.cache import RemoteDBCache
+
+
+def _add_day(cache: RemoteDBCache, date_folder: str, size: int, last_used: float, **state):
+    db_path = cache.db_path(date_folder)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    db_path.write_bytes(b"\0" * size)
+    # update_state 总是写入当前时间，这里直接写入指定的最近使用时间
+    state = dict(state, last_used=last_used)
+    cache._state_path(date_folder).write_text(json.dumps(state), encoding="utf-8")
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    cache = RemoteDBCache(str(tmp_path), max_size_mb=1)
+    mb = 1024 * 1024
+    _add_day(cache, "2025-01-01", mb * 2 // 5, 1.0, dirty=False)
+    _add_day(cache, "2025-01-02", mb * 2 // 5, 2.0, dirty=False)
+    _add_day(cache, "2025-01-03", mb * 2 // 5, 3.0, dirty=False)
+
+    assert cache.evict() == ["2025-01-01"]
+    assert not cache.db_path("2025-01-01").exists()
+    assert cache.db_path("2025-01-03").exists()
+
+
+def test_evict_keeps_dirty_days(tmp_path, capsys):
+    cache = RemoteDBCache(str(tmp_path), max_size_mb=1)
+    mb = 1024 * 1024
+    _add_day(cache, "2025-01-01", mb * 2 // 5, 1.0, dirty=True)
+    _add_day(cache, "2025-01-02", mb * 2 // 5, 2.0, dirty=False)
+    _add_day(cache, "2025-01-03", mb * 2 // 5, 3.0, dirty=False)
+
+    # 最旧的一天有未同步写入，跳过它淘汰下一天
+    assert cache.evict() == ["2025-01-02"]
+    assert cache.db_path("2025-01-01").exists()
+    assert "警告" not in capsys.readouterr().out
+
+
+def test_evict_warns_when_dirty_days_block_eviction(tmp_path, capsys):
+    cache = RemoteDBCache(str(tmp_path), max_size_mb=1)
+    mb = 1024 * 1024
+    _add_day(cache, "2025-01-01", mb, 1.0, dirty=True)
+    _add_day(cache, "2025-01-02", mb, 2.0, dirty=False)
+
+    assert cache.evict(keep=["2025-01-02"]) == []
+    assert cache.db_path("2025-01-01").exists()
+    assert "2025-01-01" in capsys.readouterr().out
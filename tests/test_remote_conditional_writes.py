@@ -0,0 +1,94 @@
+# coding=utf-8
+"""远程存储条件写入（If-Match / If-None-Match）及不支持时的回退"""
+
+import pytest
+
+from trendradar.storage.fs_s3 import FileSystemS3Client, _error
+from trendradar.storage.manifest import MANIFEST_KEY, RemoteManifest, is_conditional_write_unsupported
+from trendradar.storage.remote import RemoteStorageBackend
+
+try:
+    from botocore.exceptions import ParamValidationError
+except ImportError:
+    ParamValidationError = None
+
+
+class _NoConditionalClient(FileSystemS3Client):
+    """不支持条件写入的存储服务：带 IfMatch / IfNoneMatch 的 PutObject 抛出 make_error()"""
+
+    def __init__(self, root, make_error):
+        super().__init__(root)
+        self.make_error = make_error
+        self.rejected = 0
+
+    def put_object(self, **kwargs):
+        if "IfMatch" in kwargs or "IfNoneMatch" in kwargs:
+            self.rejected += 1
+            raise self.make_error()
+        return super().put_object(**kwargs)
+
+
+def _not_implemented():
+    return _error("NotImplemented", "PutObject", 501)
+
+
+def _old_botocore():
+    return ParamValidationError(
+        report='Unknown parameter in input: "IfMatch", must be one of: Bucket, Key, IfNoneMatch'
+    )
+
+
+def _backend(tmp_path, client):
+    return RemoteStorageBackend(
+        bucket_name="bucket",
+        access_key_id="",
+        secret_access_key="",
+        endpoint_url="",
+        temp_dir=str(tmp_path / "tmp"),
+        compression="none",
+        s3_client=client,
+    )
+
+
+ERROR_FACTORIES = [_not_implemented]
+if ParamValidationError is not None:
+    ERROR_FACTORIES.append(_old_botocore)
+
+
+@pytest.mark.parametrize("make_error", ERROR_FACTORIES)
+def test_upload_falls_back_to_unconditional_put(tmp_path, crawls, make_error, capsys):
+    client = _NoConditionalClient(f"file://{tmp_path / 's3'}", make_error)
+    backend = _backend(tmp_path, client)
+    try:
+        for crawl in range(3):
+            assert backend.save_news_data(crawls(crawl))
+    finally:
+        backend.cleanup()
+
+    assert client.head_object(Bucket="bucket", Key="news/2025-01-01.db")
+    manifest, _ = RemoteManifest(client, "bucket").load()
+    assert manifest["dates"]["2025-01-01"]["crawl_count"] == 3
+    # 每个客户端只尝试一次条件写入（基础库一次、清单一次），之后直接普通写入
+    assert client.rejected == 2
+    assert "不支持条件写入" in capsys.readouterr().out
+
+
+def test_conflict_is_not_treated_as_unsupported():
+    assert not is_conditional_write_unsupported(_error("PreconditionFailed", "PutObject", 412))
+    assert is_conditional_write_unsupported(_not_implemented())
+
+
+@pytest.mark.skipif(ParamValidationError is None, reason="需要 botocore")
+def test_other_validation_errors_are_not_swallowed():
+    error = ParamValidationError(
+        report='Unknown parameter in input: "Foo", must be one of: Bucket, IfMatch, IfNoneMatch'
+    )
+    assert not is_conditional_write_unsupported(error)
+
+
+def test_manifest_keeps_conditional_writes_when_supported(tmp_path):
+    client = FileSystemS3Client(f"file://{tmp_path / 's3'}")
+    manifest = RemoteManifest(client, "bucket")
+    assert manifest.update(lambda m: m["dates"].setdefault("2025-01-01", {}))
+    assert manifest.conditional_writes
+    assert client.head_object(Bucket="bucket", Key=MANIFEST_KEY)
@@ -0,0 +1,92 @@
+# coding=utf-8
+"""远程清单（trendradar.storage.manifest）缺失或过旧时的重建，使用本地文件系统 S3 替身"""
+
+import json
+from datetime import timedelta
+
+import pytest
+
+from trendradar.storage.fs_s3 import FileSystemS3Client
+from trendradar.storage.manifest import MANIFEST_KEY, RemoteManifest
+from trendradar.storage.remote import RemoteStorageBackend
+from trendradar.utils.time import get_configured_time
+
+
+LEGACY_KEY = "news/2024年12月01日.db"
+
+
+def _backend(tmp_path, client, name):
+    return RemoteStorageBackend(
+        bucket_name="bucket",
+        access_key_id="",
+        secret_access_key="",
+        endpoint_url="",
+        temp_dir=str(tmp_path / name),
+        s3_client=client,
+    )
+
+
+def _keys(client):
+    pages = client.get_paginator("list_objects_v2").paginate(Bucket="bucket", Prefix="news/")
+    return {obj["Key"] for page in pages for obj in page.get("Contents", [])}
+
+
+@pytest.fixture
+def bucket(tmp_path, crawls):
+    """
+    预先写入两天旧数据和一个旧中文命名的数据库，但没有清单（升级前的存储桶）
+
+    Returns:
+        (client, [较旧日期, 较新日期, 今天])
+    """
+    now = get_configured_time("Asia/Shanghai")
+    dates = [(now - timedelta(days=days)).strftime("%Y-%m-%d") for days in (10, 9, 0)]
+
+    client = FileSystemS3Client(f"file://{tmp_path / 's3'}")
+    writer = _backend(tmp_path, client, "writer")
+    for date in dates[:2]:
+        for crawl in range(2):
+            assert writer.save_news_data(crawls(crawl, date))
+    writer.cleanup()
+
+    client.put_object(Bucket="bucket", Key=LEGACY_KEY, Body=b"legacy")
+    client.delete_object(Bucket="bucket", Key=MANIFEST_KEY)
+    return client, dates
+
+
+def test_first_upload_without_manifest_keeps_existing_dates(tmp_path, crawls, bucket):
+    client, dates = bucket
+    backend = _backend(tmp_path, client, "reader")
+    assert backend.save_news_data(crawls(0, dates[2]))
+
+    manifest, _ = RemoteManifest(client, "bucket").load()
+    assert sorted(manifest["dates"]) == dates
+    assert manifest["dates"][dates[2]]["crawl_count"] == 1
+    assert manifest["legacy"] == {LEGACY_KEY: "2024-12-01"}
+    assert backend.list_remote_dates() == sorted(dates, reverse=True)
+
+    # 按清单清理时旧日期和旧中文命名的数据库都会被删除
+    assert backend.cleanup_old_data(5) == 3
+    remaining = _keys(client)
+    assert LEGACY_KEY not in remaining
+    assert not any(dates[0] in key or dates[1] in key for key in remaining)
+    assert backend.list_remote_dates() == [dates[2]]
+    backend.cleanup()
+
+
+def test_outdated_manifest_is_rebuilt(tmp_path, crawls, bucket):
+    client, dates = bucket
+    # 旧版本写入的清单只记录了当天
+    client.put_object(
+        Bucket="bucket",
+        Key=MANIFEST_KEY,
+        Body=json.dumps({"version": 1, "updated_at": "", "dates": {dates[2]: {}}}).encode("utf-8"),
+    )
+
+    backend = _backend(tmp_path, client, "reader")
+    assert backend.list_remote_dates() == sorted(dates[:2], reverse=True)
+
+    assert backend.save_news_data(crawls(0, dates[2]))
+    manifest, _ = RemoteManifest(client, "bucket").load()
+    assert sorted(manifest["dates"]) == dates
+    backend.cleanup()
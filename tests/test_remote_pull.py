@@ -0,0 +1,66 @@
+# coding=utf-8
+"""远程并行拉取（RemoteStorageBackend.pull_days）测试，使用本地文件系统 S3 替身"""
+
+import sqlite3
+
+from trendradar.storage.fs_s3 import FileSystemS3Client
+from trendradar.storage.remote import RemoteStorageBackend
+
+
+PULL_DATES = ["2025-01-01", "2025-01-02", "2025-01-03"]
+TODAY = "2025-01-04"
+
+
+def _backend(tmp_path, client, name):
+    return RemoteStorageBackend(
+        bucket_name="bucket",
+        access_key_id="",
+        secret_access_key="",
+        endpoint_url="",
+        temp_dir=str(tmp_path / name),
+        compact_segments=2,
+        s3_client=client,
+    )
+
+
+def _count_items(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM news_items").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_pull_days_does_not_touch_upload_state(tmp_path, crawls):
+    client = FileSystemS3Client(f"file://{tmp_path / 's3'}")
+
+    writer = _backend(tmp_path, client, "writer")
+    expected = {}
+    for date in PULL_DATES:
+        # 3 次抓取：基础库 + 未压缩的变更分段
+        for crawl in range(3):
+            assert writer.save_news_data(crawls(crawl, date))
+        expected[date] = _count_items(writer._get_local_db_path(date))
+    writer.cleanup()
+
+    backend = _backend(tmp_path, client, "reader")
+    assert backend.save_news_data(crawls(0, TODAY))
+    etags = dict(backend._base_etags)
+    exists = dict(backend._base_exists)
+    downloaded = list(backend._downloaded_files)
+
+    result = backend.pull_days(PULL_DATES, str(tmp_path / "output"), max_workers=3)
+
+    assert sorted(result["pulled"]) == PULL_DATES
+    assert not result["failed"]
+    for date in PULL_DATES:
+        assert _count_items(tmp_path / "output" / date / "news.db") == expected[date]
+
+    # 工作线程不修改当天上传依赖的状态
+    assert backend._base_etags == etags
+    assert backend._base_exists == exists
+    assert backend._downloaded_files == downloaded
+
+    # 当天后续上传仍使用原来的 ETag 做条件写入
+    assert backend.save_news_data(crawls(1, TODAY))
+    backend.cleanup()
@@ -0,0 +1,142 @@
+# coding=utf-8
+"""远程数据库范围读取（trendradar.storage.remote_vfs）测试，使用本地文件系统 S3 替身"""
+
+import sqlite3
+
+import pytest
+
+from mcp_server.services.parser_service import ParserService
+from trendradar.storage.fs_s3 import FileSystemS3Client
+from trendradar.storage.remote import RemoteStorageBackend
+from trendradar.storage import remote_vfs
+from trendradar.storage.remote_vfs import HAS_APSW, RangedObject
+
+
+DATE = "2025-01-01"
+
+
+class _CountingClient(FileSystemS3Client):
+    """记录每次 get_object 的 Range 参数"""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.ranges = []
+
+    def get_object(self, **kwargs):
+        if "Range" in kwargs:
+            self.ranges.append(kwargs["Range"])
+        return super().get_object(**kwargs)
+
+
+@pytest.fixture
+def remote_day(tmp_path, crawls):
+    """通过 file:// 替身保存多次抓取（不压缩、每次上传完整基础库），返回 (backend, 本地库路径)"""
+    client = _CountingClient(f"file://{tmp_path / 's3'}")
+    backend = RemoteStorageBackend(
+        bucket_name="bucket",
+        access_key_id="",
+        secret_access_key="",
+        endpoint_url="",
+        temp_dir=str(tmp_path / "tmp"),
+        compression="none",
+        compact_segments=0,
+        s3_client=client,
+    )
+    for crawl in range(4):
+        assert backend.save_news_data(crawls(crawl, DATE))
+    local_path = backend._get_local_db_path(DATE)
+    yield backend, local_path
+    backend.cleanup()
+
+
+@pytest.mark.skipif(not HAS_APSW, reason="需要 apsw")
+@pytest.mark.parametrize("platform_ids", [None, ["weibo", "hn"]])
+def test_ranged_query_matches_local_sqlite(remote_day, platform_ids):
+    backend, local_path = remote_day
+    # 小块、小缓存，确保查询过程中实际发生多次范围请求和块淘汰
+    backend._range_vfs = remote_vfs.S3ReadOnlyVFS(
+        backend.s3_client, "bucket", block_size=4096, cache_blocks=4
+    )
+
+    conn = backend.open_day_readonly(DATE)
+    assert conn is not None
+    try:
+        remote_result = ParserService._query_titles(conn, platform_ids)
+    finally:
+        conn.close()
+
+    local_conn = sqlite3.connect(str(local_path))
+    try:
+        local_result = ParserService._query_titles(local_conn, platform_ids)
+    finally:
+        local_conn.close()
+
+    assert remote_result is not None
+    assert remote_result == local_result
+    assert backend.s3_client.ranges, "查询应通过范围请求读取"
+
+
+def test_open_day_readonly_rejects_compressed_objects(tmp_path, crawls):
+    backend = RemoteStorageBackend(
+        bucket_name="bucket",
+        access_key_id="",
+        secret_access_key="",
+        endpoint_url=f"file://{tmp_path / 's3'}",
+        temp_dir=str(tmp_path / "tmp"),
+        compression="gzip",
+        compact_segments=0,
+    )
+    try:
+        assert backend.save_news_data(crawls(0, DATE))
+        assert backend.open_day_readonly(DATE) is None
+    finally:
+        backend.cleanup()
+
+
+def _put_object(tmp_path, size):
+    client = _CountingClient(f"file://{tmp_path / 's3'}")
+    data = bytes(i % 251 for i in range(size))
+    response = client.put_object(Bucket="bucket", Key="obj.db", Body=data)
+    return client, data, response["ETag"].strip('"')
+
+
+def test_ranged_object_coalesces_adjacent_missing_blocks(tmp_path):
+    client, data, etag = _put_object(tmp_path, 10 * 1024)
+    ranged = RangedObject(client, "bucket", "obj.db", len(data), etag, block_size=1024)
+
+    # 跨越 4 个缺失块的读取只发一次请求
+    assert ranged.read(100, 3500) == data[100:3600]
+    assert client.ranges == ["bytes=0-4095"]
+    assert ranged.requests == 1
+
+    # 块 4 已缓存：块 3 与块 5、6 不相邻，分为两次请求
+    ranged.read(4096, 10)
+    client.ranges.clear()
+    ranged._blocks.pop(3)
+    assert ranged.read(3 * 1024, 4 * 1024) == data[3 * 1024:7 * 1024]
+    assert client.ranges == ["bytes=3072-4095", "bytes=5120-7167"]
+
+
+def test_ranged_object_reads_are_cached_and_clamped(tmp_path):
+    client, data, etag = _put_object(tmp_path, 2500)
+    ranged = RangedObject(client, "bucket", "obj.db", len(data), etag, block_size=1024)
+
+    assert ranged.read(2000, 1000) == data[2000:]
+    assert ranged.read(2400, 50) == data[2400:2450]
+    assert ranged.read(3000, 10) == b""
+    assert client.ranges == ["bytes=1024-2499"]
+
+
+def test_ranged_object_read_larger_than_cache(tmp_path):
+    client, data, etag = _put_object(tmp_path, 5 * 1024)
+    ranged = RangedObject(
+        client, "bucket", "obj.db", len(data), etag, block_size=1024, max_blocks=1
+    )
+
+    # 单次读取跨越 3 个块，超过缓存上限
+    assert ranged.read(500, 2 * 1024 + 100) == data[500:2648]
+    assert len(ranged._blocks) == 1
+
+    # 只剩块 2 在缓存中：块 1、3 分别请求后与缓存块正确拼接
+    assert ranged.read(1024, 3 * 1024) == data[1024:4096]
+    assert len(ranged._blocks) == 1
@@ -0,0 +1,43 @@
+# coding=utf-8
+"""HTML 报告写出（trendradar.report.generator）测试"""
+
+import gzip
+import os
+from pathlib import Path
+
+from trendradar.report import generator
+
+
+def test_daily_summary_and_index_copies_are_replaced_atomically(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    replaced = []
+    real_replace = os.replace
+
+    def spy_replace(src, dst):
+        replaced.append(str(dst))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(generator.os, "replace", spy_replace)
+
+    file_path = generator.generate_html_report(
+        [],
+        0,
+        is_daily_summary=True,
+        date_folder="2025-01-01",
+        render_html_func=lambda *args: ["<html>", "<body>汇总</body>", "</html>"],
+        precompress=True,
+    )
+
+    html = Path(file_path).read_bytes()
+    index = Path("output") / "index.html"
+    index_gz = Path("output") / "index.html.gz"
+    assert html == "<html><body>汇总</body></html>".encode("utf-8")
+    assert Path("index.html").read_bytes() == html
+    assert index.read_bytes() == html
+    assert gzip.decompress(index_gz.read_bytes()) == html
+
+    # 服务器可能读取的文件都经临时文件替换写入，不留下临时文件
+    assert set(replaced) == {
+        file_path, file_path + ".gz", "index.html", str(index), str(index_gz),
+    }
+    assert not list(tmp_path.rglob("*.tmp"))
@@ -0,0 +1,181 @@
+# coding=utf-8
+"""
+消息分批黄金输出测试
+
+report.json 为录制的报告数据（由 tests/data/analyzer 的录制数据经 prepare_report_data 得到），
+golden.json 为按字节预算线性拼装批次之前的实现在各推送格式、各批次大小下的分批结果，
+当前实现必须逐字节一致。另外对连续的每个批次大小记录分批结果的摘要，
+覆盖内容恰好等于上限等边界情况。
+
+重新录制（仅在有意改变输出时）：python -m tests.test_splitter_golden
+"""
+
+import hashlib
+import json
+import random
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from trendradar.notification.batch import truncate_to_bytes
+from trendradar.notification.splitter import split_content_into_batches
+
+
+DATA_DIR = Path(__file__).parent / "data" / "splitter"
+GOLDEN_PATH = DATA_DIR / "golden.json"
+
+FORMATS = ["feishu", "dingtalk", "wework", "telegram", "ntfy", "bark", "slack"]
+# None = 各格式的默认批次大小；500 字节时几乎每条新闻都要开启新批次
+BUDGETS = [None, 1500, 500]
+UPDATE_INFO = {"current_version": "4.0.0", "remote_version": "4.1.0"}
+# 逐字节扫描的批次大小（奇数大小同时反转内容顺序并附带版本更新信息）
+SWEEP_BUDGETS = range(400, 700)
+
+
+def _fixed_time() -> datetime:
+    return datetime(2025, 1, 1, 12, 30, 0)
+
+
+def load_report() -> Dict:
+    with open(DATA_DIR / "report.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def case_ids() -> List[str]:
+    ids = []
+    for format_type in FORMATS:
+        for budget in BUDGETS:
+            ids.append(f"{format_type}-{budget or 'default'}")
+        ids.append(f"{format_type}-500-reverse-update")
+        ids.append(f"{format_type}-empty-incremental")
+    return ids
+
+
+def run_case(case_id: str, report: Dict) -> List[str]:
+    parts = case_id.split("-")
+    format_type = parts[0]
+    kwargs = {"get_time_func": _fixed_time}
+    if parts[1] == "empty":
+        report = {"stats": [], "new_titles": [], "failed_ids": [], "total_new_count": 0}
+        kwargs["mode"] = parts[2]
+    elif parts[1] != "default":
+        kwargs["max_bytes"] = int(parts[1])
+    if "reverse" in parts:
+        kwargs["reverse_content_order"] = True
+    if "update" in parts:
+        kwargs["update_info"] = UPDATE_INFO
+    return split_content_into_batches(report, format_type, **kwargs)
+
+
+def sweep_digests(format_type: str, report: Dict) -> List[str]:
+    """对 SWEEP_BUDGETS 中每个批次大小分批，返回分批结果的摘要列表"""
+    digests = []
+    for budget in SWEEP_BUDGETS:
+        odd = budget % 2 == 1
+        batches = split_content_into_batches(
+            report,
+            format_type,
+            update_info=UPDATE_INFO if odd else None,
+            max_bytes=budget,
+            reverse_content_order=odd,
+            get_time_func=_fixed_time,
+        )
+        payload = json.dumps(batches, ensure_ascii=False).encode("utf-8")
+        digests.append(f"{len(batches)}:{hashlib.sha256(payload).hexdigest()[:16]}")
+    return digests
+
+
+@pytest.fixture(scope="module")
+def report():
+    return load_report()
+
+
+@pytest.fixture(scope="module")
+def golden():
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("case_id", case_ids())
+def test_batches_match_golden(case_id, report, golden):
+    assert run_case(case_id, report) == golden[case_id]
+
+
+@pytest.mark.parametrize("format_type", FORMATS)
+def test_budget_sweep_matches_golden(format_type, report, golden):
+    assert sweep_digests(format_type, report) == golden["sweep"][format_type]
+
+
+def test_golden_cases_split_into_multiple_batches(golden):
+    """小批次用例确实触发了分批（否则无法覆盖开启新批次的逻辑）"""
+    for format_type in FORMATS:
+        assert len(golden[f"{format_type}-default"]) == 1
+        assert len(golden[f"{format_type}-500"]) > 5
+
+
+# === truncate_to_bytes ===
+
+# "a中🔥b"：a 1 字节，中 3 字节，🔥 4 字节，b 1 字节，共 9 字节
+@pytest.mark.parametrize(
+    "max_bytes, expected",
+    [
+        (0, ""),
+        (1, "a"),
+        (2, "a"),
+        (3, "a"),
+        (4, "a中"),
+        (5, "a中"),
+        (7, "a中"),
+        (8, "a中🔥"),
+        (9, "a中🔥b"),
+        (10, "a中🔥b"),
+    ],
+)
+def test_truncate_to_bytes_boundaries(max_bytes, expected):
+    assert truncate_to_bytes("a中🔥b", max_bytes) == expected
+
+
+@pytest.mark.parametrize(
+    "text, max_bytes, expected",
+    [
+        ("", 0, ""),
+        ("🔥", 3, ""),
+        ("🔥🔥", 4, "🔥"),
+        ("éé", 3, "é"),
+        ("中文", 5, "中"),
+        ("中文", 6, "中文"),
+        ("abc", 2, "ab"),
+    ],
+)
+def test_truncate_to_bytes_multibyte(text, max_bytes, expected):
+    assert truncate_to_bytes(text, max_bytes) == expected
+
+
+def test_truncate_to_bytes_returns_longest_fitting_prefix():
+    rnd = random.Random(0)
+    alphabet = "aZ9 é€中文🔥📊\n"
+    for _ in range(2000):
+        text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 20)))
+        size = len(text.encode("utf-8"))
+        for max_bytes in range(size + 2):
+            result = truncate_to_bytes(text, max_bytes)
+            assert text.startswith(result)
+            assert len(result.encode("utf-8")) <= max_bytes
+            if result != text:
+                assert len(text[: len(result) + 1].encode("utf-8")) > max_bytes
+
+
+def record() -> None:
+    report = load_report()
+    golden = {case_id: run_case(case_id, report) for case_id in case_ids()}
+    golden["sweep"] = {format_type: sweep_digests(format_type, report) for format_type in FORMATS}
+    GOLDEN_PATH.write_text(
+        json.dumps(golden, ensure_ascii=False, indent=1) + "\n", encoding="utf-8"
+    )
+    print(f"已录制 {len(golden)} 个用例: {GOLDEN_PATH}")
+
+
+if __name__ == "__main__":
+    record()
@@ -9,7 +9,7 @@ TrendRadar 主程序
 import os
 import webbrowser
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 
 import requests
 
@@ -20,6 +20,8 @@ VERSION = "4.0.0"
 from trendradar.core import load_config
 from trendradar.crawler import DataFetcher
 from trendradar.storage import convert_crawl_results_to_news_data
+from trendradar.utils.metrics import write_textfile as write_metrics_textfile
+from trendradar.utils.tracing import end_trace, span, start_trace
 
 
 def check_version_update(
@@ -102,9 +104,14 @@ class NewsAnalyzer:
     }
 
     def __init__(self):
+        # 每次运行的阶段追踪（从加载配置开始）
+        self.tracer = start_trace("NewsAnalyzer.run", version=VERSION)
+
         # 加载配置
         print("正在加载配置...")
-        config = load_config()
+        with span("config.load") as config_span:
+            config = load_config()
+            config_span.set(platforms=len(config["PLATFORMS"]))
         print(f"TrendRadar v{VERSION} 配置加载完成")
         print(f"监控平台数量: {len(config['PLATFORMS'])}")
         print(f"时区: {config.get('TIMEZONE', 'Asia/Shanghai')}")
@@ -119,6 +126,8 @@ class NewsAnalyzer:
         self.is_docker_container = self._detect_docker_environment()
         self.update_info = None
         self.proxy_url = None
+        # 单次运行内的阶段结果缓存：实时报告与汇总报告共用同一份数据、新增标题和统计
+        self._run_cache: Dict[Tuple, Any] = {}
         self._setup_proxy()
         self.data_fetcher = DataFetcher(self.proxy_url)
 
@@ -227,18 +236,59 @@ class NewsAnalyzer:
             )
             return has_matched_news or has_new_news
 
+    def _memoize(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """
+        单次运行内缓存阶段结果，同一 key 只计算一次
+
+        结果为 None（如加载失败）时不缓存，后续调用会重新计算。
+        """
+        if key in self._run_cache:
+            return self._run_cache[key]
+        value = compute()
+        if value is not None:
+            self._run_cache[key] = value
+        return value
+
+    def _load_frequency_words(self) -> Tuple[List[Dict], List[str], List[str]]:
+        """加载频率词配置（本次运行内只加载一次）"""
+        return self._memoize(("frequency_words",), self.ctx.load_frequency_words)
+
     def _load_analysis_data(
         self,
-    ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List]]:
-        """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据"""
+    ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List, List, Optional[Dict]]]:
+        """统一的数据加载和预处理（本次运行内只读取一次，实时报告与汇总报告共用）"""
+        return self._memoize(
+            ("analysis_data", tuple(self.ctx.platform_ids)), self._read_analysis_data
+        )
+
+    def _read_analysis_data(
+        self,
+    ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List, List, Optional[Dict]]]:
+        """从存储读取当天数据，使用当前监控平台列表过滤历史数据"""
         try:
             # 获取当前配置的监控平台ID列表
             current_platform_ids = self.ctx.platform_ids
             print(f"当前监控平台: {current_platform_ids}")
 
-            all_results, id_to_name, title_info = self.ctx.read_today_titles(
-                current_platform_ids
-            )
+            word_groups, filter_words, global_filters = self._load_frequency_words()
+
+            # 增量统计：标题表和词组归属由持久化状态提供，只读取和匹配上次之后变化的条目
+            group_assignments = None
+            with span("analysis.load") as load_span:
+                if self.ctx.config.get("INCREMENTAL_STATS", False):
+                    all_results, id_to_name, title_info, group_assignments = (
+                        self.ctx.read_today_titles_incremental(
+                            current_platform_ids, word_groups, filter_words, global_filters
+                        )
+                    )
+                else:
+                    all_results, id_to_name, title_info = self.ctx.read_today_titles(
+                        current_platform_ids
+                    )
+                load_span.set(
+                    items=sum(len(titles) for titles in all_results.values()),
+                    incremental=group_assignments is not None,
+                )
 
             if not all_results:
                 print("没有找到当天的数据")
@@ -247,8 +297,7 @@ class NewsAnalyzer:
             total_titles = sum(len(titles) for titles in all_results.values())
             print(f"读取到 {total_titles} 个标题（已按当前监控平台过滤）")
 
-            new_titles = self.ctx.detect_new_titles(current_platform_ids)
-            word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
+            new_titles = self._detect_new_titles(current_platform_ids)
 
             return (
                 all_results,
@@ -258,11 +307,23 @@ class NewsAnalyzer:
                 word_groups,
                 filter_words,
                 global_filters,
+                group_assignments,
             )
         except Exception as e:
             print(f"数据加载失败: {e}")
             return None
 
+    def _detect_new_titles(self, platform_ids: List[str]) -> Dict:
+        """检测最新批次的新增标题（本次运行内只检测一次，记录追踪）"""
+
+        def detect() -> Dict:
+            with span("analysis.detect_new") as detect_span:
+                new_titles = self.ctx.detect_new_titles(platform_ids)
+                detect_span.set(items=sum(len(titles) for titles in new_titles.values()))
+            return new_titles
+
+        return self._memoize(("new_titles", tuple(platform_ids)), detect)
+
     def _prepare_current_title_info(self, results: Dict, time_info: str) -> Dict:
         """从当前抓取结果构建标题信息"""
         title_info = {}
@@ -295,34 +356,59 @@ class NewsAnalyzer:
         failed_ids: Optional[List] = None,
         is_daily_summary: bool = False,
         global_filters: Optional[List[str]] = None,
+        group_assignments: Optional[Dict] = None,
+        stats_source: Optional[str] = None,
     ) -> Tuple[List[Dict], Optional[str]]:
-        """统一的分析流水线：数据处理 → 统计计算 → HTML生成"""
+        """
+        统一的分析流水线：数据处理 → 统计计算 → HTML生成
+
+        stats_source 标明数据来源（"history" 当天全部数据 / "crawl" 本次抓取），
+        给出时统计结果按 (来源, 模式) 在本次运行内缓存，实时报告和汇总报告不重复统计。
+        """
 
         # 统计计算（使用 AppContext）
-        stats, total_titles = self.ctx.count_frequency(
-            data_source,
-            word_groups,
-            filter_words,
-            id_to_name,
-            title_info,
-            new_titles,
-            mode=mode,
-            global_filters=global_filters,
-        )
+        with span("analysis.count", mode=mode, summary=is_daily_summary) as count_span:
+            cache_key = ("stats", stats_source, mode)
+            if stats_source is not None and cache_key in self._run_cache:
+                stats, total_titles = self._run_cache[cache_key]
+                count_span.set(cached=True)
+            else:
+                stats, total_titles = self.ctx.count_frequency(
+                    data_source,
+                    word_groups,
+                    filter_words,
+                    id_to_name,
+                    title_info,
+                    new_titles,
+                    mode=mode,
+                    global_filters=global_filters,
+                    precomputed_groups=group_assignments,
+                )
+                if stats_source is not None:
+                    self._run_cache[cache_key] = (stats, total_titles)
+            count_span.set(
+                items=total_titles,
+                matched=sum(stat["count"] for stat in stats),
+                groups=sum(1 for stat in stats if stat["count"] > 0),
+                group_counts={stat["word"]: stat["count"] for stat in stats},
+            )
 
         # HTML生成（如果启用）
         html_file = None
         if self.ctx.config["STORAGE"]["FORMATS"]["HTML"]:
-            html_file = self.ctx.generate_html(
-                stats,
-                total_titles,
-                failed_ids=failed_ids,
-                new_titles=new_titles,
-                id_to_name=id_to_name,
-                mode=mode,
-                is_daily_summary=is_daily_summary,
-                update_info=self.update_info if self.ctx.config["SHOW_VERSION_UPDATE"] else None,
-            )
+            with span("report.html", mode=mode, summary=is_daily_summary) as html_span:
+                html_file = self.ctx.generate_html(
+                    stats,
+                    total_titles,
+                    failed_ids=failed_ids,
+                    new_titles=new_titles,
+                    id_to_name=id_to_name,
+                    mode=mode,
+                    is_daily_summary=is_daily_summary,
+                    update_info=self.update_info if self.ctx.config["SHOW_VERSION_UPDATE"] else None,
+                )
+                if html_file and os.path.exists(html_file):
+                    html_span.set(bytes=os.path.getsize(html_file))
 
         return stats, html_file
 
@@ -373,14 +459,16 @@ class NewsAnalyzer:
 
             # 使用 NotificationDispatcher 发送到所有渠道
             dispatcher = self.ctx.create_notification_dispatcher()
-            results = dispatcher.dispatch_all(
-                report_data=report_data,
-                report_type=report_type,
-                update_info=update_info_to_send,
-                proxy_url=self.proxy_url,
-                mode=mode,
-                html_file_path=html_file_path,
-            )
+            with span("notify", report_type=report_type) as notify_span:
+                results = dispatcher.dispatch_all(
+                    report_data=report_data,
+                    report_type=report_type,
+                    update_info=update_info_to_send,
+                    proxy_url=self.proxy_url,
+                    mode=mode,
+                    html_file_path=html_file_path,
+                )
+                notify_span.set(channels=len(results), succeeded=sum(1 for ok in results.values() if ok))
 
             if not results:
                 print("未配置任何通知渠道，跳过通知发送")
@@ -430,9 +518,16 @@ class NewsAnalyzer:
         if not analysis_data:
             return None
 
-        all_results, id_to_name, title_info, new_titles, word_groups, filter_words, global_filters = (
-            analysis_data
-        )
+        (
+            all_results,
+            id_to_name,
+            title_info,
+            new_titles,
+            word_groups,
+            filter_words,
+            global_filters,
+            group_assignments,
+        ) = analysis_data
 
         # 运行分析流水线
         stats, html_file = self._run_analysis_pipeline(
@@ -445,6 +540,8 @@ class NewsAnalyzer:
             id_to_name,
             is_daily_summary=True,
             global_filters=global_filters,
+            group_assignments=group_assignments,
+            stats_source="history",
         )
 
         if html_file:
@@ -473,9 +570,16 @@ class NewsAnalyzer:
         if not analysis_data:
             return None
 
-        all_results, id_to_name, title_info, new_titles, word_groups, filter_words, global_filters = (
-            analysis_data
-        )
+        (
+            all_results,
+            id_to_name,
+            title_info,
+            new_titles,
+            word_groups,
+            filter_words,
+            global_filters,
+            group_assignments,
+        ) = analysis_data
 
         # 运行分析流水线
         _, html_file = self._run_analysis_pipeline(
@@ -488,6 +592,8 @@ class NewsAnalyzer:
             id_to_name,
             is_daily_summary=True,
             global_filters=global_filters,
+            group_assignments=group_assignments,
+            stats_source="history",
         )
 
         if html_file:
@@ -530,9 +636,14 @@ class NewsAnalyzer:
         print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
         Path("output").mkdir(parents=True, exist_ok=True)
 
-        results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            ids, self.request_interval
-        )
+        with span("crawl", platforms=len(ids)) as crawl_span:
+            results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
+                ids, self.request_interval
+            )
+            crawl_span.set(
+                items=sum(len(titles) for titles in results.values()),
+                failed=len(failed_ids),
+            )
 
         # 转换为 NewsData 格式并保存到存储后端
         crawl_time = self.ctx.format_time()
@@ -542,7 +653,10 @@ class NewsAnalyzer:
         )
 
         # 保存到存储后端（SQLite）
-        if self.storage_manager.save_news_data(news_data):
+        with span("storage.save", backend=self.storage_manager.backend_name) as save_span:
+            saved = self.storage_manager.save_news_data(news_data)
+            save_span.set(items=news_data.get_total_count(), success=bool(saved))
+        if saved:
             print(f"数据已保存到存储后端: {self.storage_manager.backend_name}")
 
         # 保存 TXT 快照（如果启用）
@@ -564,11 +678,10 @@ class NewsAnalyzer:
         # 获取当前监控平台ID列表
         current_platform_ids = self.ctx.platform_ids
 
-        new_titles = self.ctx.detect_new_titles(current_platform_ids)
+        # TXT 标题已在 _crawl_data 中保存；以下数据均在本次运行内缓存，汇总阶段直接复用
+        new_titles = self._detect_new_titles(current_platform_ids)
         time_info = self.ctx.format_time()
-        if self.ctx.config["STORAGE"]["FORMATS"]["TXT"]:
-            self.ctx.save_titles(results, id_to_name, failed_ids)
-        word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
+        word_groups, filter_words, global_filters = self._load_frequency_words()
 
         # current模式下，实时推送需要使用完整的历史数据来保证统计信息的完整性
         if self.report_mode == "current":
@@ -583,6 +696,7 @@ class NewsAnalyzer:
                     _,
                     _,
                     _,
+                    group_assignments,
                 ) = analysis_data
 
                 print(
@@ -599,6 +713,8 @@ class NewsAnalyzer:
                     historical_id_to_name,
                     failed_ids=failed_ids,
                     global_filters=global_filters,
+                    group_assignments=group_assignments,
+                    stats_source="history",
                 )
 
                 combined_id_to_name = {**historical_id_to_name, **id_to_name}
@@ -633,6 +749,7 @@ class NewsAnalyzer:
                 id_to_name,
                 failed_ids=failed_ids,
                 global_filters=global_filters,
+                stats_source="crawl",
             )
             if html_file:
                 print(f"HTML报告已生成: {html_file}")
@@ -682,6 +799,7 @@ class NewsAnalyzer:
 
     def run(self) -> None:
         """执行分析流程"""
+        success = False
         try:
             self._initialize_and_check_config()
 
@@ -690,13 +808,39 @@ class NewsAnalyzer:
             results, id_to_name, failed_ids = self._crawl_data()
 
             self._execute_mode_strategy(mode_strategy, results, id_to_name, failed_ids)
+            success = True
 
         except Exception as e:
             print(f"分析流程执行出错: {e}")
             raise
         finally:
             # 清理资源（包括过期数据清理和数据库连接关闭）
-            self.ctx.cleanup()
+            with span("cleanup"):
+                self.ctx.cleanup()
+            self._finish_trace(success)
+
+    def _finish_trace(self, success: bool) -> None:
+        """结束本次运行的追踪：写出 span 树 JSON、打印一行摘要，并按配置导出指标"""
+        tracer = end_trace()
+        if tracer is None:
+            return
+        try:
+            trace_file = self.ctx.get_output_path(
+                "trace", f"{self.ctx.get_time().strftime('%H-%M-%S')}.json"
+            )
+            tracer.write_json(trace_file)
+            print(f"[追踪] {tracer.summary()}")
+            print(f"[追踪] 详细记录: {trace_file}")
+        except Exception as e:
+            print(f"[追踪] 写入追踪记录失败: {e}")
+
+        metrics_file = self.ctx.config.get("METRICS_TEXTFILE", "")
+        if metrics_file:
+            try:
+                write_metrics_textfile(metrics_file, tracer, success)
+                print(f"[指标] 已写入: {metrics_file}")
+            except Exception as e:
+                print(f"[指标] 写入指标文件失败: {e}")
 
 
 def main():
@@ -24,18 +24,21 @@ from trendradar.core import (
     detect_latest_new_titles,
     is_first_crawl_today,
     count_word_frequency,
+    read_today_titles_incremental,
 )
 from trendradar.report import (
     clean_title,
     prepare_report_data,
     generate_html_report,
     render_html_content,
+    render_html_chunks,
 )
 from trendradar.notification import (
     render_feishu_content,
     render_dingtalk_content,
     split_content_into_batches,
     NotificationDispatcher,
+    TitleFragmentCache,
     PushRecordManager,
 )
 from trendradar.storage import get_storage_manager
@@ -144,12 +147,19 @@ class AppContext:
                     "secret_access_key": remote_config.get("SECRET_ACCESS_KEY", ""),
                     "endpoint_url": remote_config.get("ENDPOINT_URL", ""),
                     "region": remote_config.get("REGION", ""),
+                    "compact_segments": remote_config.get("COMPACT_SEGMENTS", 8),
+                    "compression": remote_config.get("COMPRESSION", "gzip"),
+                    "pull_workers": pull_config.get("MAX_WORKERS", 4),
+                    "cache_dir": remote_config.get("CACHE_DIR", ""),
+                    "cache_max_mb": remote_config.get("CACHE_MAX_MB", 512),
                 },
                 local_retention_days=local_config.get("RETENTION_DAYS", 0),
                 remote_retention_days=remote_config.get("RETENTION_DAYS", 0),
                 pull_enabled=pull_config.get("ENABLED", False),
                 pull_days=pull_config.get("DAYS", 7),
                 timezone=self.timezone,
+                max_read_connections=local_config.get("MAX_READ_CONNECTIONS", 8),
+                idle_timeout=local_config.get("IDLE_TIMEOUT", 300),
             )
         return self._storage_manager
 
@@ -172,6 +182,25 @@ class AppContext:
         """读取当天所有标题"""
         return read_all_today_titles(self.get_storage_manager(), platform_ids)
 
+    def read_today_titles_incremental(
+        self,
+        platform_ids: Optional[List[str]],
+        word_groups: List[Dict],
+        filter_words: List[str],
+        global_filters: Optional[List[str]] = None,
+    ) -> Tuple[Dict, Dict, Dict, Dict]:
+        """通过增量统计状态读取当天所有标题及其词组归属"""
+        data_dir = self.config.get("STORAGE", {}).get("LOCAL", {}).get("DATA_DIR", "output")
+        return read_today_titles_incremental(
+            self.get_storage_manager(),
+            str(Path(data_dir) / ".analysis"),
+            self.format_date(),
+            platform_ids,
+            word_groups,
+            filter_words,
+            global_filters,
+        )
+
     def detect_new_titles(
         self, platform_ids: Optional[List[str]] = None
     ) -> Dict:
@@ -212,6 +241,7 @@ class AppContext:
         new_titles: Optional[Dict] = None,
         mode: str = "daily",
         global_filters: Optional[List[str]] = None,
+        precomputed_groups: Optional[Dict] = None,
     ) -> Tuple[List[Dict], int]:
         """统计词频"""
         return count_word_frequency(
@@ -229,6 +259,9 @@ class AppContext:
             sort_by_position_first=self.config.get("SORT_BY_POSITION_FIRST", False),
             is_first_crawl_func=self.is_first_crawl,
             convert_time_func=self.convert_time_display,
+            precomputed_groups=precomputed_groups,
+            workers=self.config.get("ANALYSIS_WORKERS", 1),
+            parallel_threshold=self.config.get("ANALYSIS_PARALLEL_THRESHOLD", 20000),
         )
 
     # === 报告生成 ===
@@ -278,10 +311,11 @@ class AppContext:
             output_dir="output",
             date_folder=self.format_date(),
             time_filename=self.format_time(),
-            render_html_func=lambda *args, **kwargs: self.render_html(*args, **kwargs),
+            render_html_func=lambda *args, **kwargs: self.render_html_chunks(*args, **kwargs),
             matches_word_groups_func=self.matches_word_groups,
             load_frequency_words_func=self.load_frequency_words,
             enable_index_copy=True,
+            precompress=self.config["STORAGE"]["FORMATS"].get("HTML_GZIP", False),
         )
 
     def render_html(
@@ -303,6 +337,25 @@ class AppContext:
             get_time_func=self.get_time,
         )
 
+    def render_html_chunks(
+        self,
+        report_data: Dict,
+        total_titles: int,
+        is_daily_summary: bool = False,
+        mode: str = "daily",
+        update_info: Optional[Dict] = None,
+    ) -> List[str]:
+        """渲染HTML内容，返回片段列表（供流式写入文件）"""
+        return render_html_chunks(
+            report_data=report_data,
+            total_titles=total_titles,
+            is_daily_summary=is_daily_summary,
+            mode=mode,
+            update_info=update_info,
+            reverse_content_order=self.config.get("REVERSE_CONTENT_ORDER", False),
+            get_time_func=self.get_time,
+        )
+
     # === 通知内容渲染 ===
 
     def render_feishu(
@@ -343,6 +396,7 @@ class AppContext:
         update_info: Optional[Dict] = None,
         max_bytes: Optional[int] = None,
         mode: str = "daily",
+        fragment_cache: Optional[TitleFragmentCache] = None,
     ) -> List[str]:
         """分批处理消息内容"""
         return split_content_into_batches(
@@ -359,6 +413,7 @@ class AppContext:
             feishu_separator=self.config.get("FEISHU_MESSAGE_SEPARATOR", "---"),
             reverse_content_order=self.config.get("REVERSE_CONTENT_ORDER", False),
             get_time_func=self.get_time,
+            fragment_cache=fragment_cache,
         )
 
     # === 通知发送 ===
@@ -10,7 +10,12 @@ from trendradar.core.config import (
     get_account_at_index,
 )
 from trendradar.core.loader import load_config
-from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.core.frequency import (
+    WordGroupMatcher,
+    get_word_matcher,
+    load_frequency_words,
+    matches_word_groups,
+)
 from trendradar.core.data import (
     save_titles_to_file,
     read_all_today_titles_from_storage,
@@ -23,6 +28,11 @@ from trendradar.core.analyzer import (
     calculate_news_weight,
     format_time_display,
     count_word_frequency,
+    resolve_word_groups,
+)
+from trendradar.core.incremental import (
+    DailyAnalysisState,
+    read_today_titles_incremental,
 )
 
 __all__ = [
@@ -33,6 +43,8 @@ __all__ = [
     "load_config",
     "load_frequency_words",
     "matches_word_groups",
+    "WordGroupMatcher",
+    "get_word_matcher",
     # 数据处理
     "save_titles_to_file",
     "read_all_today_titles_from_storage",
@@ -44,4 +56,8 @@ __all__ = [
     "calculate_news_weight",
     "format_time_display",
     "count_word_frequency",
+    "resolve_word_groups",
+    # 增量统计
+    "DailyAnalysisState",
+    "read_today_titles_incremental",
 ]
@@ -6,11 +6,30 @@
 - calculate_news_weight: 计算新闻权重
 - format_time_display: 格式化时间显示
 - count_word_frequency: 统计词频
+
+安装 NumPy 时，较大词组的权重计算和排序会走向量化路径，结果与纯 Python 路径完全一致。
+配置 workers > 1 时，大量标题的词组匹配分片到多个进程，统计结果与单进程完全一致。
 """
 
+import heapq
+from itertools import chain
 from typing import Dict, List, Tuple, Optional, Callable
 
-from trendradar.core.frequency import matches_word_groups
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+from trendradar.core.frequency import first_groups_parallel, get_word_matcher
+
+
+# 词组标题数达到该值时才使用 NumPy（数量少时数组构造开销大于收益）
+NUMPY_MIN_TITLES = 256
+
+# 待匹配标题数达到该值时才启用多进程（进程启动和编译匹配器的开销较大）
+PARALLEL_MIN_TITLES = 20000
 
 
 def calculate_news_weight(
@@ -60,6 +79,166 @@ def calculate_news_weight(
     return total_weight
 
 
+def _title_sort_key(title_data: Dict, rank_threshold: int, weight_config: Dict) -> Tuple:
+    """标题排序键：权重降序，其次最高排名升序，再次出现次数降序"""
+    return (
+        -calculate_news_weight(title_data, rank_threshold, weight_config),
+        min(title_data["ranks"]) if title_data["ranks"] else 999,
+        -title_data["count"],
+    )
+
+
+def _numpy_sort_order(
+    titles: List[Dict],
+    rank_threshold: int,
+    weight_config: Dict,
+    max_count: int = 0,
+) -> List[int]:
+    """
+    用 NumPy 一次性计算所有标题的权重并排序（运算顺序与 calculate_news_weight 相同，结果逐位一致）
+
+    Returns:
+        排序后的标题下标（max_count > 0 时只返回前 max_count 个）
+    """
+    rank_lists = [title_data.get("ranks", []) for title_data in titles]
+    lengths = np.fromiter(map(len, rank_lists), dtype=np.int64, count=len(titles))
+    flat_ranks = np.fromiter(
+        chain.from_iterable(rank_lists), dtype=np.int64, count=int(lengths.sum())
+    )
+    counts = np.fromiter(
+        (title_data.get("count", len(ranks)) for title_data, ranks in zip(titles, rank_lists)),
+        dtype=np.int64,
+        count=len(titles),
+    )
+
+    has_ranks = lengths > 0
+    safe_lengths = np.where(has_ranks, lengths, 1)
+    score_sums = np.zeros(len(titles), dtype=np.int64)
+    high_counts = np.zeros(len(titles), dtype=np.int64)
+    min_ranks = np.full(len(titles), 999, dtype=np.int64)
+
+    if len(flat_ranks):
+        # 只对有排名的行做分段归约（各段起点严格递增）
+        offsets = (np.cumsum(lengths) - lengths)[has_ranks]
+        score_sums[has_ranks] = np.add.reduceat(11 - np.minimum(flat_ranks, 10), offsets)
+        high_counts[has_ranks] = np.add.reduceat(
+            (flat_ranks <= rank_threshold).astype(np.int64), offsets
+        )
+        min_ranks[has_ranks] = np.minimum.reduceat(flat_ranks, offsets)
+
+    rank_weight = score_sums / safe_lengths
+    frequency_weight = np.minimum(counts, 10) * 10
+    hotness_weight = high_counts / safe_lengths * 100
+    weights = (
+        rank_weight * weight_config["RANK_WEIGHT"]
+        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
+        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
+    )
+    weights = np.where(has_ranks, weights, 0.0)
+
+    candidates = np.arange(len(titles))
+    if 0 < max_count < len(titles):
+        # 先按权重选出候选（包含与第 max_count 名权重相同的全部标题），再精确排序
+        threshold = np.partition(-weights, max_count - 1)[max_count - 1]
+        candidates = np.flatnonzero(-weights <= threshold)
+
+    # lexsort 以最后一个键为主键，且为稳定排序（与 sorted 的稳定性一致）
+    order = np.lexsort((-counts[candidates], min_ranks[candidates], -weights[candidates]))
+    order = candidates[order]
+    if max_count > 0:
+        order = order[:max_count]
+    return order.tolist()
+
+
+def sort_titles_by_weight(
+    titles: List[Dict],
+    rank_threshold: int,
+    weight_config: Dict,
+    max_count: int = 0,
+) -> List[Dict]:
+    """
+    按权重对标题排序，并截取前 max_count 条
+
+    等价于 sorted(titles, key=权重排序键)[:max_count]。设置了 max_count 时使用 top-k 选择，
+    标题较多且安装了 NumPy 时使用向量化计算。
+
+    Args:
+        titles: 标题数据列表（包含 ranks、count）
+        rank_threshold: 排名阈值
+        weight_config: 权重配置
+        max_count: 最多保留条数（0 = 不限制）
+
+    Returns:
+        排序后的标题列表
+    """
+    if HAS_NUMPY and len(titles) >= NUMPY_MIN_TITLES:
+        return [titles[i] for i in _numpy_sort_order(titles, rank_threshold, weight_config, max_count)]
+
+    key = lambda x: _title_sort_key(x, rank_threshold, weight_config)
+    if 0 < max_count < len(titles):
+        # heapq.nsmallest 与 sorted(...)[:n] 结果一致（同样稳定）
+        return heapq.nsmallest(max_count, titles, key=key)
+    return sorted(titles, key=key)
+
+
+# 未配置词组时使用的虚拟词组（匹配所有新闻）
+_ALL_NEWS_GROUPS = [{"required": [], "normal": [], "group_key": "全部新闻"}]
+
+
+def resolve_word_groups(
+    word_groups: List[Dict], filter_words: List[str]
+) -> Tuple[List[Dict], List[str]]:
+    """
+    获取统计实际使用的词组和过滤词
+
+    未配置词组时使用"全部新闻"虚拟词组，并清空过滤词（显示所有新闻）。
+
+    Returns:
+        (词组列表, 过滤词列表)
+    """
+    if not word_groups:
+        return _ALL_NEWS_GROUPS, []
+    return word_groups, filter_words
+
+
+def _match_titles_parallel(
+    results: Dict,
+    precomputed_groups: Optional[Dict[str, Dict[str, Optional[int]]]],
+    word_groups: List[Dict],
+    filter_words: List[str],
+    global_filters: Optional[List[str]],
+    workers: int,
+    threshold: int,
+) -> Optional[Dict[str, Optional[int]]]:
+    """
+    多进程匹配尚无词组归属的标题
+
+    Returns:
+        {title: 词组下标或 None}；标题数低于阈值或进程池不可用时返回 None（调用方单进程匹配）
+    """
+    pending: Dict[str, None] = {}
+    for source_id, titles_data in results.items():
+        source_groups = precomputed_groups.get(source_id) if precomputed_groups else None
+        for title in titles_data:
+            if source_groups is None or title not in source_groups:
+                pending[title] = None
+
+    if len(pending) < max(threshold, 1):
+        return None
+
+    titles = list(pending)
+    try:
+        groups = first_groups_parallel(
+            titles, word_groups, filter_words, global_filters, workers
+        )
+    except Exception as e:
+        print(f"多进程词组匹配失败，改为单进程: {e}")
+        return None
+
+    print(f"多进程词组匹配：{len(titles)} 个标题，{workers} 个进程")
+    return dict(zip(titles, groups))
+
+
 def format_time_display(
     first_time: str,
     last_time: str,
@@ -102,6 +281,9 @@ def count_word_frequency(
     sort_by_position_first: bool = False,
     is_first_crawl_func: Optional[Callable[[], bool]] = None,
     convert_time_func: Optional[Callable[[str], str]] = None,
+    precomputed_groups: Optional[Dict[str, Dict[str, Optional[int]]]] = None,
+    workers: int = 1,
+    parallel_threshold: int = PARALLEL_MIN_TITLES,
 ) -> Tuple[List[Dict], int]:
     """
     统计词频，支持必须词、频率词、过滤词、全局过滤词，并标记新增标题
@@ -121,6 +303,10 @@ def count_word_frequency(
         sort_by_position_first: 是否优先按配置位置排序
         is_first_crawl_func: 检测是否是当天第一次爬取的函数
         convert_time_func: 时间格式转换函数
+        precomputed_groups: 已知的词组归属 {source_id: {title: 词组下标或 None}}（可选，
+            须基于同一份词组配置，见 resolve_word_groups），命中的标题不再运行匹配器
+        workers: 词组匹配的进程数（>1 时启用多进程）
+        parallel_threshold: 待匹配的标题数达到该值才使用多进程，否则单进程匹配
 
     Returns:
         Tuple[List[Dict], int]: (统计结果列表, 总标题数)
@@ -144,8 +330,11 @@ def count_word_frequency(
     # 如果没有配置词组，创建一个包含所有新闻的虚拟词组
     if not word_groups:
         print("频率词配置为空，将显示所有新闻")
-        word_groups = [{"required": [], "normal": [], "group_key": "全部新闻"}]
-        filter_words = []  # 清空过滤词，显示所有新闻
+    word_groups, filter_words = resolve_word_groups(word_groups, filter_words)
+
+    # 编译匹配器（同一份词组配置只编译一次），每个标题只需扫描一次
+    matcher = get_word_matcher(word_groups, filter_words, global_filters)
+    show_all_news = len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
 
     is_first_today = is_first_crawl_func()
 
@@ -197,16 +386,11 @@ def count_word_frequency(
         results_to_process = results
         all_news_are_new = False
         total_input_news = sum(len(titles) for titles in results.values())
-        filter_status = (
-            "全部显示"
-            if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-            else "频率词过滤"
-        )
+        filter_status = "全部显示" if show_all_news else "频率词过滤"
         print(f"当日汇总模式：处理 {total_input_news} 条新闻，模式：{filter_status}")
 
     word_stats = {}
     total_titles = 0
-    processed_titles = {}
     matched_new_count = 0
 
     if title_info is None:
@@ -214,169 +398,118 @@ def count_word_frequency(
     if new_titles is None:
         new_titles = {}
 
+    # 匹配的新增新闻是否计数（增量模式，或 current 模式当天第一次）
+    count_matched_new = (mode == "incremental" and all_news_are_new) or (
+        mode == "current" and is_first_today
+    )
+
     for group in word_groups:
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    # 大规模词组配置下，标题匹配分片到多个进程，结果按标题合并后统计顺序不变
+    parallel_groups = None
+    if workers > 1:
+        parallel_groups = _match_titles_parallel(
+            results_to_process,
+            precomputed_groups,
+            word_groups,
+            filter_words,
+            global_filters,
+            workers,
+            parallel_threshold,
+        )
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
-        if source_id not in processed_titles:
-            processed_titles[source_id] = {}
+        source_info = title_info.get(source_id, {})
+        source_groups = precomputed_groups.get(source_id) if precomputed_groups else None
+        source_new_titles = new_titles.get(source_id)
+        source_name = id_to_name.get(source_id, source_id)
 
         for title, title_data in titles_data.items():
-            if title in processed_titles.get(source_id, {}):
-                continue
-
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words, global_filters
-            )
-
-            if not matches_frequency_words:
+            # 一次扫描同时完成过滤和词组定位（"全部新闻"虚拟词组匹配所有标题）
+            if source_groups is not None and title in source_groups:
+                group_index = source_groups[title]
+            elif parallel_groups is not None:
+                group_index = parallel_groups[title]
+            else:
+                group_index = matcher.first_group(title)
+            if group_index is None:
                 continue
 
-            # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
-            if (mode == "incremental" and all_news_are_new) or (
-                mode == "current" and is_first_today
-            ):
+            if count_matched_new:
                 matched_new_count += 1
 
+            group_key = word_groups[group_index]["group_key"]
+            group_stats = word_stats[group_key]
+            group_stats["count"] += 1
+
             source_ranks = title_data.get("ranks", [])
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time, convert_time_func)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
-
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
-
-                break
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
+
+            # 有历史统计信息时使用完整数据（current 模式同样如此）
+            info = source_info.get(title)
+            if info is not None:
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time, convert_time_func)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif source_new_titles:
+                # 检查是否在新增列表中
+                is_new = title in source_new_titles
+
+            group_stats["titles"].setdefault(source_id, []).append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": time_display,
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                }
+            )
 
     # 最后统一打印汇总信息
     if mode == "incremental":
         if is_first_today:
             total_input_news = sum(len(titles) for titles in results.values())
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            filter_status = "全部显示" if show_all_news else "频率词匹配"
             print(
                 f"增量模式：当天第一次爬取，{total_input_news} 条新闻中有 {matched_new_count} 条{filter_status}"
             )
         else:
             if new_titles:
                 total_new_count = sum(len(titles) for titles in new_titles.values())
-                filter_status = (
-                    "全部显示"
-                    if len(word_groups) == 1
-                    and word_groups[0]["group_key"] == "全部新闻"
-                    else "匹配频率词"
-                )
+                filter_status = "全部显示" if show_all_news else "匹配频率词"
                 print(
                     f"增量模式：{total_new_count} 条新增新闻中，有 {matched_new_count} 条{filter_status}"
                 )
@@ -387,21 +520,13 @@ def count_word_frequency(
     elif mode == "current":
         total_input_news = sum(len(titles) for titles in results_to_process.values())
         if is_first_today:
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            filter_status = "全部显示" if show_all_news else "频率词匹配"
             print(
                 f"当前榜单模式：当天第一次爬取，{total_input_news} 条当前榜单新闻中有 {matched_new_count} 条{filter_status}"
             )
         else:
             matched_count = sum(stat["count"] for stat in word_stats.values())
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            filter_status = "全部显示" if show_all_news else "频率词匹配"
             print(
                 f"当前榜单模式：{total_input_news} 条当前榜单新闻中有 {matched_count} 条{filter_status}"
             )
@@ -420,24 +545,16 @@ def count_word_frequency(
         for source_id, title_list in data["titles"].items():
             all_titles.extend(title_list)
 
-        # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold, weight_config),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
-
         # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
         group_max_count = group_key_to_max_count.get(group_key, 0)
         if group_max_count == 0:
             # 使用全局配置
             group_max_count = max_news_per_keyword
 
-        if group_max_count > 0:
-            sorted_titles = sorted_titles[:group_max_count]
+        # 按权重排序（设置了最大数量时只选出前 N 条）
+        sorted_titles = sort_titles_by_weight(
+            all_titles, rank_threshold, weight_config, group_max_count
+        )
 
         stats.append(
             {
@@ -13,6 +13,9 @@ Author: TrendRadar Team
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Callable
 
+from trendradar.storage.base import compute_title_hash
+from trendradar.storage.titles import TitleTable
+
 
 def save_titles_to_file(
     results: Dict,
@@ -96,53 +99,37 @@ def read_all_today_titles_from_storage(
 
     Returns:
         Tuple[Dict, Dict, Dict]: (all_results, id_to_name, title_info)
+        其中 all_results 和 title_info 为同一张标题表的只读映射视图
     """
     try:
-        news_data = storage_manager.get_today_all_data()
-
-        if not news_data or not news_data.items:
-            return {}, {}, {}
-
-        all_results = {}
+        # 单张标题表 + 两个只读视图，避免 all_results/title_info 各存一份；
+        # 条目直接从存储游标逐条读取，不构建完整的 NewsData
+        table = TitleTable()
         final_id_to_name = {}
-        title_info = {}
 
-        for source_id, news_list in news_data.items.items():
-            # 按平台过滤
-            if current_platform_ids is not None and source_id not in current_platform_ids:
-                continue
+        for item in storage_manager.iter_items(platforms=current_platform_ids):
+            source_id = item.source_id
 
             # 获取来源名称
-            source_name = news_data.id_to_name.get(source_id, source_id)
-            final_id_to_name[source_id] = source_name
+            if source_id not in final_id_to_name:
+                final_id_to_name[source_id] = item.source_name or source_id
+                table.add_source(source_id)
+
+            table.add(
+                source_id,
+                item.title,
+                item.ranks or [item.rank],
+                url=item.url,
+                mobile_url=item.mobile_url,
+                first_time=item.first_time or item.crawl_time,
+                last_time=item.last_time or item.crawl_time,
+                count=item.count,
+            )
+
+        if not final_id_to_name:
+            return {}, {}, {}
 
-            if source_id not in all_results:
-                all_results[source_id] = {}
-                title_info[source_id] = {}
-
-            for item in news_list:
-                title = item.title
-                ranks = getattr(item, 'ranks', [item.rank])
-                first_time = getattr(item, 'first_time', item.crawl_time)
-                last_time = getattr(item, 'last_time', item.crawl_time)
-                count = getattr(item, 'count', 1)
-
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
-                }
-
-                title_info[source_id][title] = {
-                    "first_time": first_time,
-                    "last_time": last_time,
-                    "count": count,
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
-                }
-
-        return all_results, final_id_to_name, title_info
+        return table.results_view(), final_id_to_name, table.title_info_view()
 
     except Exception as e:
         print(f"[存储] 从存储后端读取数据失败: {e}")
@@ -196,26 +183,16 @@ def detect_latest_new_titles_from_storage(
         if not latest_data or not latest_data.items:
             return {}
 
-        # 获取所有历史数据
-        all_data = storage_manager.get_today_all_data()
-        if not all_data or not all_data.items:
-            # 没有历史数据（第一次抓取），不应该有"新增"标题
-            return {}
-
-        # 收集历史标题（不包括最新批次的时间）
+        # 收集历史标题哈希（不包括最新批次的时间），逐条读取当天数据
         latest_time = latest_data.crawl_time
         historical_titles = {}
 
-        for source_id, news_list in all_data.items.items():
-            if current_platform_ids is not None and source_id not in current_platform_ids:
-                continue
-
-            historical_titles[source_id] = set()
-            for item in news_list:
-                # 只统计非最新批次的标题
-                first_time = getattr(item, 'first_time', item.crawl_time)
-                if first_time != latest_time:
-                    historical_titles[source_id].add(item.title)
+        for item in storage_manager.iter_items(platforms=current_platform_ids):
+            source_titles = historical_titles.setdefault(item.source_id, set())
+            # 只统计非最新批次的标题
+            first_time = item.first_time or item.crawl_time
+            if first_time != latest_time:
+                source_titles.add(compute_title_hash(item.source_id, item.title))
 
         # 检查是否是当天第一次抓取（没有任何历史标题）
         # 如果所有平台的历史标题集合都为空，说明只有一个抓取批次，不应该有"新增"标题
@@ -233,7 +210,7 @@ def detect_latest_new_titles_from_storage(
             source_new_titles = {}
 
             for item in news_list:
-                if item.title not in historical_set:
+                if compute_title_hash(source_id, item.title) not in historical_set:
                     source_new_titles[item.title] = {
                         "ranks": [item.rank],
                         "url": item.url or "",
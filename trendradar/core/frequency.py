@@ -8,13 +8,309 @@
 - 过滤词（!前缀）
 - 全局过滤词（[GLOBAL_FILTER] 区域）
 - 最大显示数量（@前缀）
+
+加载时把所有普通词、必须词、过滤词、全局过滤词编译为一个多模式匹配自动机
+（Aho–Corasick），每个标题只需扫描一次即可得到所有匹配的词组。
+解析和编译结果按文件路径、修改时间、大小缓存在进程内，文件变化后自动重新加载。
 """
 
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
 
+class _AhoCorasick:
+    """
+    多模式子串匹配自动机（Aho–Corasick）
+
+    扫描一次文本即可找出所有出现的模式，结果与逐个 `pattern in text` 判断一致。
+    """
+
+    def __init__(self, patterns: List[str]):
+        # 每个节点：转移表、失败指针、输出（模式编号）
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        outputs: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = next_node
+            outputs[node].append(pattern_id)
+
+        # 按层（BFS）计算失败指针，并把失败链上的输出合并到当前节点
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_target = self._goto[fail].get(char, 0)
+                self._fail[child] = fail_target if fail_target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+
+        self._output = [tuple(sorted(set(ids))) for ids in outputs]
+
+    def find(self, text: str) -> set:
+        """返回文本中出现的所有模式编号"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return found
+
+
+class WordGroupMatcher:
+    """
+    编译后的频率词匹配器
+
+    匹配语义与逐词判断完全一致（均为忽略大小写的子串匹配）：
+    - 命中全局过滤词：不匹配
+    - 未配置词组：匹配所有标题
+    - 命中词组内过滤词：不匹配
+    - 词组匹配：必须词全部出现，且普通词至少出现一个（没有普通词时只看必须词）
+    """
+
+    def __init__(
+        self,
+        word_groups: List[Dict],
+        filter_words: List[str],
+        global_filters: Optional[List[str]] = None,
+    ):
+        self.group_count = len(word_groups)
+
+        pattern_ids: Dict[str, int] = {}
+
+        def pattern_id(word: str) -> int:
+            word = word.lower()
+            if word not in pattern_ids:
+                pattern_ids[word] = len(pattern_ids)
+            return pattern_ids[word]
+
+        self._global_ids = frozenset(pattern_id(w) for w in (global_filters or []))
+        self._filter_ids = frozenset(pattern_id(w) for w in filter_words)
+
+        # 模式 -> 引用它的词组（普通词 / 必须词）
+        self._normal_groups: Dict[int, List[int]] = {}
+        self._required_groups: Dict[int, List[int]] = {}
+        self._required_counts: List[int] = []
+        self._has_normal: List[bool] = []
+        # 既无普通词也无必须词的词组（如"全部新闻"虚拟词组）匹配所有标题
+        self._always_groups: List[int] = []
+
+        for index, group in enumerate(word_groups):
+            required = {pattern_id(w) for w in group["required"]}
+            normal = {pattern_id(w) for w in group["normal"]}
+            for pid in required:
+                self._required_groups.setdefault(pid, []).append(index)
+            for pid in normal:
+                self._normal_groups.setdefault(pid, []).append(index)
+            self._required_counts.append(len(required))
+            self._has_normal.append(bool(normal))
+            if not required and not normal:
+                self._always_groups.append(index)
+
+        patterns = [None] * len(pattern_ids)
+        for word, pid in pattern_ids.items():
+            patterns[pid] = word
+        # 空词在任何标题中都"出现"（与 `"" in title` 一致），不进入自动机
+        self._empty_ids = frozenset(pid for pid, word in enumerate(patterns) if not word)
+        self._automaton = _AhoCorasick([word for word in patterns])
+
+    def _found_patterns(self, title) -> Optional[set]:
+        """扫描标题，返回出现的模式编号；标题无效或命中全局过滤词时返回 None"""
+        # 防御性类型检查：确保 title 是有效字符串
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return None
+
+        found = self._automaton.find(title.lower())
+        if self._empty_ids:
+            found |= self._empty_ids
+
+        # 全局过滤检查（优先级最高）
+        if not self._global_ids.isdisjoint(found):
+            return None
+        return found
+
+    def match_groups(self, title) -> List[int]:
+        """
+        返回标题匹配的所有词组下标（按配置顺序）
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            匹配的词组下标列表；被过滤或不匹配时为空列表
+        """
+        found = self._found_patterns(title)
+        if found is None or not self.group_count:
+            return []
+        if not self._filter_ids.isdisjoint(found):
+            return []
+
+        required_hits: Dict[int, int] = {}
+        normal_hit = set()
+        for pid in found:
+            for index in self._required_groups.get(pid, ()):
+                required_hits[index] = required_hits.get(index, 0) + 1
+            normal_hit.update(self._normal_groups.get(pid, ()))
+
+        candidates = set(self._always_groups)
+        candidates.update(required_hits)
+        candidates.update(normal_hit)
+
+        matched = []
+        for index in sorted(candidates):
+            if required_hits.get(index, 0) != self._required_counts[index]:
+                continue
+            if self._has_normal[index] and index not in normal_hit:
+                continue
+            matched.append(index)
+        return matched
+
+    def first_group(self, title) -> Optional[int]:
+        """返回标题匹配的第一个词组下标，不匹配时返回 None"""
+        matched = self.match_groups(title)
+        return matched[0] if matched else None
+
+    def matches(self, title) -> bool:
+        """检查标题是否匹配词组规则（语义同 matches_word_groups）"""
+        if not self.group_count:
+            return self._found_patterns(title) is not None
+        return bool(self.match_groups(title))
+
+
+# 已编译的匹配器缓存：按词组列表对象的身份索引，同一份配置只编译一次
+_MATCHER_CACHE: "OrderedDict[Tuple[int, int, int], Tuple]" = OrderedDict()
+_MATCHER_CACHE_SIZE = 8
+
+
+def get_word_matcher(
+    word_groups: List[Dict],
+    filter_words: List[str],
+    global_filters: Optional[List[str]] = None,
+) -> WordGroupMatcher:
+    """
+    获取词组配置对应的编译匹配器
+
+    以列表对象本身作为缓存键（同时校验长度），load_frequency_words 返回的
+    同一组列表反复匹配时不会重复编译。编译后不应再原地修改这些列表。
+
+    Args:
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词列表
+
+    Returns:
+        WordGroupMatcher 实例
+    """
+    key = (id(word_groups), id(filter_words), id(global_filters))
+    entry = _MATCHER_CACHE.get(key)
+    lengths = (len(word_groups), len(filter_words), len(global_filters or ()))
+    if (
+        entry is not None
+        and entry[0] is word_groups
+        and entry[1] is filter_words
+        and entry[2] is global_filters
+        and entry[3] == lengths
+    ):
+        _MATCHER_CACHE.move_to_end(key)
+        return entry[4]
+
+    matcher = WordGroupMatcher(word_groups, filter_words, global_filters)
+    # 持有列表引用，避免对象被回收后 id 被复用
+    _MATCHER_CACHE[key] = (word_groups, filter_words, global_filters, lengths, matcher)
+    while len(_MATCHER_CACHE) > _MATCHER_CACHE_SIZE:
+        _MATCHER_CACHE.popitem(last=False)
+    return matcher
+
+
+# 进程池工作进程内的匹配器（由 _init_match_worker 在每个工作进程中编译一次）
+_WORKER_MATCHER: Optional[WordGroupMatcher] = None
+
+
+def _init_match_worker(
+    word_groups: List[Dict],
+    filter_words: List[str],
+    global_filters: Optional[List[str]],
+) -> None:
+    global _WORKER_MATCHER
+    _WORKER_MATCHER = WordGroupMatcher(word_groups, filter_words, global_filters)
+
+
+def _match_chunk(titles: List[str]) -> List[Optional[int]]:
+    return [_WORKER_MATCHER.first_group(title) for title in titles]
+
+
+def first_groups_parallel(
+    titles: List[str],
+    word_groups: List[Dict],
+    filter_words: List[str],
+    global_filters: Optional[List[str]] = None,
+    workers: int = 2,
+) -> List[Optional[int]]:
+    """
+    多进程计算标题匹配的第一个词组下标
+
+    标题按顺序切分给工作进程，每个进程编译自己的匹配器，结果按输入顺序返回，
+    与逐条调用 first_group 完全一致。
+
+    Args:
+        titles: 标题列表
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词列表
+        workers: 工作进程数
+
+    Returns:
+        与 titles 一一对应的词组下标（不匹配时为 None）
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    # 每个进程分到多个分片，处理快的进程可以继续领取，减少长尾
+    chunk_count = max(1, min(len(titles), workers * 4))
+    chunk_size = -(-len(titles) // chunk_count)
+    chunks = [titles[i:i + chunk_size] for i in range(0, len(titles), chunk_size)]
+
+    results: List[Optional[int]] = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_match_worker,
+        initargs=(word_groups, filter_words, global_filters),
+    ) as executor:
+        for chunk_result in executor.map(_match_chunk, chunks):
+            results.extend(chunk_result)
+    return results
+
+
+# 频率词文件解析缓存：{文件绝对路径: ((mtime_ns, size), 解析结果)}
+_FREQUENCY_CACHE: Dict[str, Tuple[Tuple[int, int], Tuple[List[Dict], List[str], List[str]]]] = {}
+_FREQUENCY_CACHE_LOCK = threading.Lock()
+
+
 def load_frequency_words(
     frequency_file: Optional[str] = None,
 ) -> Tuple[List[Dict], List[str], List[str]]:
@@ -32,11 +328,14 @@ def load_frequency_words(
     - !词：过滤词，匹配则排除
     - @数字：该词组最多显示的条数
 
+    同一文件在修改时间和大小不变时直接返回缓存的解析结果（同一组列表对象），
+    调用方不应原地修改返回的列表。
+
     Args:
         frequency_file: 频率词配置文件路径，默认从环境变量 FREQUENCY_WORDS_PATH 获取或使用 config/frequency_words.txt
 
     Returns:
-        (词组列表, 词组内过滤词, 全局过滤词)
+        (词组列表, 词组内过滤词, 全局过滤词)，对应的编译匹配器已预先生成（见 get_word_matcher）
 
     Raises:
         FileNotFoundError: 频率词文件不存在
@@ -47,12 +346,33 @@ def load_frequency_words(
         )
 
     frequency_path = Path(frequency_file)
-    if not frequency_path.exists():
+    try:
+        stat = frequency_path.stat()
+    except OSError:
         raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
 
+    cache_key = os.path.abspath(frequency_file)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _FREQUENCY_CACHE_LOCK:
+        cached = _FREQUENCY_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
     with open(frequency_path, "r", encoding="utf-8") as f:
         content = f.read()
 
+    result = _parse_frequency_words(content)
+    # 预编译匹配器，后续匹配直接复用
+    get_word_matcher(*result)
+
+    with _FREQUENCY_CACHE_LOCK:
+        _FREQUENCY_CACHE[cache_key] = (signature, result)
+    return result
+
+
+def _parse_frequency_words(content: str) -> Tuple[List[Dict], List[str], List[str]]:
+    """解析频率词配置文件内容（语法见 load_frequency_words）"""
     word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
 
     processed_groups = []
@@ -136,7 +456,7 @@ def matches_word_groups(
     global_filters: Optional[List[str]] = None
 ) -> bool:
     """
-    检查标题是否匹配词组规则
+    检查标题是否匹配词组规则（使用编译后的匹配器）
 
     Args:
         title: 标题文本
@@ -147,48 +467,4 @@ def matches_word_groups(
     Returns:
         是否匹配
     """
-    # 防御性类型检查：确保 title 是有效字符串
-    if not isinstance(title, str):
-        title = str(title) if title is not None else ""
-    if not title.strip():
-        return False
-
-    title_lower = title.lower()
-
-    # 全局过滤检查（优先级最高）
-    if global_filters:
-        if any(global_word.lower() in title_lower for global_word in global_filters):
-            return False
-
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
-
-    # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
-
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
-
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
-                continue
-
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
-            )
-            if not any_normal_present:
-                continue
-
-        return True
-
-    return False
+    return get_word_matcher(word_groups, filter_words, global_filters).matches(title)
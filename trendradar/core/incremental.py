@@ -0,0 +1,305 @@
+# coding=utf-8
+"""
+增量关键词统计状态
+
+daily / current 汇总每次都要对当天全部标题统计词频，而两次抓取之间只有最新批次的条目发生变化。
+本模块把当天的标题表和词组归属持久化到 <data_dir>/.analysis/<YYYY-MM-DD>.json：
+
+- 每次只从存储读取上次状态之后变化的条目（iter_items(since=上次最新抓取时间)），
+  只对新出现的标题运行匹配器
+- 汇总直接由状态构建标题表和词组归属，无需重新读取和匹配整天的数据
+
+只保留当天的状态文件：写入新状态时删除其他日期的状态文件。
+
+以下情况自动全量重建，保证结果与全量统计一致：
+- 词组配置或监控平台变化
+- 存储中的抓取记录不是状态记录的延续（如数据被清理、重新拉取）
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from trendradar.core.analyzer import resolve_word_groups
+from trendradar.core.frequency import get_word_matcher
+from trendradar.storage.base import normalize_title
+from trendradar.storage.titles import TitleTable
+
+
+STATE_VERSION = 2
+
+_STATE_FILE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}\.json(\.tmp)?$")
+
+# 状态行字段：[序号, 标题, 词组下标(-1 = 不匹配), 排名列表, url, mobile_url, 首次时间, 最后时间, 出现次数]
+_SEQ, _TITLE, _GROUP, _RANKS, _URL, _MOBILE_URL, _FIRST, _LAST, _COUNT = range(9)
+
+
+def rules_fingerprint(
+    word_groups: List[Dict],
+    filter_words: List[str],
+    global_filters: Optional[List[str]] = None,
+) -> str:
+    """计算词组配置指纹（配置变化时状态失效）"""
+    payload = json.dumps(
+        [word_groups, filter_words, global_filters or []],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _row_key(url: str, title: str) -> str:
+    """与 news_items 的唯一键一致：有 URL 用 URL，无 URL 用规范化标题（同 compute_title_hash）"""
+    return url if url else "\x00" + normalize_title(title)
+
+
+class DailyAnalysisState:
+    """
+    当天的增量统计状态
+
+    每个 news_items 行对应一条状态行，序号记录读取顺序。增量读取的条目
+    （last_crawl_time >= 上次最新抓取时间）按存储顺序获得新的序号，而未变化的条目
+    最后出现时间都更早，因此按序号回放即与全量读取的顺序（平台 → 最后出现时间 → id）一致，
+    由状态构建的标题表与 read_all_today_titles 的结果完全相同。
+    """
+
+    def __init__(self, state_dir: str, date_folder: str):
+        """
+        初始化状态
+
+        Args:
+            state_dir: 状态目录
+            date_folder: 日期（YYYY-MM-DD）
+        """
+        self.path = Path(state_dir) / f"{date_folder}.json"
+        self._reset()
+
+    def _reset(self) -> None:
+        self.rules = ""
+        self.platforms: Optional[List[str]] = None
+        self.crawl_times: List[str] = []
+        self.names: Dict[str, str] = {}
+        self._rows: Dict[str, Dict[str, list]] = {}
+        self._seq = 0
+
+    # === 持久化 ===
+
+    def _load(self) -> bool:
+        """读取状态文件，不存在或损坏时返回 False"""
+        if not self.path.exists():
+            return False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != STATE_VERSION:
+            return False
+
+        self.rules = data.get("rules", "")
+        self.platforms = data.get("platforms")
+        self.crawl_times = data.get("crawl_times", [])
+        self.names = data.get("names", {})
+        self._rows = data.get("rows", {})
+        self._seq = data.get("seq", 0)
+        return True
+
+    def save(self) -> None:
+        """原子写入状态文件，并删除其他日期的状态文件"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": STATE_VERSION,
+            "rules": self.rules,
+            "platforms": self.platforms,
+            "crawl_times": self.crawl_times,
+            "names": self.names,
+            "seq": self._seq,
+            "rows": self._rows,
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        tmp_path.replace(self.path)
+        self._prune_other_days()
+
+    def _prune_other_days(self) -> None:
+        """删除其他日期的状态文件（只有当天的状态会被使用，旧文件各保存一整天的标题表）"""
+        for path in self.path.parent.iterdir():
+            if path == self.path or not _STATE_FILE_PATTERN.match(path.name):
+                continue
+            try:
+                path.unlink()
+            except OSError as e:
+                print(f"[增量统计] 删除过期状态文件失败: {path} ({e})")
+
+    # === 更新 ===
+
+    def refresh(
+        self,
+        storage_manager,
+        platform_ids: Optional[List[str]],
+        word_groups: List[Dict],
+        filter_words: List[str],
+        global_filters: Optional[List[str]] = None,
+    ) -> Tuple[bool, int]:
+        """
+        使状态与存储保持一致：能增量更新时只读取变化的条目，否则全量重建
+
+        Args:
+            storage_manager: 存储管理器
+            platform_ids: 当前监控的平台 ID 列表（None 表示全部）
+            word_groups: 词组列表
+            filter_words: 过滤词列表
+            global_filters: 全局过滤词列表
+
+        Returns:
+            (是否全量重建, 本次读取的条目数)
+        """
+        rules = rules_fingerprint(word_groups, filter_words, global_filters)
+        platforms = sorted(platform_ids) if platform_ids is not None else None
+        crawl_times = storage_manager.get_crawl_times()
+
+        # 状态只在抓取记录是上次记录的延续时有效（数据被清理、重新拉取或合并了更早的数据时重建）
+        incremental = (
+            self._load()
+            and self.rules == rules
+            and self.platforms == platforms
+            and bool(self.crawl_times)
+            and crawl_times[:len(self.crawl_times)] == self.crawl_times
+        )
+
+        since = None
+        if incremental:
+            since = self.crawl_times[-1]
+        else:
+            self._reset()
+
+        word_groups, filter_words = resolve_word_groups(word_groups, filter_words)
+        matcher = get_word_matcher(word_groups, filter_words, global_filters)
+        processed = self._apply_items(
+            storage_manager.iter_items(platforms=platform_ids, since=since),
+            matcher,
+        )
+
+        self.rules = rules
+        self.platforms = platforms
+        self.crawl_times = list(crawl_times)
+        return not incremental, processed
+
+    def _apply_items(self, items: Iterable, matcher) -> int:
+        """按存储的读取顺序应用条目，只对新标题运行匹配器"""
+        # 标题 → 词组下标（同一标题的归属只取决于标题本身）
+        known_groups: Dict[str, int] = {}
+        for rows in self._rows.values():
+            for row in rows.values():
+                known_groups[row[_TITLE]] = row[_GROUP]
+
+        processed = 0
+        for item in items:
+            processed += 1
+            source_id = item.source_id
+            title = item.title
+            url = item.url or ""
+            self.names[source_id] = item.source_name or source_id
+
+            group = known_groups.get(title)
+            if group is None:
+                group = matcher.first_group(title)
+                group = known_groups[title] = -1 if group is None else group
+
+            self._seq += 1
+            self._rows.setdefault(source_id, {})[_row_key(url, title)] = [
+                self._seq,
+                title,
+                group,
+                item.ranks or [item.rank],
+                url,
+                item.mobile_url or "",
+                item.first_time or item.crawl_time,
+                item.last_time or item.crawl_time,
+                item.count,
+            ]
+
+        return processed
+
+    # === 输出 ===
+
+    def build_titles(self) -> Tuple[Dict, Dict, Dict, Dict[str, Dict[str, Optional[int]]]]:
+        """
+        由状态构建汇总所需的数据
+
+        Returns:
+            (all_results, id_to_name, title_info, 词组归属)，前三项与 read_all_today_titles 一致，
+            词组归属可直接传给 count_word_frequency(precomputed_groups=...)
+        """
+        table = TitleTable()
+        id_to_name: Dict[str, str] = {}
+        groups: Dict[str, Dict[str, Optional[int]]] = {}
+
+        for source_id in sorted(self._rows):
+            rows = self._rows[source_id]
+            if not rows:
+                continue
+            id_to_name[source_id] = self.names.get(source_id, source_id)
+            table.add_source(source_id)
+            source_groups = groups[source_id] = {}
+
+            # 按读取顺序回放，同名条目的覆盖语义与全量读取一致
+            for row in sorted(rows.values(), key=lambda r: r[_SEQ]):
+                table.add(
+                    source_id,
+                    row[_TITLE],
+                    row[_RANKS],
+                    url=row[_URL],
+                    mobile_url=row[_MOBILE_URL],
+                    first_time=row[_FIRST],
+                    last_time=row[_LAST],
+                    count=row[_COUNT],
+                )
+                source_groups[row[_TITLE]] = row[_GROUP] if row[_GROUP] >= 0 else None
+
+        if not id_to_name:
+            return {}, {}, {}, {}
+        return table.results_view(), id_to_name, table.title_info_view(), groups
+
+
+def read_today_titles_incremental(
+    storage_manager,
+    state_dir: str,
+    date_folder: str,
+    platform_ids: Optional[List[str]],
+    word_groups: List[Dict],
+    filter_words: List[str],
+    global_filters: Optional[List[str]] = None,
+) -> Tuple[Dict, Dict, Dict, Dict[str, Dict[str, Optional[int]]]]:
+    """
+    通过增量状态读取当天所有标题及其词组归属
+
+    Args:
+        storage_manager: 存储管理器
+        state_dir: 状态目录
+        date_folder: 日期（YYYY-MM-DD）
+        platform_ids: 当前监控的平台 ID 列表
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词列表
+
+    Returns:
+        (all_results, id_to_name, title_info, 词组归属)
+    """
+    state = DailyAnalysisState(state_dir, date_folder)
+    rebuilt, processed = state.refresh(
+        storage_manager, platform_ids, word_groups, filter_words, global_filters
+    )
+    try:
+        state.save()
+    except OSError as e:
+        print(f"[增量统计] 保存状态失败: {e}")
+
+    all_results, id_to_name, title_info, groups = state.build_titles()
+    total_count = sum(len(titles) for titles in all_results.values())
+    action = "全量重建" if rebuilt else "增量更新"
+    print(f"[增量统计] {action}：处理 {processed} 条，当天共 {total_count} 条标题")
+    return all_results, id_to_name, title_info, groups
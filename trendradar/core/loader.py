@@ -22,8 +22,8 @@ def _get_env_bool(key: str, default: bool = False) -> Optional[bool]:
     return value in ("true", "1")
 
 
-def _get_env_int(key: str, default: int = 0) -> int:
-    """从环境变量获取整数值"""
+def _get_env_int(key: str, default: Optional[int] = 0) -> Optional[int]:
+    """从环境变量获取整数值（未设置或无法解析时返回 default）"""
     value = os.environ.get(key, "").strip()
     if not value:
         return default
@@ -45,6 +45,7 @@ def _load_app_config(config_data: Dict) -> Dict:
         "VERSION_CHECK_URL": app_config.get("version_check_url", ""),
         "SHOW_VERSION_UPDATE": app_config.get("show_version_update", True),
         "TIMEZONE": _get_env_str("TIMEZONE") or app_config.get("timezone", "Asia/Shanghai"),
+        "METRICS_TEXTFILE": _get_env_str("METRICS_TEXTFILE") or app_config.get("metrics_textfile", ""),
     }
 
 
@@ -68,6 +69,7 @@ def _load_report_config(config_data: Dict) -> Dict:
     sort_by_position_env = _get_env_bool("SORT_BY_POSITION_FIRST")
     reverse_content_env = _get_env_bool("REVERSE_CONTENT_ORDER")
     max_news_env = _get_env_int("MAX_NEWS_PER_KEYWORD")
+    incremental_stats_env = _get_env_bool("INCREMENTAL_STATS")
 
     return {
         "REPORT_MODE": _get_env_str("REPORT_MODE") or report_config.get("mode", "daily"),
@@ -75,6 +77,9 @@ def _load_report_config(config_data: Dict) -> Dict:
         "SORT_BY_POSITION_FIRST": sort_by_position_env if sort_by_position_env is not None else report_config.get("sort_by_position_first", False),
         "MAX_NEWS_PER_KEYWORD": max_news_env or report_config.get("max_news_per_keyword", 0),
         "REVERSE_CONTENT_ORDER": reverse_content_env if reverse_content_env is not None else report_config.get("reverse_content_order", False),
+        "INCREMENTAL_STATS": incremental_stats_env if incremental_stats_env is not None else report_config.get("incremental_stats", True),
+        "ANALYSIS_WORKERS": _get_env_int("ANALYSIS_WORKERS") or report_config.get("analysis_workers", 1),
+        "ANALYSIS_PARALLEL_THRESHOLD": _get_env_int("ANALYSIS_PARALLEL_THRESHOLD") or report_config.get("analysis_parallel_threshold", 20000),
     }
 
 
@@ -135,7 +140,11 @@ def _load_storage_config(config_data: Dict) -> Dict:
 
     txt_enabled_env = _get_env_bool("STORAGE_TXT_ENABLED")
     html_enabled_env = _get_env_bool("STORAGE_HTML_ENABLED")
+    html_gzip_env = _get_env_bool("STORAGE_HTML_GZIP")
     pull_enabled_env = _get_env_bool("PULL_ENABLED")
+    # 0 是有效取值（关闭增量上传 / 缓存不限制大小），不能用 or 回退到默认值
+    compact_segments_env = _get_env_int("REMOTE_COMPACT_SEGMENTS", default=None)
+    cache_max_mb_env = _get_env_int("REMOTE_CACHE_MAX_MB", default=None)
 
     return {
         "BACKEND": _get_env_str("STORAGE_BACKEND") or storage.get("backend", "auto"),
@@ -143,10 +152,13 @@ def _load_storage_config(config_data: Dict) -> Dict:
             "SQLITE": formats.get("sqlite", True),
             "TXT": txt_enabled_env if txt_enabled_env is not None else formats.get("txt", True),
             "HTML": html_enabled_env if html_enabled_env is not None else formats.get("html", True),
+            "HTML_GZIP": html_gzip_env if html_gzip_env is not None else formats.get("html_gzip", True),
         },
         "LOCAL": {
             "DATA_DIR": local.get("data_dir", "output"),
             "RETENTION_DAYS": _get_env_int("LOCAL_RETENTION_DAYS") or local.get("retention_days", 0),
+            "MAX_READ_CONNECTIONS": local.get("max_read_connections", 8),
+            "IDLE_TIMEOUT": local.get("idle_timeout", 300),
         },
         "REMOTE": {
             "ENDPOINT_URL": _get_env_str("S3_ENDPOINT_URL") or remote.get("endpoint_url", ""),
@@ -155,10 +167,15 @@ def _load_storage_config(config_data: Dict) -> Dict:
             "SECRET_ACCESS_KEY": _get_env_str("S3_SECRET_ACCESS_KEY") or remote.get("secret_access_key", ""),
             "REGION": _get_env_str("S3_REGION") or remote.get("region", ""),
             "RETENTION_DAYS": _get_env_int("REMOTE_RETENTION_DAYS") or remote.get("retention_days", 0),
+            "COMPACT_SEGMENTS": compact_segments_env if compact_segments_env is not None else remote.get("compact_segments", 8),
+            "COMPRESSION": _get_env_str("REMOTE_COMPRESSION") or remote.get("compression", "gzip"),
+            "CACHE_DIR": _get_env_str("REMOTE_CACHE_DIR") or remote.get("cache_dir", ""),
+            "CACHE_MAX_MB": cache_max_mb_env if cache_max_mb_env is not None else remote.get("cache_max_mb", 512),
         },
         "PULL": {
             "ENABLED": pull_enabled_env if pull_enabled_env is not None else pull.get("enabled", False),
             "DAYS": _get_env_int("PULL_DAYS") or pull.get("days", 7),
+            "MAX_WORKERS": _get_env_int("PULL_MAX_WORKERS") or pull.get("max_workers", 4),
         },
     }
 
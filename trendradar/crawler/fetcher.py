@@ -16,6 +16,8 @@ from typing import Dict, List, Tuple, Optional, Union
 
 import requests
 
+from trendradar.utils.tracing import span
+
 
 class DataFetcher:
     """数据获取器"""
@@ -141,38 +143,45 @@ class DataFetcher:
                 name = id_value
 
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
-
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # 跳过无效标题（None、float、空字符串）
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
+            with span("crawl.fetch", platform=id_value) as fetch_span:
+                response, _, _ = self.fetch_data(id_info)
+                fetch_span.set(bytes=len(response.encode("utf-8")) if response else 0)
+
+                if response:
+                    try:
+                        data = json.loads(response)
+                        results[id_value] = {}
+
+                        for index, item in enumerate(data.get("items", []), 1):
+                            title = item.get("title")
+                            # 跳过无效标题（None、float、空字符串）
+                            if title is None or isinstance(title, float) or not str(title).strip():
+                                continue
+                            title = str(title).strip()
+                            url = item.get("url", "")
+                            mobile_url = item.get("mobileUrl", "")
+
+                            if title in results[id_value]:
+                                results[id_value][title]["ranks"].append(index)
+                            else:
+                                results[id_value][title] = {
+                                    "ranks": [index],
+                                    "url": url,
+                                    "mobileUrl": mobile_url,
+                                }
+                    except json.JSONDecodeError:
+                        print(f"解析 {id_value} 响应失败")
+                        failed_ids.append(id_value)
+                    except Exception as e:
+                        print(f"处理 {id_value} 数据出错: {e}")
+                        failed_ids.append(id_value)
+                else:
                     failed_ids.append(id_value)
-            else:
-                failed_ids.append(id_value)
+
+                fetch_span.set(
+                    items=len(results.get(id_value, {})),
+                    failed=id_value in failed_ids,
+                )
 
             # 请求间隔（除了最后一个）
             if i < len(ids_list) - 1:
@@ -35,6 +35,7 @@ from trendradar.notification.renderer import (
 from trendradar.notification.splitter import (
     split_content_into_batches,
     DEFAULT_BATCH_SIZES,
+    TitleFragmentCache,
 )
 from trendradar.notification.senders import (
     send_to_feishu,
@@ -66,6 +67,7 @@ __all__ = [
     # 消息分批
     "split_content_into_batches",
     "DEFAULT_BATCH_SIZES",
+    "TitleFragmentCache",
     # 消息发送器
     "send_to_feishu",
     "send_to_dingtalk",
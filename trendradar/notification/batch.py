@@ -61,18 +61,12 @@ def truncate_to_bytes(text: str, max_bytes: int) -> str:
     if len(text_bytes) <= max_bytes:
         return text
 
-    # 截断到指定字节数
-    truncated = text_bytes[:max_bytes]
-
-    # 处理可能的不完整 UTF-8 字符
-    for i in range(min(4, len(truncated))):
-        try:
-            return truncated[: len(truncated) - i].decode("utf-8")
-        except UnicodeDecodeError:
-            continue
-
-    # 极端情况：返回空字符串
-    return ""
+    # 截断位置落在多字节字符中间时，向前跳过 UTF-8 续字节（0b10xxxxxx，最多 3 个）
+    # 退到字符边界，只解码一次
+    end = len(text_bytes[:max_bytes])
+    while end > 0 and 0x80 <= text_bytes[end] < 0xC0:
+        end -= 1
+    return text_bytes[:end].decode("utf-8")
 
 
 def add_batch_headers(
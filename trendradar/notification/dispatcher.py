@@ -18,6 +18,8 @@ from trendradar.core.config import (
     parse_multi_account_config,
     validate_paired_configs,
 )
+from trendradar.notification.splitter import TitleFragmentCache
+from trendradar.utils.tracing import current_span, span
 
 from .senders import (
     send_to_bark,
@@ -57,6 +59,8 @@ class NotificationDispatcher:
         self.get_time_func = get_time_func
         self.split_content_func = split_content_func
         self.max_accounts = config.get("MAX_ACCOUNTS_PER_CHANNEL", 3)
+        # 标题片段缓存：同一次分发中所有渠道、账号共享
+        self._fragment_cache = TitleFragmentCache()
 
     def dispatch_all(
         self,
@@ -82,48 +86,63 @@ class NotificationDispatcher:
             Dict[str, bool]: 每个渠道的发送结果，key 为渠道名，value 为是否成功
         """
         results = {}
+        self._fragment_cache = TitleFragmentCache()
 
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_feishu(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            with span("notify.send", channel="feishu", report_type=report_type) as send_span:
+                results["feishu"] = self._send_feishu(
+                    report_data, report_type, update_info, proxy_url, mode
+                )
+                send_span.set(success=results["feishu"])
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_dingtalk(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            with span("notify.send", channel="dingtalk", report_type=report_type) as send_span:
+                results["dingtalk"] = self._send_dingtalk(
+                    report_data, report_type, update_info, proxy_url, mode
+                )
+                send_span.set(success=results["dingtalk"])
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_wework(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            with span("notify.send", channel="wework", report_type=report_type) as send_span:
+                results["wework"] = self._send_wework(
+                    report_data, report_type, update_info, proxy_url, mode
+                )
+                send_span.set(success=results["wework"])
 
         # Telegram（需要配对验证）
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_telegram(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            with span("notify.send", channel="telegram", report_type=report_type) as send_span:
+                results["telegram"] = self._send_telegram(
+                    report_data, report_type, update_info, proxy_url, mode
+                )
+                send_span.set(success=results["telegram"])
 
         # ntfy（需要配对验证）
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_ntfy(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            with span("notify.send", channel="ntfy", report_type=report_type) as send_span:
+                results["ntfy"] = self._send_ntfy(
+                    report_data, report_type, update_info, proxy_url, mode
+                )
+                send_span.set(success=results["ntfy"])
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_bark(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            with span("notify.send", channel="bark", report_type=report_type) as send_span:
+                results["bark"] = self._send_bark(
+                    report_data, report_type, update_info, proxy_url, mode
+                )
+                send_span.set(success=results["bark"])
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_slack(
-                report_data, report_type, update_info, proxy_url, mode
-            )
+            with span("notify.send", channel="slack", report_type=report_type) as send_span:
+                results["slack"] = self._send_slack(
+                    report_data, report_type, update_info, proxy_url, mode
+                )
+                send_span.set(success=results["slack"])
 
         # 邮件（保持原有逻辑，已支持多收件人）
         if (
@@ -131,10 +150,19 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path)
+            with span("notify.send", channel="email", report_type=report_type) as send_span:
+                results["email"] = self._send_email(report_type, html_file_path)
+                send_span.set(success=results["email"], batches=1)
 
         return results
 
+    def _split_content(self, *args, **kwargs) -> List[str]:
+        """内容分批（共享标题片段缓存），并把批次数累加到当前渠道的追踪记录"""
+        kwargs.setdefault("fragment_cache", self._fragment_cache)
+        batches = self.split_content_func(*args, **kwargs)
+        current_span().add(batches=len(batches))
+        return batches
+
     def _send_to_multi_accounts(
         self,
         channel_name: str,
@@ -191,7 +219,7 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("FEISHU_BATCH_SIZE", 29000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content,
                 get_time_func=self.get_time_func,
             ),
         )
@@ -218,7 +246,7 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("DINGTALK_BATCH_SIZE", 20000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content,
             ),
         )
 
@@ -245,7 +273,7 @@ class NotificationDispatcher:
                 batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
                 msg_type=self.config.get("WEWORK_MSG_TYPE", "markdown"),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content,
             ),
         )
 
@@ -294,7 +322,7 @@ class NotificationDispatcher:
                     account_label=account_label,
                     batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
                     batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                    split_content_func=self.split_content_func,
+                    split_content_func=self._split_content,
                 )
                 results.append(result)
 
@@ -344,7 +372,7 @@ class NotificationDispatcher:
                     mode=mode,
                     account_label=account_label,
                     batch_size=3800,
-                    split_content_func=self.split_content_func,
+                    split_content_func=self._split_content,
                 )
                 results.append(result)
 
@@ -372,7 +400,7 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("BARK_BATCH_SIZE", 3600),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content,
             ),
         )
 
@@ -398,7 +426,7 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("SLACK_BATCH_SIZE", 4000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content,
             ),
         )
 
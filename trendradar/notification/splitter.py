@@ -6,7 +6,7 @@
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 
 from trendradar.report.formatter import format_title_for_platform
 
@@ -19,6 +19,131 @@ DEFAULT_BATCH_SIZES = {
     "default": 4000,
 }
 
+# 消息格式 -> 标题格式化所用的平台（不在表中的格式使用纯标题）
+_TITLE_PLATFORMS = {
+    "wework": "wework",
+    "bark": "wework",
+    "telegram": "telegram",
+    "ntfy": "ntfy",
+    "feishu": "feishu",
+    "dingtalk": "dingtalk",
+    "slack": "slack",
+}
+# 新增新闻区域沿用既有输出：ntfy 的新增新闻、bark 第二条起的新增新闻使用纯标题
+_NEW_FIRST_TITLE_PLATFORMS = {
+    key: value for key, value in _TITLE_PLATFORMS.items() if key != "ntfy"
+}
+_NEW_REST_TITLE_PLATFORMS = {
+    key: value for key, value in _TITLE_PLATFORMS.items() if key not in ("ntfy", "bark")
+}
+
+
+class TitleFragmentCache:
+    """
+    标题片段缓存
+
+    一次推送中，各渠道、各账号的分批都会格式化同一批标题。缓存按
+    (标题数据, 平台格式, 是否显示来源, 是否去掉新增标记) 保存格式化结果及其 UTF-8 字节数，
+    每个组合只格式化一次，所有分批调用共享。
+
+    以标题数据对象的 id 为键，并在缓存中持有该对象，保证缓存存活期间 id 不被复用。
+    """
+
+    def __init__(self):
+        self._fragments: Dict[Tuple[int, Optional[str], bool, bool], Tuple[Dict, str, int]] = {}
+
+    def get(
+        self,
+        title_data: Dict,
+        platform: Optional[str],
+        show_source: bool = True,
+        hide_new: bool = False,
+    ) -> Tuple[str, int]:
+        """
+        获取格式化后的标题片段
+
+        Args:
+            title_data: 标题数据（report_data 中的条目）
+            platform: 格式化平台，None 表示使用纯标题
+            show_source: 是否显示来源名称
+            hide_new: 是否去掉新增标记（新增新闻区域中使用）
+
+        Returns:
+            (格式化后的标题, UTF-8 字节数)
+        """
+        key = (id(title_data), platform, show_source, hide_new)
+        entry = self._fragments.get(key)
+        if entry is None:
+            data = title_data
+            if hide_new:
+                data = title_data.copy()
+                data["is_new"] = False
+            if platform:
+                text = format_title_for_platform(platform, data, show_source=show_source)
+            else:
+                text = f"{data['title']}"
+            entry = self._fragments[key] = (title_data, text, len(text.encode("utf-8")))
+        return entry[1], entry[2]
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+
+def _utf8_len(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+class _BatchBuilder:
+    """
+    按字节预算拼装批次
+
+    当前批次保存为片段列表并累计其 UTF-8 字节数：判断能否追加只需做一次加法，
+    批次完成时才拼接成字符串。整体耗时与内容总长度成线性关系
+    （逐条拼接字符串并重新编码整个批次是平方级的）。
+    """
+
+    def __init__(self, max_bytes: int, base_header: str, base_footer: str):
+        self.max_bytes = max_bytes
+        self.base_header = base_header
+        self.base_footer = base_footer
+        self.header_bytes = _utf8_len(base_header)
+        self.footer_bytes = _utf8_len(base_footer)
+        self.batches: List[str] = []
+        self.parts: List[str] = [base_header]
+        self.size = self.header_bytes
+        self.has_content = False
+
+    def fits(self, size: int) -> bool:
+        """追加 size 字节后（含页脚）是否仍小于上限"""
+        return self.size + size + self.footer_bytes < self.max_bytes
+
+    def append(self, text: str, size: int) -> None:
+        self.parts.append(text)
+        self.size += size
+
+    def add(self, text: str, size: int, *restart_with: Tuple[str, int]) -> None:
+        """
+        追加片段；当前批次放不下时结束该批次，以 页头 + restart_with + 该片段 开启新批次
+
+        Args:
+            text: 片段内容
+            size: 片段的 UTF-8 字节数
+            restart_with: 新批次中需要重复的上下文标题 [(内容, 字节数), ...]
+        """
+        if not self.fits(size):
+            self.flush()
+            self.parts = [self.base_header]
+            self.size = self.header_bytes
+            for context_text, context_size in restart_with:
+                self.append(context_text, context_size)
+        self.append(text, size)
+        self.has_content = True
+
+    def flush(self) -> None:
+        """输出当前批次（没有内容时跳过）"""
+        if self.has_content:
+            self.batches.append("".join(self.parts) + self.base_footer)
+
 
 def split_content_into_batches(
     report_data: Dict,
@@ -30,6 +155,7 @@ def split_content_into_batches(
     feishu_separator: str = "---",
     reverse_content_order: bool = False,
     get_time_func: Optional[Callable[[], datetime]] = None,
+    fragment_cache: Optional[TitleFragmentCache] = None,
 ) -> List[str]:
     """分批处理消息内容，确保词组标题+至少第一条新闻的完整性
 
@@ -43,6 +169,7 @@ def split_content_into_batches(
         feishu_separator: 飞书消息分隔符
         reverse_content_order: 是否反转内容顺序（新增在前）
         get_time_func: 获取当前时间的函数（可选）
+        fragment_cache: 标题片段缓存（可选，多次调用间共享可避免重复格式化）
 
     Returns:
         分批后的消息内容列表
@@ -60,6 +187,10 @@ def split_content_into_batches(
         else:
             max_bytes = sizes.get("default", 4000)
 
+    if fragment_cache is None:
+        fragment_cache = TitleFragmentCache()
+    title_platform = _TITLE_PLATFORMS.get(format_type)
+
     batches = []
 
     total_titles = sum(
@@ -125,9 +256,6 @@ def split_content_into_batches(
         elif format_type == "slack":
             stats_header = f"📊 *热点词汇统计*\n\n"
 
-    current_batch = base_header
-    current_batch_has_content = False
-
     if (
         not report_data["stats"]
         and not report_data["new_titles"]
@@ -144,27 +272,19 @@ def split_content_into_batches(
         batches.append(final_content)
         return batches
 
+    builder = _BatchBuilder(max_bytes, base_header, base_footer)
+
     # 定义处理热点词汇统计的函数
-    def process_stats_section(current_batch, current_batch_has_content, batches):
+    def process_stats_section():
         """处理热点词汇统计"""
         if not report_data["stats"]:
-            return current_batch, current_batch_has_content, batches
+            return
 
         total_count = len(report_data["stats"])
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+        stats_context = (stats_header, _utf8_len(stats_header))
+        builder.add(*stats_context)
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
         for i, stat in enumerate(report_data["stats"]):
@@ -233,106 +353,45 @@ def split_content_into_batches(
                 else:
                     word_header = f"📌 {sequence_display} *{word}* : {count} 条\n\n"
 
+            word_context = (word_header, _utf8_len(word_header))
+            titles = stat["titles"]
+            last_index = len(titles) - 1
+
             # 构建第一条新闻
             first_news_line = ""
-            if stat["titles"]:
-                first_title_data = stat["titles"][0]
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", first_title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", first_title_data, show_source=True
-                    )
-                elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", first_title_data, show_source=True
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", first_title_data, show_source=True
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", first_title_data, show_source=True
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", first_title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{first_title_data['title']}"
+            first_news_size = 0
+            if titles:
+                formatted_title, title_size = fragment_cache.get(
+                    titles[0], title_platform, show_source=True
+                )
 
                 first_news_line = f"  1. {formatted_title}\n"
-                if len(stat["titles"]) > 1:
+                first_news_size = title_size + 6
+                if last_index > 0:
                     first_news_line += "\n"
+                    first_news_size += 1
 
-            # 原子性检查：词组标题+第一条新闻必须一起处理
-            word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                # 当前批次容纳不下，开启新批次
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            # 原子性检查：词组标题+第一条新闻必须一起处理，容纳不下时整体移到新批次
+            builder.add(
+                word_header + first_news_line,
+                word_context[1] + first_news_size,
+                stats_context,
+            )
 
             # 处理剩余新闻条目
-            for j in range(start_index, len(stat["titles"])):
-                title_data = stat["titles"][j]
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data, show_source=True
-                    )
-                elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", title_data, show_source=True
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data, show_source=True
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data, show_source=True
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{title_data['title']}"
-
-                news_line = f"  {j + 1}. {formatted_title}\n"
-                if j < len(stat["titles"]) - 1:
-                    news_line += "\n"
-
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+            for j in range(1, len(titles)):
+                formatted_title, title_size = fragment_cache.get(
+                    titles[j], title_platform, show_source=True
+                )
+
+                prefix = f"  {j + 1}. "
+                suffix = "\n\n" if j < last_index else "\n"
+                builder.add(
+                    prefix + formatted_title + suffix,
+                    len(prefix) + title_size + len(suffix),
+                    stats_context,
+                    word_context,
+                )
 
             # 词组间分隔符
             if i < len(report_data["stats"]) - 1:
@@ -350,20 +409,16 @@ def split_content_into_batches(
                 elif format_type == "slack":
                     separator = f"\n\n"
 
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
-
-        return current_batch, current_batch_has_content, batches
+                # 放不下时直接省略（分隔符不单独开启新批次）
+                separator_size = _utf8_len(separator)
+                if builder.fits(separator_size):
+                    builder.append(separator, separator_size)
 
     # 定义处理新增新闻的函数
-    def process_new_titles_section(current_batch, current_batch_has_content, batches):
+    def process_new_titles_section():
         """处理新增新闻"""
         if not report_data["new_titles"]:
-            return current_batch, current_batch_has_content, batches
+            return
 
         new_header = ""
         if format_type in ("wework", "bark"):
@@ -381,18 +436,8 @@ def split_content_into_batches(
         elif format_type == "slack":
             new_header = f"\n\n🆕 *本次新增热点新闻* (共 {report_data['total_new_count']} 条)\n\n"
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        new_context = (new_header, _utf8_len(new_header))
+        builder.add(*new_context)
 
         # 逐个处理新增新闻来源
         for source_data in report_data["new_titles"]:
@@ -410,121 +455,57 @@ def split_content_into_batches(
             elif format_type == "slack":
                 source_header = f"*{source_data['source_name']}* ({len(source_data['titles'])} 条):\n\n"
 
+            source_context = (source_header, _utf8_len(source_header))
+
             # 构建第一条新增新闻
             first_news_line = ""
+            first_news_size = 0
             if source_data["titles"]:
-                first_title_data = source_data["titles"][0]
-                title_data_copy = first_title_data.copy()
-                title_data_copy["is_new"] = False
-
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
+                formatted_title, title_size = fragment_cache.get(
+                    source_data["titles"][0],
+                    _NEW_FIRST_TITLE_PLATFORMS.get(format_type),
+                    show_source=False,
+                    hide_new=True,
+                )
 
                 first_news_line = f"  1. {formatted_title}\n"
+                first_news_size = title_size + 6
 
             # 原子性检查：来源标题+第一条新闻
-            source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            builder.add(
+                source_header + first_news_line,
+                source_context[1] + first_news_size,
+                new_context,
+            )
 
             # 处理剩余新增新闻
-            for j in range(start_index, len(source_data["titles"])):
-                title_data = source_data["titles"][j]
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
-
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
-
-                news_line = f"  {j + 1}. {formatted_title}\n"
-
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
-
-            current_batch += "\n"
-
-        return current_batch, current_batch_has_content, batches
+            for j in range(1, len(source_data["titles"])):
+                formatted_title, title_size = fragment_cache.get(
+                    source_data["titles"][j],
+                    _NEW_REST_TITLE_PLATFORMS.get(format_type),
+                    show_source=False,
+                    hide_new=True,
+                )
+
+                prefix = f"  {j + 1}. "
+                builder.add(
+                    prefix + formatted_title + "\n",
+                    len(prefix) + title_size + 1,
+                    new_context,
+                    source_context,
+                )
+
+            builder.append("\n", 1)
 
     # 根据配置决定处理顺序
     if reverse_content_order:
         # 新增热点在前，热点词汇统计在后
-        current_batch, current_batch_has_content, batches = process_new_titles_section(
-            current_batch, current_batch_has_content, batches
-        )
-        current_batch, current_batch_has_content, batches = process_stats_section(
-            current_batch, current_batch_has_content, batches
-        )
+        process_new_titles_section()
+        process_stats_section()
     else:
         # 默认：热点词汇统计在前，新增热点在后
-        current_batch, current_batch_has_content, batches = process_stats_section(
-            current_batch, current_batch_has_content, batches
-        )
-        current_batch, current_batch_has_content, batches = process_new_titles_section(
-            current_batch, current_batch_has_content, batches
-        )
+        process_stats_section()
+        process_new_titles_section()
 
     if report_data["failed_ids"]:
         failed_header = ""
@@ -539,18 +520,8 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        failed_context = (failed_header, _utf8_len(failed_header))
+        builder.add(*failed_context)
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
             if format_type == "feishu":
@@ -560,21 +531,10 @@ def split_content_into_batches(
             else:
                 failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            builder.add(failed_line, _utf8_len(failed_line), failed_context)
 
     # 完成最后批次
-    if current_batch_has_content:
-        batches.append(current_batch + base_footer)
+    builder.flush()
+    batches.extend(builder.batches)
 
     return batches
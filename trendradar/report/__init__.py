@@ -19,10 +19,11 @@ from trendradar.report.helpers import (
     format_rank_display,
 )
 from trendradar.report.formatter import format_title_for_platform
-from trendradar.report.html import render_html_content
+from trendradar.report.html import render_html_content, render_html_chunks
 from trendradar.report.generator import (
     prepare_report_data,
     generate_html_report,
+    write_gzip_sibling,
 )
 
 __all__ = [
@@ -34,7 +35,9 @@ __all__ = [
     "format_title_for_platform",
     # HTML 渲染
     "render_html_content",
+    "render_html_chunks",
     # 报告生成器
     "prepare_report_data",
     "generate_html_report",
+    "write_gzip_sibling",
 ]
@@ -5,8 +5,12 @@
 提供报告数据准备和 HTML 生成功能：
 - prepare_report_data: 准备报告数据
 - generate_html_report: 生成 HTML 报告
+- write_gzip_sibling: 写出预压缩的 .gz 副本
 """
 
+import gzip
+import os
+import shutil
 from pathlib import Path
 from typing import Dict, List, Optional, Callable
 
@@ -137,6 +141,36 @@ def prepare_report_data(
     }
 
 
+def write_gzip_sibling(file_path: str, compresslevel: int = 6) -> str:
+    """
+    为文件写出预压缩的 .gz 副本（静态服务器可直接以 Content-Encoding: gzip 返回）
+
+    先写临时文件再替换，服务器不会读到写了一半的文件。
+
+    Args:
+        file_path: 原文件路径
+        compresslevel: 压缩级别
+
+    Returns:
+        str: .gz 文件路径
+    """
+    gz_path = file_path + ".gz"
+    tmp_path = gz_path + ".tmp"
+    with open(file_path, "rb") as src, open(tmp_path, "wb") as raw:
+        # mtime=0：内容相同则压缩结果相同
+        with gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=compresslevel, mtime=0) as gz:
+            shutil.copyfileobj(src, gz)
+    os.replace(tmp_path, gz_path)
+    return gz_path
+
+
+def _copy_atomic(src: str, dst: str) -> None:
+    """复制文件：先写临时文件再替换，服务器不会读到复制了一半的文件"""
+    tmp_path = f"{dst}.tmp"
+    shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
 def generate_html_report(
     stats: List[Dict],
     total_titles: int,
@@ -154,6 +188,7 @@ def generate_html_report(
     matches_word_groups_func: Optional[Callable] = None,
     load_frequency_words_func: Optional[Callable] = None,
     enable_index_copy: bool = True,
+    precompress: bool = False,
 ) -> str:
     """
     生成 HTML 报告
@@ -171,10 +206,11 @@ def generate_html_report(
         output_dir: 输出目录
         date_folder: 日期文件夹名称
         time_filename: 时间文件名
-        render_html_func: HTML 渲染函数
+        render_html_func: HTML 渲染函数（返回完整字符串或按顺序排列的片段列表）
         matches_word_groups_func: 词组匹配函数
         load_frequency_words_func: 加载频率词函数
         enable_index_copy: 是否复制到 index.html
+        precompress: 是否同时写出 .gz 预压缩副本
 
     Returns:
         str: 生成的 HTML 文件路径
@@ -215,21 +251,28 @@ def generate_html_report(
         # 默认简单 HTML
         html_content = f"<html><body><h1>Report</h1><pre>{report_data}</pre></body></html>"
 
-    # 写入文件
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    # 写入文件（片段列表直接流式写入，不再拼成完整字符串；先写临时文件再替换）
+    tmp_file_path = file_path + ".tmp"
+    with open(tmp_file_path, "w", encoding="utf-8") as f:
+        if isinstance(html_content, str):
+            f.write(html_content)
+        else:
+            f.writelines(html_content)
+    os.replace(tmp_file_path, file_path)
+    gz_file_path = write_gzip_sibling(file_path) if precompress else None
 
     # 如果是每日汇总且启用 index 复制
     if is_daily_summary and enable_index_copy:
         # 生成到根目录（供 GitHub Pages 访问）
         root_index_path = Path("index.html")
-        with open(root_index_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        _copy_atomic(file_path, str(root_index_path))
 
         # 同时生成到 output 目录（供 Docker Volume 挂载访问）
         output_index_path = Path(output_dir) / "index.html"
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        with open(output_index_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        _copy_atomic(file_path, str(output_index_path))
+        if gz_file_path:
+            # 在 HTML 之后复制，保证 .gz 不早于 HTML（服务器据此判断副本是否过期）
+            _copy_atomic(gz_file_path, f"{output_index_path}.gz")
 
     return file_path
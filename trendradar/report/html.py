@@ -1,27 +1,60 @@
 # coding=utf-8
 """
 HTML 报告渲染模块 - Email Compatible Table Layout
+
+模板在导入时预编译：填入静态内容（如样式表）后按占位符切分为静态片段，
+渲染时只把动态字段与静态片段交替追加到列表缓冲区，不再逐次解析或拼接模板。
+render_html_content 最后一次性拼接；render_html_chunks 直接返回片段列表，
+可用 writelines 流式写入文件。
 """
 
+import re
 from datetime import datetime
-from typing import Dict, Optional, Callable
+from typing import Callable, Dict, List, Optional, Tuple
+
 from trendradar.report.helpers import html_escape
 
 
-def render_html_content(
-    report_data: Dict,
-    total_titles: int,
-    is_daily_summary: bool = False,
-    mode: str = "daily",
-    update_info: Optional[Dict] = None,
-    *,
-    reverse_content_order: bool = False,
-    get_time_func: Optional[Callable[[], datetime]] = None,
-) -> str:
-    """渲染HTML内容 (邮件兼容重构版)"""
+_FIELD_PATTERN = re.compile(r"\{(\w+)\}")
 
-    # --- CSS 样式 ---
-    css_style = """
+
+def _compile_template(template: str, fields: Tuple[str, ...], **static_values: str) -> Tuple[str, ...]:
+    """
+    预编译模板
+
+    Args:
+        template: 含 {name} 占位符的模板
+        fields: 渲染时按顺序提供的动态字段（须与模板中的顺序一致）
+        **static_values: 导入时直接填入的静态内容
+
+    Returns:
+        静态片段元组（比 fields 多一个），渲染时为
+        parts[0] + 值0 + parts[1] + 值1 + ... + parts[-1]
+    """
+    pieces = _FIELD_PATTERN.split(template)
+    parts = [pieces[0]]
+    names = []
+    for name, static in zip(pieces[1::2], pieces[2::2]):
+        if name in static_values:
+            parts[-1] += static_values[name] + static
+        else:
+            names.append(name)
+            parts.append(static)
+    if tuple(names) != fields:
+        raise ValueError(f"模板字段不匹配: {names} != {list(fields)}")
+    return tuple(parts)
+
+
+def _emit(out: List[str], parts: Tuple[str, ...], *values: str) -> None:
+    """按预编译片段把一段模板追加到缓冲区"""
+    out.append(parts[0])
+    for value, static in zip(values, parts[1:]):
+        out.append(value)
+        out.append(static)
+
+
+# --- CSS 样式 ---
+_CSS_STYLE = """
         body {
             margin: 0;
             padding: 0;
@@ -75,8 +108,8 @@ def render_html_content(
         }
     """
 
-    # --- HTML 头部 ---
-    html = f"""
+# --- HTML 头部（样式表在导入时填入） ---
+_HEAD_PARTS = _compile_template("""
     <!DOCTYPE html>
     <html lang="zh-CN">
     <head>
@@ -108,7 +141,7 @@ def render_html_content(
                                     <tr>
                                         <td width="25%" align="center" style="padding: 10px 5px; color:#ffffff;">
                                             <div style="font-size:11px; opacity:0.8; margin-bottom:4px;">类型</div>
-                                            <div class="header-stat-val" style="font-size:14px; font-weight:bold;">{'当日汇总' if is_daily_summary else '实时'}</div>
+                                            <div class="header-stat-val" style="font-size:14px; font-weight:bold;">{report_type}</div>
                                         </td>
                                         <td width="25%" align="center" style="padding: 10px 5px; color:#ffffff; border-left:1px solid rgba(255,255,255,0.2);">
                                             <div style="font-size:11px; opacity:0.8; margin-bottom:4px;">总数</div>
@@ -116,48 +149,39 @@ def render_html_content(
                                         </td>
                                         <td width="25%" align="center" style="padding: 10px 5px; color:#ffffff; border-left:1px solid rgba(255,255,255,0.2);">
                                             <div style="font-size:11px; opacity:0.8; margin-bottom:4px;">热点</div>
-                                            <div class="header-stat-val" style="font-size:14px; font-weight:bold;">{sum(len(stat["titles"]) for stat in report_data["stats"])}</div>
+                                            <div class="header-stat-val" style="font-size:14px; font-weight:bold;">{hot_count}</div>
                                         </td>
                                         <td width="25%" align="center" style="padding: 10px 5px; color:#ffffff; border-left:1px solid rgba(255,255,255,0.2);">
                                             <div style="font-size:11px; opacity:0.8; margin-bottom:4px;">时间</div>
-                                            <div class="header-stat-val" style="font-size:14px; font-weight:bold;">{(get_time_func() if get_time_func else datetime.now()).strftime("%H:%M")}</div>
+                                            <div class="header-stat-val" style="font-size:14px; font-weight:bold;">{time_display}</div>
                                         </td>
                                     </tr>
                                 </table>
                             </td>
                         </tr>
 
-                        """
+                        """,
+    ("report_type", "total_titles", "hot_count", "time_display"),
+    css_style=_CSS_STYLE,
+)
 
-    if report_data["failed_ids"]:
-        html += """
+# --- 数据源连接警告 ---
+_FAILED_OPEN = """
                         <tr>
                             <td style="padding: 15px 20px; background-color: #fef2f2; border-bottom: 1px solid #fee2e2;">
                                 <div style="color: #dc2626; font-size: 13px; font-weight: bold; margin-bottom: 5px;">⚠️ 数据源连接警告</div>
                                 <div style="color: #991b1b; font-size: 12px; font-family: monospace;">
         """
-        html += ", ".join([html_escape(x) for x in report_data["failed_ids"]])
-        html += """
+_FAILED_CLOSE = """
                                 </div>
                             </td>
                         </tr>
         """
 
-    # --- 辅助函数：生成新闻列表 (Table Row) ---
-    # ✅ 已删除：序号徽章 + 排名徽章
-    # ✅ news-item：不再强制上对齐（自然排版）
-    def render_news_rows(items_list, is_incremental=False):
-        rows_html = ""
-        for _, title_data in enumerate(items_list, 1):
-            title = html_escape(title_data["title"])
-            url = title_data.get("mobile_url") or title_data.get("url", "")
-            source = html_escape(title_data["source_name"])
-            count = title_data.get("count", 1)
-
-            # 时间处理
-            time_display = title_data.get("time_display", "").replace(" ~ ", "-").replace("[", "").replace("]", "")
-
-            rows_html += f"""
+# --- 新闻列表 (Table Row) ---
+# ✅ 已删除：序号徽章 + 排名徽章
+# ✅ news-item：不再强制上对齐（自然排版）
+_NEWS_ROW_PARTS = _compile_template("""
                         <tr>
                             <td style="padding: 12px 20px; border-bottom: 1px solid #f3f4f6;">
                                 <table width="100%" border="0" cellspacing="0" cellpadding="0">
@@ -168,7 +192,7 @@ def render_html_content(
                                             </div>
 
                                             <div>
-                                                {f'<span style="display:inline-block; background:#dcfce7; color:#166534; font-size:10px; padding:2px 6px; border-radius:4px; font-weight:bold; margin-right:4px;">NEW</span>' if (title_data.get("is_new") or is_incremental) else ''}
+                                                {new_badge}
 
                                                 <span style="display:inline-block; background:#e0e7ff; color:#4338ca; font-size:10px; padding:2px 6px; border-radius:4px; margin-right:4px;">{source}</span>
 
@@ -181,22 +205,19 @@ def render_html_content(
                                 </table>
                             </td>
                         </tr>
-            """
-        return rows_html
-
-    # --- 构建内容主体 ---
-
-    # 1. 热点统计
-    stats_content = ""
-    if report_data["stats"]:
-        for i, stat in enumerate(report_data["stats"], 1):
-            word = html_escape(stat["word"])
-            count = stat["count"]
-
-            # ✅ word-header：上下居中（valign + vertical-align）
-            stats_content += f"""
+            """,
+    ("url", "title", "new_badge", "source", "time_display", "count"),
+)
+_NEW_BADGE = (
+    '<span style="display:inline-block; background:#dcfce7; color:#166534; font-size:10px; '
+    'padding:2px 6px; border-radius:4px; font-weight:bold; margin-right:4px;">NEW</span>'
+)
+
+# --- 热点词组标题 ---
+# ✅ word-header：上下居中（valign + vertical-align）
+_STAT_HEADER_PARTS = _compile_template("""
                         <tr>
-                            <td bgcolor="#fafafa" style="padding: 12px 20px; border-bottom: 1px solid #f0f0f0; border-top: { '8px solid #f4f4f5' if i > 1 else 'none' };">
+                            <td bgcolor="#fafafa" style="padding: 12px 20px; border-bottom: 1px solid #f0f0f0; border-top: {border_top};">
 
                                 <table width="100%" border="0" cellspacing="0" cellpadding="0">
                                     <tr>
@@ -205,44 +226,41 @@ def render_html_content(
                                             <span style="background:#f3f4f6; color:#6b7280; font-size:12px; padding:2px 8px; border-radius:12px; margin-left:8px; font-weight:bold;">{count}条</span>
                                         </td>
                                         <td valign="middle" align="right" style="vertical-align: middle; font-size:12px; color:#9ca3af; line-height: 1.2;">
-                                            TOP {i}
+                                            TOP {index}
                                         </td>
                                     </tr>
                                 </table>
                             </td>
                         </tr>
-                        {render_news_rows(stat["titles"])}
-            """
+                        """,
+    ("border_top", "word", "count", "index"),
+)
 
-    # 2. 新增热点
-    new_content = ""
-    if report_data["new_titles"]:
-        new_content += f"""
+# --- 新增热点 ---
+_NEW_SECTION_PARTS = _compile_template("""
                         <tr>
                             <td bgcolor="#ecfdf5" style="padding: 15px 20px; color:#065f46; font-weight:bold; font-size:15px; border-bottom: 1px solid #d1fae5; border-top: 8px solid #f4f4f5;">
-                                ⚡ 本次新增 ({report_data['total_new_count']})
+                                ⚡ 本次新增 ({total_new_count})
                             </td>
                         </tr>
-        """
-        for source_data in report_data["new_titles"]:
-            source_name = html_escape(source_data["source_name"])
-            new_content += f"""
+        """,
+    ("total_new_count",),
+)
+_NEW_SOURCE_PARTS = _compile_template("""
                         <tr>
                             <td bgcolor="#f9fafb" style="padding: 8px 20px; color:#6b7280; font-size:12px; font-weight:bold; border-bottom: 1px solid #f3f4f6;">
                                 {source_name}
                             </td>
                         </tr>
-                        {render_news_rows(source_data["titles"], is_incremental=True)}
-            """
+                        """,
+    ("source_name",),
+)
 
-    # 组合顺序
-    if reverse_content_order:
-        html += new_content + stats_content
-    else:
-        html += stats_content + new_content
+# 词组/来源下的新闻列表结束
+_SECTION_END = "\n            "
 
-    # --- HTML 尾部 ---
-    html += f"""
+# --- HTML 尾部 ---
+_FOOTER_OPEN = """
                         <tr>
                             <td align="center" style="padding: 30px 20px; background-color: #fafafa; border-top: 1px solid #e5e7eb;">
                                 <div style="font-size:12px; color:#9ca3af; margin-bottom:8px;">Generated by TrendRadar</div>
@@ -250,16 +268,17 @@ def render_html_content(
                                     <a href="https://github.com/sansan0/TrendRadar" target="_blank" style="color:#4f46e5; font-size:12px; font-weight:bold;">GitHub Repo</a>
                                 </div>
     """
-    if update_info:
-        html += f"""
+_UPDATE_PARTS = _compile_template("""
                                 <div style="margin-top:10px;">
                                     <span style="background:#fff7ed; color:#c2410c; border:1px solid #ffedd5; padding:4px 10px; border-radius:12px; font-size:11px;">
-                                        v{update_info['current_version']} → v{update_info['remote_version']}
+                                        v{current_version} → v{remote_version}
                                     </span>
                                 </div>
-        """
-
-    html += """
+        """,
+    ("current_version", "remote_version"),
+)
+# 含 JS 代码，只作为静态文本原样输出
+_FOOTER_CLOSE = """
                             </td>
                         </tr>
                     </table>
@@ -311,4 +330,134 @@ def render_html_content(
     </html>
     """
 
-    return html
+
+
+def _append_news_rows(
+    out: List[str],
+    items_list: List[Dict],
+    is_incremental: bool,
+    escaped_sources: Dict[str, str],
+) -> None:
+    """把新闻行追加到缓冲区（来源名在一次渲染内只转义一次）"""
+    p0, p1, p2, p3, p4, p5, p6 = _NEWS_ROW_PARTS
+    for title_data in items_list:
+        source_name = title_data["source_name"]
+        source = escaped_sources.get(source_name)
+        if source is None:
+            source = escaped_sources[source_name] = html_escape(source_name)
+
+        # 时间处理
+        time_display = title_data.get("time_display", "")
+        if time_display:
+            time_display = time_display.replace(" ~ ", "-").replace("[", "").replace("]", "")
+
+        out += (
+            p0, title_data.get("mobile_url") or title_data.get("url", ""),
+            p1, html_escape(title_data["title"]),
+            p2, _NEW_BADGE if (title_data.get("is_new") or is_incremental) else "",
+            p3, source,
+            p4, time_display,
+            p5, str(title_data.get("count", 1)),
+            p6,
+        )
+
+
+def render_html_chunks(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+    *,
+    reverse_content_order: bool = False,
+    get_time_func: Optional[Callable[[], datetime]] = None,
+) -> List[str]:
+    """
+    渲染HTML内容 (邮件兼容重构版)，返回按顺序排列的片段
+
+    参数与 render_html_content 相同；片段可直接 writelines 写入文件，
+    不必先拼成一个完整字符串。
+    """
+    out: List[str] = []
+    _emit(
+        out,
+        _HEAD_PARTS,
+        "当日汇总" if is_daily_summary else "实时",
+        str(total_titles),
+        str(sum(len(stat["titles"]) for stat in report_data["stats"])),
+        (get_time_func() if get_time_func else datetime.now()).strftime("%H:%M"),
+    )
+
+    if report_data["failed_ids"]:
+        out.append(_FAILED_OPEN)
+        out.append(", ".join([html_escape(x) for x in report_data["failed_ids"]]))
+        out.append(_FAILED_CLOSE)
+
+    escaped_sources: Dict[str, str] = {}
+
+    # 1. 热点统计
+    stats_content: List[str] = []
+    for i, stat in enumerate(report_data["stats"], 1):
+        _emit(
+            stats_content,
+            _STAT_HEADER_PARTS,
+            "8px solid #f4f4f5" if i > 1 else "none",
+            html_escape(stat["word"]),
+            str(stat["count"]),
+            str(i),
+        )
+        _append_news_rows(stats_content, stat["titles"], False, escaped_sources)
+        stats_content.append(_SECTION_END)
+
+    # 2. 新增热点
+    new_content: List[str] = []
+    if report_data["new_titles"]:
+        _emit(new_content, _NEW_SECTION_PARTS, str(report_data["total_new_count"]))
+        for source_data in report_data["new_titles"]:
+            _emit(new_content, _NEW_SOURCE_PARTS, html_escape(source_data["source_name"]))
+            _append_news_rows(new_content, source_data["titles"], True, escaped_sources)
+            new_content.append(_SECTION_END)
+
+    # 组合顺序
+    if reverse_content_order:
+        out.extend(new_content)
+        out.extend(stats_content)
+    else:
+        out.extend(stats_content)
+        out.extend(new_content)
+
+    # --- HTML 尾部 ---
+    out.append(_FOOTER_OPEN)
+    if update_info:
+        _emit(
+            out,
+            _UPDATE_PARTS,
+            str(update_info["current_version"]),
+            str(update_info["remote_version"]),
+        )
+    out.append(_FOOTER_CLOSE)
+    return out
+
+
+def render_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+    *,
+    reverse_content_order: bool = False,
+    get_time_func: Optional[Callable[[], datetime]] = None,
+) -> str:
+    """渲染HTML内容 (邮件兼容重构版)"""
+    return "".join(
+        render_html_chunks(
+            report_data,
+            total_titles,
+            is_daily_summary,
+            mode,
+            update_info,
+            reverse_content_order=reverse_content_order,
+            get_time_func=get_time_func,
+        )
+    )
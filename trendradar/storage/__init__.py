@@ -12,6 +12,7 @@ from trendradar.storage.base import (
     StorageBackend,
     NewsItem,
     NewsData,
+    compute_title_hash,
     convert_crawl_results_to_news_data,
     convert_news_data_to_results,
 )
@@ -31,6 +32,7 @@ __all__ = [
     "StorageBackend",
     "NewsItem",
     "NewsData",
+    "compute_title_hash",
     # 转换函数
     "convert_crawl_results_to_news_data",
     "convert_news_data_to_results",
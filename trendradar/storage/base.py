@@ -8,13 +8,55 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
+import hashlib
 import json
+import sys
 
+from trendradar.storage.titles import TitleTable
 
-@dataclass
+
+def normalize_title(title: str) -> str:
+    """
+    规范化标题（用于计算标题哈希）
+
+    去除首尾空白，并将连续空白折叠为单个空格
+    """
+    return " ".join(title.split())
+
+
+def compute_title_hash(platform_id: str, title: str) -> int:
+    """
+    计算平台 + 规范化标题的稳定 64 位哈希
+
+    使用 blake2b 而不是内置 hash()，保证跨进程、跨机器结果一致；
+    返回有符号整数，可直接存入 SQLite INTEGER 列。
+
+    Args:
+        platform_id: 平台ID
+        title: 新闻标题
+
+    Returns:
+        64 位有符号整数哈希
+    """
+    key = f"{platform_id}\x00{normalize_title(title)}".encode("utf-8")
+    digest = hashlib.blake2b(key, digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _intern(value):
+    """驻留字符串（非字符串原样返回）"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class NewsItem:
-    """新闻条目数据模型"""
+    """
+    新闻条目数据模型
+
+    使用 __slots__ 存储，平台 ID/名称和时间字符串会被驻留（intern），
+    一天内的大量条目共享同一份字符串对象。
+    """
 
     title: str                          # 新闻标题
     source_id: str                      # 来源平台ID（如 toutiao, baidu）
@@ -30,6 +72,13 @@ class NewsItem:
     last_time: str = ""                 # 最后出现时间
     count: int = 1                      # 出现次数
 
+    def __post_init__(self):
+        self.source_id = _intern(self.source_id)
+        self.source_name = _intern(self.source_name)
+        self.crawl_time = _intern(self.crawl_time)
+        self.first_time = _intern(self.first_time)
+        self.last_time = _intern(self.last_time)
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
         return {
@@ -64,7 +113,7 @@ class NewsItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsData:
     """
     新闻数据集合
@@ -236,6 +285,38 @@ class StorageBackend(ABC):
         """
         pass
 
+    def iter_items(
+        self,
+        date: Optional[str] = None,
+        platforms: Optional[List[str]] = None,
+        since: Optional[str] = None,
+    ) -> Iterator[NewsItem]:
+        """
+        逐条遍历指定日期的新闻条目（含排名历史）
+
+        默认实现基于 get_today_all_data，SQLite 后端会覆盖为直接从游标流式读取，
+        调用方一次遍历即可完成统计，无需先构建完整的 NewsData。
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            platforms: 只返回这些平台的条目，None 表示全部
+            since: 只返回最后出现时间不早于该抓取时间的条目
+
+        Yields:
+            NewsItem（按平台、最后出现时间排序）
+        """
+        data = self.get_today_all_data(date)
+        if not data:
+            return
+
+        for source_id, news_list in data.items.items():
+            if platforms is not None and source_id not in platforms:
+                continue
+            for item in news_list:
+                if since and item.last_time < since:
+                    continue
+                yield item
+
     @abstractmethod
     def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
         """
@@ -277,6 +358,20 @@ class StorageBackend(ABC):
         """
         pass
 
+    def get_crawl_times(self, date: Optional[str] = None) -> List[str]:
+        """
+        获取指定日期的所有抓取时间列表
+
+        默认返回空列表（调用方按无抓取记录处理），SQLite 后端会覆盖。
+
+        Args:
+            date: 日期字符串，默认为今天
+
+        Returns:
+            抓取时间列表（按时间排序）
+        """
+        return []
+
     @abstractmethod
     def is_first_crawl_today(self, date: Optional[str] = None) -> bool:
         """
@@ -425,33 +520,29 @@ def convert_news_data_to_results(data: NewsData) -> tuple:
     """
     将 NewsData 转换回原有的 results 格式（用于兼容现有代码）
 
+    results 和 title_info 是同一张标题表的只读视图，不再各自复制一份数据。
+
     Args:
         data: NewsData 对象
 
     Returns:
         (results, id_to_name, title_info) 元组
     """
-    results = {}
-    title_info = {}
+    table = TitleTable()
 
     for source_id, news_list in data.items.items():
-        results[source_id] = {}
-        title_info[source_id] = {}
+        table.add_source(source_id)
 
         for item in news_list:
-            results[source_id][item.title] = {
-                "ranks": item.ranks,
-                "url": item.url,
-                "mobileUrl": item.mobile_url,
-            }
-
-            title_info[source_id][item.title] = {
-                "first_time": item.first_time,
-                "last_time": item.last_time,
-                "count": item.count,
-                "ranks": item.ranks,
-                "url": item.url,
-                "mobileUrl": item.mobile_url,
-            }
-
-    return results, data.id_to_name, title_info
+            table.add(
+                source_id,
+                item.title,
+                item.ranks,
+                url=item.url,
+                mobile_url=item.mobile_url,
+                first_time=item.first_time,
+                last_time=item.last_time,
+                count=item.count,
+            )
+
+    return table.results_view(), data.id_to_name, table.title_info_view()
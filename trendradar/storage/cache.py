@@ -0,0 +1,137 @@
+# coding=utf-8
+"""
+远程数据库本地缓存
+
+远程存储后端把每天的数据库保存在持久化缓存目录中，跨进程复用：
+- 每个日期一个子目录：<cache_dir>/<YYYY-MM-DD>/news.db
+- 同目录下的 cache.json 记录基础库 ETag、是否有未同步的本地写入、最近使用时间
+- 下次运行用 ETag 做条件请求（If-None-Match），远程未变化时无需下载
+- 总大小超过上限时按最近使用时间（LRU）淘汰整个日期目录
+"""
+
+import json
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+_DATE_DIR_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_STATE_FILE = "cache.json"
+
+
+class RemoteDBCache:
+    """
+    远程数据库的持久化缓存目录
+
+    只负责文件布局、状态记录和淘汰，下载与上传由 RemoteStorageBackend 完成。
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: int = 512):
+        """
+        初始化缓存
+
+        Args:
+            cache_dir: 缓存目录
+            max_size_mb: 缓存总大小上限（MB，0 = 不限制）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(0, max_size_mb) * 1024 * 1024
+
+    def db_path(self, date_folder: str) -> Path:
+        """获取日期对应的缓存数据库路径"""
+        return self.cache_dir / date_folder / "news.db"
+
+    def _state_path(self, date_folder: str) -> Path:
+        return self.cache_dir / date_folder / _STATE_FILE
+
+    def get_state(self, date_folder: str) -> Dict[str, Any]:
+        """
+        读取缓存状态
+
+        Returns:
+            {"base_etag": str 或 None, "dirty": bool, "last_used": float}；
+            缓存数据库不存在或状态损坏时返回空字典
+        """
+        state_path = self._state_path(date_folder)
+        if not self.db_path(date_folder).exists() or not state_path.exists():
+            return {}
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def update_state(self, date_folder: str, **fields) -> None:
+        """更新缓存状态（同时刷新最近使用时间）"""
+        state = self.get_state(date_folder)
+        state.update(fields)
+        state["last_used"] = time.time()
+
+        state_path = self._state_path(date_folder)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = state_path.with_name(_STATE_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        tmp_path.replace(state_path)
+
+    def invalidate(self, date_folder: str) -> None:
+        """删除某个日期的缓存"""
+        shutil.rmtree(self.cache_dir / date_folder, ignore_errors=True)
+
+    def _entries(self) -> List[Tuple[float, int, str, bool]]:
+        """列出缓存条目: [(最近使用时间, 字节数, 日期, 是否有未同步的写入)]"""
+        entries = []
+        for date_dir in self.cache_dir.iterdir():
+            if not date_dir.is_dir() or not _DATE_DIR_PATTERN.match(date_dir.name):
+                continue
+            size = sum(f.stat().st_size for f in date_dir.rglob("*") if f.is_file())
+            state = self.get_state(date_dir.name)
+            last_used = state.get("last_used") or date_dir.stat().st_mtime
+            entries.append((last_used, size, date_dir.name, bool(state.get("dirty"))))
+        return entries
+
+    def evict(self, keep: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        按 LRU 淘汰缓存，直到总大小不超过上限
+
+        有未同步写入（dirty）的日期不会被淘汰：缓存是这些写入唯一的副本，
+        要等下次打开该日期、同步成功后才能删除。
+
+        Args:
+            keep: 不淘汰的日期（如当前仍在使用的日期）
+
+        Returns:
+            被淘汰的日期列表
+        """
+        if not self.max_bytes or not self.cache_dir.exists():
+            return []
+
+        keep = set(keep or [])
+        entries = self._entries()
+        total = sum(entry[1] for entry in entries)
+
+        evicted = []
+        blocked = []
+        for _, size, date_folder, dirty in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if date_folder in keep:
+                continue
+            if dirty:
+                blocked.append(date_folder)
+                continue
+            self.invalidate(date_folder)
+            total -= size
+            evicted.append(date_folder)
+
+        if evicted:
+            print(f"[远程存储] 缓存超过上限，已淘汰 {len(evicted)} 天: {', '.join(sorted(evicted))}")
+        if blocked and total > self.max_bytes:
+            print(
+                f"[远程存储] 警告: {len(blocked)} 天有未同步到远程的写入，未淘汰: "
+                f"{', '.join(sorted(blocked))}（缓存仍超过上限，请检查远程同步）"
+            )
+        return evicted
@@ -0,0 +1,277 @@
+# coding=utf-8
+"""
+本地文件系统 S3 替身
+
+实现 RemoteStorageBackend 用到的 S3 客户端接口子集，对象保存在本地目录中，
+用于测试和离线调试（endpoint_url 配置为 file:///path/to/dir 即可启用）：
+
+- put_object / get_object / head_object / delete_objects
+- upload_file / download_file
+- list_objects_v2 及其分页器
+- 对象元数据（Metadata）、ETag（内容 MD5）、ContentMD5 校验
+- 条件请求 IfMatch / IfNoneMatch
+- 范围读取 Range: bytes=start-end
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    from botocore.exceptions import ClientError
+except ImportError:
+    class ClientError(Exception):
+        """与 botocore.exceptions.ClientError 兼容的异常"""
+
+        def __init__(self, error_response: Dict, operation_name: str):
+            self.response = error_response
+            self.operation_name = operation_name
+            code = error_response.get("Error", {}).get("Code", "")
+            super().__init__(f"An error occurred ({code}) when calling the {operation_name} operation")
+
+
+_META_DIR = ".s3meta"
+
+
+def _error(code: str, operation: str, status: int) -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": code},
+            "ResponseMetadata": {"HTTPStatusCode": status},
+        },
+        operation,
+    )
+
+
+class _Paginator:
+    """list_objects_v2 分页器"""
+
+    def __init__(self, client: "FileSystemS3Client"):
+        self._client = client
+
+    def paginate(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        token = None
+        while True:
+            params = dict(kwargs)
+            if token:
+                params["ContinuationToken"] = token
+            page = self._client.list_objects_v2(**params)
+            yield page
+            if not page.get("IsTruncated"):
+                break
+            token = page.get("NextContinuationToken")
+
+
+class FileSystemS3Client:
+    """
+    基于本地目录的 S3 客户端替身
+
+    目录结构: <root>/<bucket>/<key>，元数据保存在 <root>/<bucket>/.s3meta/<key>.json
+    同一进程内的操作加锁串行化，保证条件写入的"检查 + 写入"是原子的。
+    """
+
+    def __init__(self, root: str):
+        if root.startswith("file://"):
+            root = root[len("file://"):]
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+
+    # === 内部工具 ===
+
+    def _object_path(self, bucket: str, key: str) -> Path:
+        return self.root / bucket / key
+
+    def _meta_path(self, bucket: str, key: str) -> Path:
+        return self.root / bucket / _META_DIR / f"{key}.json"
+
+    def _read_meta(self, bucket: str, key: str, operation: str) -> Dict[str, Any]:
+        meta_path = self._meta_path(bucket, key)
+        if not self._object_path(bucket, key).exists() or not meta_path.exists():
+            raise _error("NoSuchKey" if operation == "GetObject" else "404", operation, 404)
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _check_conditions(self, meta: Optional[Dict], operation: str, kwargs: Dict) -> None:
+        etag = meta["ETag"] if meta else None
+        if_match = kwargs.get("IfMatch")
+        if_none_match = kwargs.get("IfNoneMatch")
+
+        if if_match is not None and (etag is None or if_match.strip('"') != etag.strip('"')):
+            raise _error("PreconditionFailed", operation, 412)
+        if if_none_match is not None and etag is not None:
+            if if_none_match == "*":
+                raise _error("PreconditionFailed", operation, 412)
+            if if_none_match.strip('"') == etag.strip('"'):
+                if operation in ("GetObject", "HeadObject"):
+                    raise _error("304", operation, 304)
+                raise _error("PreconditionFailed", operation, 412)
+
+    def _write(self, bucket: str, key: str, data: bytes, metadata: Optional[Dict[str, str]]) -> str:
+        obj_path = self._object_path(bucket, key)
+        obj_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=obj_path.parent, prefix=".upload-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, obj_path)
+
+        etag = f'"{hashlib.md5(data).hexdigest()}"'
+        meta = {
+            "ETag": etag,
+            "ContentLength": len(data),
+            "LastModified": datetime.now(timezone.utc).isoformat(),
+            "Metadata": {k.lower(): str(v) for k, v in (metadata or {}).items()},
+        }
+        meta_path = self._meta_path(bucket, key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=meta_path.parent, prefix=".upload-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, meta_path)
+        return etag
+
+    def _response(self, meta: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "ETag": meta["ETag"],
+            "ContentLength": meta["ContentLength"],
+            "LastModified": datetime.fromisoformat(meta["LastModified"]),
+            "Metadata": dict(meta.get("Metadata", {})),
+        }
+
+    # === S3 接口 ===
+
+    def put_object(self, Bucket: str, Key: str, Body=b"", Metadata=None, ContentMD5=None, **kwargs) -> Dict:
+        data = Body.read() if hasattr(Body, "read") else bytes(Body)
+        if ContentMD5 and base64.b64encode(hashlib.md5(data).digest()).decode("ascii") != ContentMD5:
+            raise _error("BadDigest", "PutObject", 400)
+        with self._lock:
+            try:
+                current = self._read_meta(Bucket, Key, "PutObject")
+            except ClientError:
+                current = None
+            self._check_conditions(current, "PutObject", kwargs)
+            etag = self._write(Bucket, Key, data, Metadata)
+        return {"ETag": etag}
+
+    def get_object(self, Bucket: str, Key: str, **kwargs) -> Dict:
+        with self._lock:
+            meta = self._read_meta(Bucket, Key, "GetObject")
+            self._check_conditions(meta, "GetObject", kwargs)
+            response = self._response(meta)
+            with open(self._object_path(Bucket, Key), "rb") as f:
+                byte_range = kwargs.get("Range")
+                if byte_range:
+                    start, end = self._parse_range(byte_range, meta["ContentLength"])
+                    f.seek(start)
+                    data = f.read(end - start + 1)
+                    response["ContentRange"] = f"bytes {start}-{end}/{meta['ContentLength']}"
+                    response["ContentLength"] = len(data)
+                else:
+                    data = f.read()
+                response["Body"] = io.BytesIO(data)
+        return response
+
+    @staticmethod
+    def _parse_range(byte_range: str, size: int):
+        match = re.match(r"^bytes=(\d*)-(\d*)$", byte_range.strip())
+        if not match or (not match.group(1) and not match.group(2)):
+            raise _error("InvalidRange", "GetObject", 416)
+        if match.group(1):
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else size - 1
+        else:
+            # bytes=-N 表示最后 N 个字节
+            start = max(0, size - int(match.group(2)))
+            end = size - 1
+        end = min(end, size - 1)
+        if start >= size or start > end:
+            raise _error("InvalidRange", "GetObject", 416)
+        return start, end
+
+    def head_object(self, Bucket: str, Key: str, **kwargs) -> Dict:
+        meta = self._read_meta(Bucket, Key, "HeadObject")
+        self._check_conditions(meta, "HeadObject", kwargs)
+        return self._response(meta)
+
+    def upload_file(self, Filename: str, Bucket: str, Key: str, ExtraArgs=None, Config=None, Callback=None) -> None:
+        with open(Filename, "rb") as f:
+            data = f.read()
+        extra = ExtraArgs or {}
+        with self._lock:
+            self._write(Bucket, Key, data, extra.get("Metadata"))
+        if Callback:
+            Callback(len(data))
+
+    def download_file(self, Bucket: str, Key: str, Filename: str, ExtraArgs=None, Config=None, Callback=None) -> None:
+        response = self.get_object(Bucket, Key, **(ExtraArgs or {}))
+        data = response["Body"].read()
+        with open(Filename, "wb") as f:
+            f.write(data)
+        if Callback:
+            Callback(len(data))
+
+    def delete_objects(self, Bucket: str, Delete: Dict) -> Dict:
+        deleted = []
+        with self._lock:
+            for obj in Delete.get("Objects", []):
+                key = obj["Key"]
+                for path in (self._object_path(Bucket, key), self._meta_path(Bucket, key)):
+                    if path.exists():
+                        path.unlink()
+                deleted.append({"Key": key})
+        return {"Deleted": deleted}
+
+    def delete_object(self, Bucket: str, Key: str) -> Dict:
+        self.delete_objects(Bucket, {"Objects": [{"Key": Key}]})
+        return {}
+
+    def list_objects_v2(self, Bucket: str, Prefix: str = "", ContinuationToken: str = None,
+                        MaxKeys: int = 1000, **kwargs) -> Dict:
+        bucket_dir = self.root / Bucket
+        keys: List[str] = []
+        if bucket_dir.exists():
+            for path in bucket_dir.rglob("*"):
+                if not path.is_file():
+                    continue
+                rel = path.relative_to(bucket_dir).as_posix()
+                if rel.startswith(_META_DIR + "/") or path.name.startswith(".upload-"):
+                    continue
+                if rel.startswith(Prefix):
+                    keys.append(rel)
+        keys.sort()
+
+        start = 0
+        if ContinuationToken:
+            start = keys.index(ContinuationToken) if ContinuationToken in keys else len(keys)
+        page_keys = keys[start:start + MaxKeys]
+
+        contents = []
+        for key in page_keys:
+            meta = self._read_meta(Bucket, key, "ListObjectsV2")
+            contents.append({
+                "Key": key,
+                "Size": meta["ContentLength"],
+                "ETag": meta["ETag"],
+                "LastModified": datetime.fromisoformat(meta["LastModified"]),
+            })
+
+        page: Dict[str, Any] = {"KeyCount": len(contents), "IsTruncated": False}
+        if contents:
+            page["Contents"] = contents
+        if start + MaxKeys < len(keys):
+            page["IsTruncated"] = True
+            page["NextContinuationToken"] = keys[start + MaxKeys]
+        return page
+
+    def get_paginator(self, operation_name: str) -> _Paginator:
+        if operation_name != "list_objects_v2":
+            raise NotImplementedError(operation_name)
+        return _Paginator(self)
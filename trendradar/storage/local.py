@@ -12,9 +12,11 @@ import pytz
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 
-from trendradar.storage.base import StorageBackend, NewsItem, NewsData
+from trendradar.storage.base import StorageBackend, NewsItem, NewsData, compute_title_hash
+from trendradar.storage.schema import init_schema, iter_news_items
+from trendradar.storage.pool import SQLiteConnectionPool
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
@@ -38,6 +40,8 @@ class LocalStorageBackend(StorageBackend):
         enable_txt: bool = True,
         enable_html: bool = True,
         timezone: str = "Asia/Shanghai",
+        max_read_connections: int = 8,
+        idle_timeout: float = 300.0,
     ):
         """
         初始化本地存储后端
@@ -47,12 +51,18 @@ class LocalStorageBackend(StorageBackend):
             enable_txt: 是否启用 TXT 快照
             enable_html: 是否启用 HTML 报告
             timezone: 时区配置（默认 Asia/Shanghai）
+            max_read_connections: 读连接总数上限（多线程并发读取时生效）
+            idle_timeout: 空闲连接淘汰时间（秒），0 表示不淘汰
         """
         self.data_dir = Path(data_dir)
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
-        self._db_connections: Dict[str, sqlite3.Connection] = {}
+        self._pool = SQLiteConnectionPool(
+            init_func=self._init_tables,
+            max_readers=max_read_connections,
+            idle_timeout=idle_timeout,
+        )
 
     @property
     def backend_name(self) -> str:
@@ -81,17 +91,27 @@ class LocalStorageBackend(StorageBackend):
         db_dir.mkdir(parents=True, exist_ok=True)
         return db_dir / "news.db"
 
-    def _get_connection(self, date: Optional[str] = None) -> sqlite3.Connection:
-        """获取数据库连接（带缓存）"""
-        db_path = str(self._get_db_path(date))
+    def _get_connection(self, date: Optional[str] = None, write: bool = False):
+        """
+        借出数据库连接（上下文管理器）
+
+        读连接按线程复用；写连接每个数据库文件一个，写操作串行执行。
+
+        Args:
+            date: 日期字符串，默认为今天
+            write: 是否需要写连接
 
-        if db_path not in self._db_connections:
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            self._init_tables(conn)
-            self._db_connections[db_path] = conn
+        Returns:
+            产出 sqlite3.Connection 的上下文管理器
+        """
+        db_path = str(self._get_db_path(date))
+        if write:
+            return self._pool.writer(db_path)
+        return self._pool.reader(db_path)
 
-        return self._db_connections[db_path]
+    def get_pool_stats(self) -> dict:
+        """获取连接池统计信息"""
+        return self._pool.get_stats()
 
     def _get_schema_path(self) -> Path:
         """获取 schema.sql 文件路径"""
@@ -99,20 +119,11 @@ class LocalStorageBackend(StorageBackend):
 
     def _init_tables(self, conn: sqlite3.Connection) -> None:
         """从 schema.sql 初始化数据库表结构"""
-        schema_path = self._get_schema_path()
-        
-        if schema_path.exists():
-            with open(schema_path, "r", encoding="utf-8") as f:
-                schema_sql = f.read()
-            conn.executescript(schema_sql)
-        else:
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
-        
-        conn.commit()
+        init_schema(conn, self._get_schema_path())
 
     def save_news_data(self, data: NewsData) -> bool:
         """
-        保存新闻数据到 SQLite（以 URL 为唯一标识，支持标题更新检测）
+        保存新闻数据到 SQLite（以 URL / 标题哈希为唯一标识，支持标题更新检测）
 
         Args:
             data: 新闻数据
@@ -121,39 +132,45 @@ class LocalStorageBackend(StorageBackend):
             是否保存成功
         """
         try:
-            conn = self._get_connection(data.date)
-            cursor = conn.cursor()
+            with self._get_connection(data.date, write=True) as conn:
+                cursor = conn.cursor()
 
-            # 获取配置时区的当前时间
-            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+                # 获取配置时区的当前时间
+                now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 首先同步平台信息到 platforms 表
-            for source_id, source_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO platforms (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (source_id, source_name, now_str))
+                # 首先同步平台信息到 platforms 表
+                for source_id, source_name in data.id_to_name.items():
+                    cursor.execute("""
+                        INSERT INTO platforms (id, name, updated_at)
+                        VALUES (?, ?, ?)
+                        ON CONFLICT(id) DO UPDATE SET
+                            name = excluded.name,
+                            updated_at = excluded.updated_at
+                    """, (source_id, source_name, now_str))
 
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-            title_changed_count = 0
-            success_sources = []
+                # 统计计数器
+                new_count = 0
+                updated_count = 0
+                title_changed_count = 0
+                success_sources = []
 
-            for source_id, news_list in data.items.items():
-                success_sources.append(source_id)
+                for source_id, news_list in data.items.items():
+                    success_sources.append(source_id)
 
-                for item in news_list:
-                    try:
-                        # 检查是否已存在（通过 URL + platform_id）
-                        if item.url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (item.url, source_id))
+                    for item in news_list:
+                        try:
+                            # 检查是否已存在（有 URL 用 URL + platform_id，无 URL 用 title_hash）
+                            title_hash = compute_title_hash(source_id, item.title)
+                            if item.url:
+                                cursor.execute("""
+                                    SELECT id, title FROM news_items
+                                    WHERE url = ? AND platform_id = ?
+                                """, (item.url, source_id))
+                            else:
+                                cursor.execute("""
+                                    SELECT id, title FROM news_items
+                                    WHERE title_hash = ? AND url = ''
+                                """, (title_hash,))
                             existing = cursor.fetchone()
 
                             if existing:
@@ -181,13 +198,14 @@ class LocalStorageBackend(StorageBackend):
                                 cursor.execute("""
                                     UPDATE news_items SET
                                         title = ?,
+                                        title_hash = ?,
                                         rank = ?,
                                         mobile_url = ?,
                                         last_crawl_time = ?,
                                         crawl_count = crawl_count + 1,
                                         updated_at = ?
                                     WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
+                                """, (item.title, title_hash, item.rank, item.mobile_url,
                                       data.crawl_time, now_str, existing_id))
                                 updated_count += 1
                             else:
@@ -196,11 +214,11 @@ class LocalStorageBackend(StorageBackend):
                                     INSERT INTO news_items
                                     (title, platform_id, rank, url, mobile_url,
                                      first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+                                     title_hash, created_at, updated_at)
+                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?)
                                 """, (item.title, source_id, item.rank, item.url,
                                       item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
+                                      title_hash, now_str, now_str))
                                 new_id = cursor.lastrowid
                                 # 记录初始排名
                                 cursor.execute("""
@@ -209,79 +227,60 @@ class LocalStorageBackend(StorageBackend):
                                     VALUES (?, ?, ?, ?)
                                 """, (new_id, item.rank, data.crawl_time, now_str))
                                 new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, item.url,
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"保存新闻条目失败 [{item.title[:30]}...]: {e}")
-
-            total_items = new_count + updated_count
-
-            # 记录抓取信息
-            cursor.execute("""
-                INSERT OR REPLACE INTO crawl_records
-                (crawl_time, total_items, created_at)
-                VALUES (?, ?, ?)
-            """, (data.crawl_time, total_items, now_str))
-
-            # 获取刚插入的 crawl_record 的 ID
-            cursor.execute("""
-                SELECT id FROM crawl_records WHERE crawl_time = ?
-            """, (data.crawl_time,))
-            record_row = cursor.fetchone()
-            if record_row:
-                crawl_record_id = record_row[0]
-
-                # 记录成功的来源
-                for source_id in success_sources:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, source_id))
-
-                # 记录失败的来源
-                for failed_id in data.failed_ids:
-                    # 确保失败的平台也在 platforms 表中
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO platforms (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
 
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+                        except sqlite3.Error as e:
+                            print(f"保存新闻条目失败 [{item.title[:30]}...]: {e}")
 
-            conn.commit()
+                total_items = new_count + updated_count
 
-            # 输出详细的存储统计日志
-            log_parts = [f"[本地存储] 处理完成：新增 {new_count} 条"]
-            if updated_count > 0:
-                log_parts.append(f"更新 {updated_count} 条")
-            if title_changed_count > 0:
-                log_parts.append(f"标题变更 {title_changed_count} 条")
-            print("，".join(log_parts))
+                # 记录抓取信息
+                cursor.execute("""
+                    INSERT OR REPLACE INTO crawl_records
+                    (crawl_time, total_items, created_at)
+                    VALUES (?, ?, ?)
+                """, (data.crawl_time, total_items, now_str))
 
-            return True
+                # 获取刚插入的 crawl_record 的 ID
+                cursor.execute("""
+                    SELECT id FROM crawl_records WHERE crawl_time = ?
+                """, (data.crawl_time,))
+                record_row = cursor.fetchone()
+                if record_row:
+                    crawl_record_id = record_row[0]
+
+                    # 记录成功的来源
+                    for source_id in success_sources:
+                        cursor.execute("""
+                            INSERT OR REPLACE INTO crawl_source_status
+                            (crawl_record_id, platform_id, status)
+                            VALUES (?, ?, 'success')
+                        """, (crawl_record_id, source_id))
+
+                    # 记录失败的来源
+                    for failed_id in data.failed_ids:
+                        # 确保失败的平台也在 platforms 表中
+                        cursor.execute("""
+                            INSERT OR IGNORE INTO platforms (id, name, updated_at)
+                            VALUES (?, ?, ?)
+                        """, (failed_id, failed_id, now_str))
+
+                        cursor.execute("""
+                            INSERT OR REPLACE INTO crawl_source_status
+                            (crawl_record_id, platform_id, status)
+                            VALUES (?, ?, 'failed')
+                        """, (crawl_record_id, failed_id))
+
+                conn.commit()
+
+                # 输出详细的存储统计日志
+                log_parts = [f"[本地存储] 处理完成：新增 {new_count} 条"]
+                if updated_count > 0:
+                    log_parts.append(f"更新 {updated_count} 条")
+                if title_changed_count > 0:
+                    log_parts.append(f"标题变更 {title_changed_count} 条")
+                print("，".join(log_parts))
+
+                return True
 
         except Exception as e:
             print(f"[本地存储] 保存失败: {e}")
@@ -302,108 +301,132 @@ class LocalStorageBackend(StorageBackend):
             if not db_path.exists():
                 return None
 
-            conn = self._get_connection(date)
-            cursor = conn.cursor()
-
-            # 获取所有新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
-                SELECT n.id, n.title, n.platform_id, p.name as platform_name,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-                ORDER BY n.platform_id, n.last_crawl_time
-            """)
-
-            rows = cursor.fetchall()
-            if not rows:
-                return None
+            with self._get_connection(date) as conn:
+                cursor = conn.cursor()
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
-            # 按 platform_id 分组
-            items: Dict[str, List[NewsItem]] = {}
-            id_to_name: Dict[str, str] = {}
-            crawl_date = self._format_date_folder(date)
-
-            for row in rows:
-                news_id = row[0]
-                platform_id = row[2]
-                title = row[1]
-                platform_name = row[3] or platform_id
-
-                id_to_name[platform_id] = platform_name
-
-                if platform_id not in items:
-                    items[platform_id] = []
-
-                # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-
-                items[platform_id].append(NewsItem(
-                    title=title,
-                    source_id=platform_id,
-                    source_name=platform_name,
-                    rank=row[4],
-                    url=row[5] or "",
-                    mobile_url=row[6] or "",
-                    crawl_time=row[8],  # last_crawl_time
-                    ranks=ranks,
-                    first_time=row[7],  # first_crawl_time
-                    last_time=row[8],   # last_crawl_time
-                    count=row[9],       # crawl_count
-                ))
-
-            final_items = items
-
-            # 获取失败的来源
-            cursor.execute("""
-                SELECT DISTINCT css.platform_id
-                FROM crawl_source_status css
-                JOIN crawl_records cr ON css.crawl_record_id = cr.id
-                WHERE css.status = 'failed'
-            """)
-            failed_ids = [row[0] for row in cursor.fetchall()]
-
-            # 获取最新的抓取时间
-            cursor.execute("""
-                SELECT crawl_time FROM crawl_records
-                ORDER BY crawl_time DESC
-                LIMIT 1
-            """)
-
-            time_row = cursor.fetchone()
-            crawl_time = time_row[0] if time_row else self._format_time_filename()
-
-            return NewsData(
-                date=crawl_date,
-                crawl_time=crawl_time,
-                items=final_items,
-                id_to_name=id_to_name,
-                failed_ids=failed_ids,
-            )
+                # 获取所有新闻数据（包含 id 用于查询排名历史）
+                cursor.execute("""
+                    SELECT n.id, n.title, n.platform_id, p.name as platform_name,
+                           n.rank, n.url, n.mobile_url,
+                           n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                    FROM news_items n
+                    LEFT JOIN platforms p ON n.platform_id = p.id
+                    ORDER BY n.platform_id, n.last_crawl_time
+                """)
+
+                rows = cursor.fetchall()
+                if not rows:
+                    return None
+
+                # 收集所有 news_item_id
+                news_ids = [row[0] for row in rows]
+
+                # 批量查询排名历史
+                rank_history_map: Dict[int, List[int]] = {}
+                if news_ids:
+                    placeholders = ",".join("?" * len(news_ids))
+                    cursor.execute(f"""
+                        SELECT news_item_id, rank FROM rank_history
+                        WHERE news_item_id IN ({placeholders})
+                        ORDER BY news_item_id, crawl_time
+                    """, news_ids)
+                    for rh_row in cursor.fetchall():
+                        news_id, rank = rh_row[0], rh_row[1]
+                        if news_id not in rank_history_map:
+                            rank_history_map[news_id] = []
+                        if rank not in rank_history_map[news_id]:
+                            rank_history_map[news_id].append(rank)
+
+                # 按 platform_id 分组
+                items: Dict[str, List[NewsItem]] = {}
+                id_to_name: Dict[str, str] = {}
+                crawl_date = self._format_date_folder(date)
+
+                for row in rows:
+                    news_id = row[0]
+                    platform_id = row[2]
+                    title = row[1]
+                    platform_name = row[3] or platform_id
+
+                    id_to_name[platform_id] = platform_name
+
+                    if platform_id not in items:
+                        items[platform_id] = []
+
+                    # 获取排名历史，如果没有则使用当前排名
+                    ranks = rank_history_map.get(news_id, [row[4]])
+
+                    items[platform_id].append(NewsItem(
+                        title=title,
+                        source_id=platform_id,
+                        source_name=platform_name,
+                        rank=row[4],
+                        url=row[5] or "",
+                        mobile_url=row[6] or "",
+                        crawl_time=row[8],  # last_crawl_time
+                        ranks=ranks,
+                        first_time=row[7],  # first_crawl_time
+                        last_time=row[8],   # last_crawl_time
+                        count=row[9],       # crawl_count
+                    ))
+
+                final_items = items
+
+                # 获取失败的来源
+                cursor.execute("""
+                    SELECT DISTINCT css.platform_id
+                    FROM crawl_source_status css
+                    JOIN crawl_records cr ON css.crawl_record_id = cr.id
+                    WHERE css.status = 'failed'
+                """)
+                failed_ids = [row[0] for row in cursor.fetchall()]
+
+                # 获取最新的抓取时间
+                cursor.execute("""
+                    SELECT crawl_time FROM crawl_records
+                    ORDER BY crawl_time DESC
+                    LIMIT 1
+                """)
+
+                time_row = cursor.fetchone()
+                crawl_time = time_row[0] if time_row else self._format_time_filename()
+
+                return NewsData(
+                    date=crawl_date,
+                    crawl_time=crawl_time,
+                    items=final_items,
+                    id_to_name=id_to_name,
+                    failed_ids=failed_ids,
+                )
 
         except Exception as e:
             print(f"[本地存储] 读取数据失败: {e}")
             return None
 
+    def iter_items(
+        self,
+        date: Optional[str] = None,
+        platforms: Optional[List[str]] = None,
+        since: Optional[str] = None,
+    ) -> Iterator[NewsItem]:
+        """
+        逐条遍历指定日期的新闻条目（直接从游标读取，不构建 NewsData）
+
+        Args:
+            date: 日期字符串，默认为今天
+            platforms: 只返回这些平台的条目，None 表示全部
+            since: 只返回最后出现时间不早于该抓取时间的条目
+
+        Yields:
+            NewsItem
+        """
+        db_path = self._get_db_path(date)
+        if not db_path.exists():
+            return
+
+        with self._get_connection(date) as conn:
+            yield from iter_news_items(conn, platforms, since)
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """
         获取最新一次抓取的数据
@@ -419,102 +442,102 @@ class LocalStorageBackend(StorageBackend):
             if not db_path.exists():
                 return None
 
-            conn = self._get_connection(date)
-            cursor = conn.cursor()
-
-            # 获取最新的抓取时间
-            cursor.execute("""
-                SELECT crawl_time FROM crawl_records
-                ORDER BY crawl_time DESC
-                LIMIT 1
-            """)
-
-            time_row = cursor.fetchone()
-            if not time_row:
-                return None
+            with self._get_connection(date) as conn:
+                cursor = conn.cursor()
 
-            latest_time = time_row[0]
+                # 获取最新的抓取时间
+                cursor.execute("""
+                    SELECT crawl_time FROM crawl_records
+                    ORDER BY crawl_time DESC
+                    LIMIT 1
+                """)
 
-            # 获取该时间的新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
-                SELECT n.id, n.title, n.platform_id, p.name as platform_name,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-                WHERE n.last_crawl_time = ?
-            """, (latest_time,))
+                time_row = cursor.fetchone()
+                if not time_row:
+                    return None
 
-            rows = cursor.fetchall()
-            if not rows:
-                return None
+                latest_time = time_row[0]
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
-            items: Dict[str, List[NewsItem]] = {}
-            id_to_name: Dict[str, str] = {}
-            crawl_date = self._format_date_folder(date)
-
-            for row in rows:
-                news_id = row[0]
-                platform_id = row[2]
-                platform_name = row[3] or platform_id
-                id_to_name[platform_id] = platform_name
-
-                if platform_id not in items:
-                    items[platform_id] = []
-
-                # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-
-                items[platform_id].append(NewsItem(
-                    title=row[1],
-                    source_id=platform_id,
-                    source_name=platform_name,
-                    rank=row[4],
-                    url=row[5] or "",
-                    mobile_url=row[6] or "",
-                    crawl_time=row[8],  # last_crawl_time
-                    ranks=ranks,
-                    first_time=row[7],  # first_crawl_time
-                    last_time=row[8],   # last_crawl_time
-                    count=row[9],       # crawl_count
-                ))
-
-            # 获取失败的来源（针对最新一次抓取）
-            cursor.execute("""
-                SELECT css.platform_id
-                FROM crawl_source_status css
-                JOIN crawl_records cr ON css.crawl_record_id = cr.id
-                WHERE cr.crawl_time = ? AND css.status = 'failed'
-            """, (latest_time,))
-
-            failed_ids = [row[0] for row in cursor.fetchall()]
-
-            return NewsData(
-                date=crawl_date,
-                crawl_time=latest_time,
-                items=items,
-                id_to_name=id_to_name,
-                failed_ids=failed_ids,
-            )
+                # 获取该时间的新闻数据（包含 id 用于查询排名历史）
+                cursor.execute("""
+                    SELECT n.id, n.title, n.platform_id, p.name as platform_name,
+                           n.rank, n.url, n.mobile_url,
+                           n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                    FROM news_items n
+                    LEFT JOIN platforms p ON n.platform_id = p.id
+                    WHERE n.last_crawl_time = ?
+                """, (latest_time,))
+
+                rows = cursor.fetchall()
+                if not rows:
+                    return None
+
+                # 收集所有 news_item_id
+                news_ids = [row[0] for row in rows]
+
+                # 批量查询排名历史
+                rank_history_map: Dict[int, List[int]] = {}
+                if news_ids:
+                    placeholders = ",".join("?" * len(news_ids))
+                    cursor.execute(f"""
+                        SELECT news_item_id, rank FROM rank_history
+                        WHERE news_item_id IN ({placeholders})
+                        ORDER BY news_item_id, crawl_time
+                    """, news_ids)
+                    for rh_row in cursor.fetchall():
+                        news_id, rank = rh_row[0], rh_row[1]
+                        if news_id not in rank_history_map:
+                            rank_history_map[news_id] = []
+                        if rank not in rank_history_map[news_id]:
+                            rank_history_map[news_id].append(rank)
+
+                items: Dict[str, List[NewsItem]] = {}
+                id_to_name: Dict[str, str] = {}
+                crawl_date = self._format_date_folder(date)
+
+                for row in rows:
+                    news_id = row[0]
+                    platform_id = row[2]
+                    platform_name = row[3] or platform_id
+                    id_to_name[platform_id] = platform_name
+
+                    if platform_id not in items:
+                        items[platform_id] = []
+
+                    # 获取排名历史，如果没有则使用当前排名
+                    ranks = rank_history_map.get(news_id, [row[4]])
+
+                    items[platform_id].append(NewsItem(
+                        title=row[1],
+                        source_id=platform_id,
+                        source_name=platform_name,
+                        rank=row[4],
+                        url=row[5] or "",
+                        mobile_url=row[6] or "",
+                        crawl_time=row[8],  # last_crawl_time
+                        ranks=ranks,
+                        first_time=row[7],  # first_crawl_time
+                        last_time=row[8],   # last_crawl_time
+                        count=row[9],       # crawl_count
+                    ))
+
+                # 获取失败的来源（针对最新一次抓取）
+                cursor.execute("""
+                    SELECT css.platform_id
+                    FROM crawl_source_status css
+                    JOIN crawl_records cr ON css.crawl_record_id = cr.id
+                    WHERE cr.crawl_time = ? AND css.status = 'failed'
+                """, (latest_time,))
+
+                failed_ids = [row[0] for row in cursor.fetchall()]
+
+                return NewsData(
+                    date=crawl_date,
+                    crawl_time=latest_time,
+                    items=items,
+                    id_to_name=id_to_name,
+                    failed_ids=failed_ids,
+                )
 
         except Exception as e:
             print(f"[本地存储] 获取最新数据失败: {e}")
@@ -531,27 +554,21 @@ class LocalStorageBackend(StorageBackend):
             新增的标题数据 {source_id: {title: NewsItem}}
         """
         try:
-            # 获取历史数据
-            historical_data = self.get_today_all_data(current_data.date)
-
-            if not historical_data:
-                # 没有历史数据，所有都是新的
-                new_titles = {}
-                for source_id, news_list in current_data.items.items():
-                    new_titles[source_id] = {item.title: item for item in news_list}
-                return new_titles
-
-            # 收集历史标题
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = {item.title for item in news_list}
-
-            # 检测新增
+            # 直接读取历史标题哈希，无需加载完整数据
+            historical_hashes: set = set()
+            if self._get_db_path(current_data.date).exists():
+                with self._get_connection(current_data.date) as conn:
+                    cursor = conn.execute("""
+                        SELECT DISTINCT title_hash FROM news_items
+                        WHERE title_hash IS NOT NULL
+                    """)
+                    historical_hashes = {row[0] for row in cursor.fetchall()}
+
+            # 检测新增（没有历史数据时所有标题都是新的）
             new_titles = {}
             for source_id, news_list in current_data.items.items():
-                hist_set = historical_titles.get(source_id, set())
                 for item in news_list:
-                    if item.title not in hist_set:
+                    if compute_title_hash(source_id, item.title) not in historical_hashes:
                         if source_id not in new_titles:
                             new_titles[source_id] = {}
                         new_titles[source_id][item.title] = item
@@ -665,18 +682,18 @@ class LocalStorageBackend(StorageBackend):
             if not db_path.exists():
                 return True
 
-            conn = self._get_connection(date)
-            cursor = conn.cursor()
+            with self._get_connection(date) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM crawl_records
-            """)
+                cursor.execute("""
+                    SELECT COUNT(*) as count FROM crawl_records
+                """)
 
-            row = cursor.fetchone()
-            count = row[0] if row else 0
+                row = cursor.fetchone()
+                count = row[0] if row else 0
 
-            # 如果只有一条或没有记录，视为第一次抓取
-            return count <= 1
+                # 如果只有一条或没有记录，视为第一次抓取
+                return count <= 1
 
         except Exception as e:
             print(f"[本地存储] 检查首次抓取失败: {e}")
@@ -697,31 +714,32 @@ class LocalStorageBackend(StorageBackend):
             if not db_path.exists():
                 return []
 
-            conn = self._get_connection(date)
-            cursor = conn.cursor()
+            with self._get_connection(date) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT crawl_time FROM crawl_records
-                ORDER BY crawl_time
-            """)
+                cursor.execute("""
+                    SELECT crawl_time FROM crawl_records
+                    ORDER BY crawl_time
+                """)
 
-            rows = cursor.fetchall()
-            return [row[0] for row in rows]
+                rows = cursor.fetchall()
+                return [row[0] for row in rows]
 
         except Exception as e:
             print(f"[本地存储] 获取抓取时间列表失败: {e}")
             return []
 
     def cleanup(self) -> None:
-        """清理资源（关闭数据库连接）"""
-        for db_path, conn in self._db_connections.items():
-            try:
-                conn.close()
-                print(f"[本地存储] 关闭数据库连接: {db_path}")
-            except Exception as e:
-                print(f"[本地存储] 关闭连接失败 {db_path}: {e}")
+        """清理资源（关闭连接池中的所有数据库连接）"""
+        pool = getattr(self, "_pool", None)
+        if pool is None:
+            return
 
-        self._db_connections.clear()
+        try:
+            for db_path, count in pool.close_all().items():
+                print(f"[本地存储] 关闭数据库连接: {db_path} ({count} 个)")
+        except Exception as e:
+            print(f"[本地存储] 关闭连接失败: {e}")
 
     def cleanup_old_data(self, retention_days: int) -> int:
         """
@@ -775,12 +793,10 @@ class LocalStorageBackend(StorageBackend):
                 if folder_date and folder_date < cutoff_date:
                     # 先关闭该日期的数据库连接
                     db_path = str(self._get_db_path(date_folder.name))
-                    if db_path in self._db_connections:
-                        try:
-                            self._db_connections[db_path].close()
-                            del self._db_connections[db_path]
-                        except Exception:
-                            pass
+                    try:
+                        self._pool.close_path(db_path)
+                    except Exception:
+                        pass
 
                     # 删除整个日期目录
                     try:
@@ -810,19 +826,19 @@ class LocalStorageBackend(StorageBackend):
             是否已推送
         """
         try:
-            conn = self._get_connection(date)
-            cursor = conn.cursor()
+            with self._get_connection(date) as conn:
+                cursor = conn.cursor()
 
-            target_date = self._format_date_folder(date)
+                target_date = self._format_date_folder(date)
 
-            cursor.execute("""
-                SELECT pushed FROM push_records WHERE date = ?
-            """, (target_date,))
+                cursor.execute("""
+                    SELECT pushed FROM push_records WHERE date = ?
+                """, (target_date,))
 
-            row = cursor.fetchone()
-            if row:
-                return bool(row[0])
-            return False
+                row = cursor.fetchone()
+                if row:
+                    return bool(row[0])
+                return False
 
         except Exception as e:
             print(f"[本地存储] 检查推送记录失败: {e}")
@@ -840,25 +856,25 @@ class LocalStorageBackend(StorageBackend):
             是否记录成功
         """
         try:
-            conn = self._get_connection(date)
-            cursor = conn.cursor()
+            with self._get_connection(date, write=True) as conn:
+                cursor = conn.cursor()
 
-            target_date = self._format_date_folder(date)
-            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+                target_date = self._format_date_folder(date)
+                now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            cursor.execute("""
-                INSERT INTO push_records (date, pushed, push_time, report_type, created_at)
-                VALUES (?, 1, ?, ?, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    pushed = 1,
-                    push_time = excluded.push_time,
-                    report_type = excluded.report_type
-            """, (target_date, now_str, report_type, now_str))
+                cursor.execute("""
+                    INSERT INTO push_records (date, pushed, push_time, report_type, created_at)
+                    VALUES (?, 1, ?, ?, ?)
+                    ON CONFLICT(date) DO UPDATE SET
+                        pushed = 1,
+                        push_time = excluded.push_time,
+                        report_type = excluded.report_type
+                """, (target_date, now_str, report_type, now_str))
 
-            conn.commit()
+                conn.commit()
 
-            print(f"[本地存储] 推送记录已保存: {report_type} at {now_str}")
-            return True
+                print(f"[本地存储] 推送记录已保存: {report_type} at {now_str}")
+                return True
 
         except Exception as e:
             print(f"[本地存储] 记录推送失败: {e}")
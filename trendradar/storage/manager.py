@@ -6,9 +6,9 @@
 """
 
 import os
-from typing import Optional
+from typing import Iterator, List, Optional
 
-from trendradar.storage.base import StorageBackend, NewsData
+from trendradar.storage.base import StorageBackend, NewsItem, NewsData
 
 
 # 存储管理器单例
@@ -38,6 +38,8 @@ class StorageManager:
         pull_enabled: bool = False,
         pull_days: int = 0,
         timezone: str = "Asia/Shanghai",
+        max_read_connections: int = 8,
+        idle_timeout: float = 300.0,
     ):
         """
         初始化存储管理器
@@ -47,12 +49,14 @@ class StorageManager:
             data_dir: 本地数据目录
             enable_txt: 是否启用 TXT 快照
             enable_html: 是否启用 HTML 报告
-            remote_config: 远程存储配置（endpoint_url, bucket_name, access_key_id 等）
+            remote_config: 远程存储配置（endpoint_url, bucket_name, access_key_id, compact_segments, compression, pull_workers 等）
             local_retention_days: 本地数据保留天数（0 = 无限制）
             remote_retention_days: 远程数据保留天数（0 = 无限制）
             pull_enabled: 是否启用启动时自动拉取
             pull_days: 拉取最近 N 天的数据
             timezone: 时区配置（默认 Asia/Shanghai）
+            max_read_connections: 本地 SQLite 读连接总数上限
+            idle_timeout: 本地 SQLite 空闲连接淘汰时间（秒），0 表示不淘汰
         """
         self.backend_type = backend_type
         self.data_dir = data_dir
@@ -64,6 +68,8 @@ class StorageManager:
         self.pull_enabled = pull_enabled
         self.pull_days = pull_days
         self.timezone = timezone
+        self.max_read_connections = max_read_connections
+        self.idle_timeout = idle_timeout
 
         self._backend: Optional[StorageBackend] = None
         self._remote_backend: Optional[StorageBackend] = None
@@ -137,6 +143,11 @@ class StorageManager:
                 enable_txt=self.enable_txt,
                 enable_html=self.enable_html,
                 timezone=self.timezone,
+                compact_segments=self.remote_config.get("compact_segments", 8),
+                compression=self.remote_config.get("compression", "gzip"),
+                pull_workers=self.remote_config.get("pull_workers", 4),
+                cache_dir=self.remote_config.get("cache_dir") or None,
+                cache_max_mb=self.remote_config.get("cache_max_mb", 512),
             )
         except ImportError as e:
             print(f"[存储管理器] 远程后端导入失败: {e}")
@@ -167,6 +178,8 @@ class StorageManager:
                     enable_txt=self.enable_txt,
                     enable_html=self.enable_html,
                     timezone=self.timezone,
+                    max_read_connections=self.max_read_connections,
+                    idle_timeout=self.idle_timeout,
                 )
                 print(f"[存储管理器] 使用本地存储后端 (数据目录: {self.data_dir})")
 
@@ -205,6 +218,19 @@ class StorageManager:
         """获取当天所有数据"""
         return self.get_backend().get_today_all_data(date)
 
+    def iter_items(
+        self,
+        date: Optional[str] = None,
+        platforms: Optional[List[str]] = None,
+        since: Optional[str] = None,
+    ) -> Iterator[NewsItem]:
+        """逐条遍历当天新闻条目"""
+        return self.get_backend().iter_items(date, platforms, since)
+
+    def get_crawl_times(self, date: Optional[str] = None) -> List[str]:
+        """获取当天所有抓取时间"""
+        return self.get_backend().get_crawl_times(date)
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取最新抓取数据"""
         return self.get_backend().get_latest_crawl_data(date)
@@ -276,6 +302,8 @@ def get_storage_manager(
     pull_enabled: bool = False,
     pull_days: int = 0,
     timezone: str = "Asia/Shanghai",
+    max_read_connections: int = 8,
+    idle_timeout: float = 300.0,
     force_new: bool = False,
 ) -> StorageManager:
     """
@@ -292,6 +320,8 @@ def get_storage_manager(
         pull_enabled: 是否启用启动时自动拉取
         pull_days: 拉取最近 N 天的数据
         timezone: 时区配置（默认 Asia/Shanghai）
+        max_read_connections: 本地 SQLite 读连接总数上限
+        idle_timeout: 本地 SQLite 空闲连接淘汰时间（秒）
         force_new: 是否强制创建新实例
 
     Returns:
@@ -311,6 +341,8 @@ def get_storage_manager(
             pull_enabled=pull_enabled,
             pull_days=pull_days,
             timezone=timezone,
+            max_read_connections=max_read_connections,
+            idle_timeout=idle_timeout,
         )
 
     return _storage_manager
@@ -0,0 +1,315 @@
+# coding=utf-8
+"""
+远程存储清单（manifest）
+
+在存储桶中维护一个小型 JSON 对象 news/manifest.json，记录每个日期的概要信息：
+
+    {
+      "version": 2,
+      "updated_at": "2025-01-01 12:00:00",
+      "dates": {
+        "2025-01-01": {
+          "etag": "...",              # 基础库 ETag
+          "size": 123456,             # 数据库原始大小（字节）
+          "stored_size": 23456,       # 基础库压缩后大小（字节）
+          "segments": 2,              # 未压缩进基础库的变更分段数
+          "item_count": 1200,
+          "crawl_count": 24,
+          "last_crawl_time": "23-30",
+          "updated_at": "2025-01-01 23:31:02"
+        }
+      },
+      "legacy": {                     # 旧中文命名的数据库对象（只用于过期清理）
+        "news/2024年12月01日.db": "2024-12-01"
+      }
+    }
+
+列出日期、过期清理、状态查询只需一次 GET 读取清单，无需遍历整个 news/ 前缀。
+清单通过条件写入（If-Match / If-None-Match）做乐观并发更新，冲突时重新读取后重试；
+清单丢失、损坏或版本过旧时由对象列表重建。存储服务不支持条件写入时退化为普通写入。
+"""
+
+import json
+import re
+import sqlite3
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from botocore.exceptions import ParamValidationError
+    HAS_BOTOCORE = True
+except ImportError:
+    ParamValidationError = None
+    HAS_BOTOCORE = False
+
+
+MANIFEST_KEY = "news/manifest.json"
+MANIFEST_VERSION = 2
+
+# 数据库对象键：基础库 news/YYYY-MM-DD.db、变更分段 news/YYYY-MM-DD/<分段>.db
+_DB_KEY = re.compile(r"news/(\d{4}-\d{2}-\d{2})(\.db|/[^/]+\.db)$")
+# 旧中文命名的基础库 news/YYYY年MM月DD日.db
+_LEGACY_DB_KEY = re.compile(r"news/(\d{4})年(\d{2})月(\d{2})日\.db$")
+
+# 条件写入冲突的错误码（S3 返回 412，部分实现返回 409）
+_CONFLICT_CODES = ("PreconditionFailed", "ConditionalRequestConflict", "412", "409")
+# 服务端不支持条件写入的错误码
+_UNSUPPORTED_CODES = ("NotImplemented", "501")
+# botocore 过旧时 PutObject 不认识条件写入参数
+_UNKNOWN_CONDITION_PARAM = re.compile(r'Unknown parameter in input: "(IfMatch|IfNoneMatch)"')
+
+
+def _error_code(error: Exception) -> str:
+    response = getattr(error, "response", None) or {}
+    return str(response.get("Error", {}).get("Code", ""))
+
+
+def is_conflict_error(error: Exception) -> bool:
+    """判断是否为条件写入冲突（If-Match / If-None-Match 不满足）"""
+    return _error_code(error) in _CONFLICT_CODES
+
+
+def is_conditional_write_unsupported(error: Exception) -> bool:
+    """判断是否为存储服务或 SDK 不支持条件写入（而不是条件不满足）"""
+    if HAS_BOTOCORE and isinstance(error, ParamValidationError):
+        return bool(_UNKNOWN_CONDITION_PARAM.search(str(error)))
+    if _error_code(error) in _UNSUPPORTED_CODES:
+        return True
+    response = getattr(error, "response", None) or {}
+    return response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 501
+
+
+def put_object_conditional(
+    s3_client, conditions: Optional[Dict[str, str]], **request
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    条件写入对象；存储服务或 SDK 不支持条件写入时打印警告并改为普通写入
+
+    Args:
+        s3_client: S3 客户端
+        conditions: 条件写入参数（IfMatch / IfNoneMatch），为空时直接普通写入
+        **request: put_object 的其余参数（Body 为文件对象时重试前会回到开头）
+
+    Returns:
+        (put_object 响应, 条件写入是否生效)
+    """
+    if conditions:
+        try:
+            return s3_client.put_object(**request, **conditions), True
+        except Exception as e:
+            if not is_conditional_write_unsupported(e):
+                raise
+            print(
+                f"[远程存储] 警告: 存储服务不支持条件写入，改为普通写入"
+                f"（多节点同时写入时可能互相覆盖）: {e}"
+            )
+            body = request.get("Body")
+            if hasattr(body, "seek"):
+                body.seek(0)
+    return s3_client.put_object(**request), False
+
+
+def empty_manifest() -> Dict[str, Any]:
+    """创建空清单"""
+    return {"version": MANIFEST_VERSION, "updated_at": "", "dates": {}, "legacy": {}}
+
+
+def scan_objects(list_pages) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """
+    从对象列表统计每个日期的基础库和变更分段
+
+    Args:
+        list_pages: list_objects_v2 分页结果（Prefix="news/"）
+
+    Returns:
+        ({日期: {"etag", "stored_size", "segments"}}, {旧中文命名对象键: 日期})
+    """
+    listed: Dict[str, Dict[str, Any]] = {}
+    legacy: Dict[str, str] = {}
+    for page in list_pages:
+        for obj in page.get("Contents", []):
+            key = obj["Key"]
+            match = _DB_KEY.match(key)
+            if not match:
+                legacy_match = _LEGACY_DB_KEY.match(key)
+                if legacy_match:
+                    legacy[key] = "-".join(legacy_match.groups())
+                continue
+            entry = listed.setdefault(match.group(1), {"segments": 0})
+            if match.group(2) == ".db":
+                entry["etag"] = obj.get("ETag", "").strip('"')
+                entry["stored_size"] = obj.get("Size", 0)
+            else:
+                entry["segments"] += 1
+    return listed, legacy
+
+
+def collect_day_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """
+    从当日数据库统计清单条目
+
+    Returns:
+        {"item_count", "crawl_count", "last_crawl_time"}
+    """
+    item_count = conn.execute("SELECT COUNT(*) FROM news_items").fetchone()[0]
+    crawl_count, last_crawl_time = conn.execute(
+        "SELECT COUNT(*), MAX(crawl_time) FROM crawl_records"
+    ).fetchone()
+    return {
+        "item_count": item_count,
+        "crawl_count": crawl_count,
+        "last_crawl_time": last_crawl_time,
+    }
+
+
+class RemoteManifest:
+    """远程清单的读取与乐观并发更新"""
+
+    def __init__(self, s3_client, bucket_name: str, key: str = MANIFEST_KEY):
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.key = key
+        # 存储服务不支持条件写入时置为 False，之后不再尝试
+        self.conditional_writes = True
+
+    def load(self) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        读取清单
+
+        Returns:
+            (清单, ETag)；清单不存在返回 (None, None)，内容损坏返回 (None, ETag)
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=self.key)
+        except Exception as e:
+            if _error_code(e) in ("404", "NoSuchKey", "Not Found"):
+                return None, None
+            raise
+
+        body = response["Body"]
+        try:
+            raw = body.read()
+        finally:
+            body.close()
+        etag = response.get("ETag", "").strip('"')
+
+        try:
+            manifest = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError):
+            print(f"[远程存储] 清单内容损坏，将重建: {self.key}")
+            return None, etag
+        if not isinstance(manifest, dict) or not isinstance(manifest.get("dates"), dict):
+            return None, etag
+        if manifest.get("version") != MANIFEST_VERSION:
+            # 旧版本清单可能缺少日期或旧命名对象，按损坏处理
+            print(f"[远程存储] 清单版本过旧，将重建: {self.key}")
+            return None, etag
+        manifest.setdefault("legacy", {})
+        return manifest, etag
+
+    def _list_pages(self):
+        """列出 news/ 前缀下的所有对象（分页）"""
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        return paginator.paginate(Bucket=self.bucket_name, Prefix="news/")
+
+    def _seed_from_listing(self) -> Dict[str, Any]:
+        """清单不存在时由对象列表生成初始清单，避免只记录本次写入的日期"""
+        print(f"[远程存储] 清单不存在或已失效，根据对象列表重建: {self.key}")
+        listed, legacy = scan_objects(self._list_pages())
+        manifest = empty_manifest()
+        for date, entry in listed.items():
+            entry.setdefault("etag", None)
+            manifest["dates"][date] = entry
+        manifest["legacy"] = legacy
+        return manifest
+
+    def _put(self, manifest: Dict[str, Any], etag: Optional[str]) -> None:
+        body = json.dumps(manifest, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        # 已存在时要求 ETag 未变化，不存在时要求仍不存在
+        conditions = None
+        if self.conditional_writes:
+            conditions = {"IfMatch": f'"{etag}"'} if etag else {"IfNoneMatch": "*"}
+        _, applied = put_object_conditional(
+            self.s3_client,
+            conditions,
+            Bucket=self.bucket_name,
+            Key=self.key,
+            Body=body,
+            ContentType="application/json",
+        )
+        if conditions and not applied:
+            self.conditional_writes = False
+
+    def update(
+        self,
+        mutate: Callable[[Dict[str, Any]], None],
+        now_str: str = "",
+        retries: int = 5,
+        seed: Optional[Callable[[], Dict[str, Any]]] = None,
+    ) -> bool:
+        """
+        读取 - 修改 - 条件写入清单，冲突时重试
+
+        Args:
+            mutate: 就地修改清单的函数
+            now_str: 更新时间字符串
+            retries: 冲突重试次数
+            seed: 清单不存在或损坏时生成初始清单的函数（默认由对象列表重建）
+
+        Returns:
+            是否写入成功
+        """
+        seed = seed or self._seed_from_listing
+        for attempt in range(retries + 1):
+            manifest, etag = self.load()
+            if manifest is None:
+                manifest = seed()
+            mutate(manifest)
+            manifest["version"] = MANIFEST_VERSION
+            manifest["updated_at"] = now_str
+            try:
+                self._put(manifest, etag)
+                return True
+            except Exception as e:
+                if not is_conflict_error(e) or attempt >= retries:
+                    print(f"[远程存储] 更新清单失败: {e}")
+                    return False
+                time.sleep(min(0.2 * 2 ** attempt, 2))
+        return False
+
+    def rebuild(self, list_pages, now_str: str = "") -> Dict[str, Any]:
+        """
+        从对象列表重建清单（统计字段保留旧值，未知时为空）
+
+        Args:
+            list_pages: list_objects_v2 分页结果（Prefix="news/"）
+            now_str: 更新时间字符串
+
+        Returns:
+            重建后的清单
+        """
+        listed, legacy = scan_objects(list_pages)
+
+        def mutate(manifest: Dict[str, Any]) -> None:
+            old = manifest["dates"]
+            dates = {}
+            for date, entry in listed.items():
+                merged = dict(old.get(date, {}))
+                merged.update(entry)
+                merged.setdefault("etag", None)
+                dates[date] = merged
+            manifest["dates"] = dates
+            manifest["legacy"] = dict(legacy)
+
+        snapshot: List[Dict[str, Any]] = []
+
+        def capture(manifest: Dict[str, Any]) -> None:
+            mutate(manifest)
+            snapshot[:] = [manifest]
+
+        # 清单整体由本次列表替换，不需要再列一次对象生成初始清单
+        if not self.update(capture, now_str, seed=empty_manifest):
+            manifest = empty_manifest()
+            mutate(manifest)
+            return manifest
+        return snapshot[0]
@@ -0,0 +1,374 @@
+# coding=utf-8
+"""
+SQLite 连接池
+
+为本地存储后端提供线程安全的连接管理：
+- 读连接：按 (数据库路径, 线程) 复用，同一线程内可重入
+- 写连接：每个数据库文件一个，通过锁串行化
+- 连接数上限、空闲淘汰和运行指标
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+
+
+class _PooledConnection:
+    """池中连接及其使用状态"""
+
+    __slots__ = ("conn", "db_path", "owner", "in_use", "last_used")
+
+    def __init__(self, conn: sqlite3.Connection, db_path: str, owner: Optional[int]):
+        self.conn = conn
+        self.db_path = db_path
+        self.owner = owner          # 读连接所属线程 ID，写连接为 None
+        self.in_use = 0             # 当前嵌套使用深度
+        self.last_used = time.monotonic()
+
+
+class SQLiteConnectionPool:
+    """
+    SQLite 连接池
+
+    sqlite3.Connection 不能跨线程共享使用，因此：
+    - 每个线程对每个数据库文件持有独立的读连接
+    - 每个数据库文件只有一个写连接，写操作持有该文件的写锁
+
+    使用示例:
+        pool = SQLiteConnectionPool(init_func=init_tables)
+        with pool.reader(db_path) as conn:
+            conn.execute("SELECT ...")
+        with pool.writer(db_path) as conn:
+            conn.execute("INSERT ...")
+            conn.commit()
+    """
+
+    def __init__(
+        self,
+        init_func: Optional[Callable[[sqlite3.Connection], None]] = None,
+        max_readers: int = 8,
+        idle_timeout: float = 300.0,
+        busy_timeout: float = 30.0,
+        acquire_timeout: float = 30.0,
+    ):
+        """
+        初始化连接池
+
+        Args:
+            init_func: 数据库首次打开时执行的初始化函数（如建表），每个文件只执行一次
+            max_readers: 读连接总数上限（所有线程、所有数据库文件合计）
+            idle_timeout: 空闲连接的淘汰时间（秒），0 表示不淘汰
+            busy_timeout: SQLite 等待锁的超时时间（秒）
+            acquire_timeout: 读连接达到上限时等待空闲连接的超时时间（秒）
+        """
+        self.init_func = init_func
+        self.max_readers = max(1, max_readers)
+        self.idle_timeout = idle_timeout
+        self.busy_timeout = busy_timeout
+        self.acquire_timeout = acquire_timeout
+
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._readers: Dict[Tuple[str, int], _PooledConnection] = {}
+        self._writers: Dict[str, _PooledConnection] = {}
+        self._write_locks: Dict[str, threading.RLock] = {}
+        self._initialized: Set[str] = set()
+        self._last_eviction = time.monotonic()
+
+        self._metrics = {
+            "created": 0,
+            "reused": 0,
+            "evicted": 0,
+            "closed": 0,
+            "reader_waits": 0,
+            "write_acquires": 0,
+            "write_wait_seconds": 0.0,
+        }
+
+    # === 内部工具 ===
+
+    def _connect(self, db_path: str) -> sqlite3.Connection:
+        """创建新连接（允许跨线程关闭，但只会交给所属线程使用）"""
+        conn = sqlite3.connect(
+            db_path, timeout=self.busy_timeout, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._metrics["created"] += 1
+        return conn
+
+    def _get_write_lock(self, db_path: str) -> threading.RLock:
+        """获取数据库文件对应的写锁（调用方需持有 self._lock）"""
+        lock = self._write_locks.get(db_path)
+        if lock is None:
+            lock = threading.RLock()
+            self._write_locks[db_path] = lock
+        return lock
+
+    def _ensure_initialized(self, db_path: str) -> None:
+        """确保数据库已初始化（在写锁内执行，每个文件只执行一次）"""
+        if self.init_func is None or db_path in self._initialized:
+            return
+
+        with self._lock:
+            write_lock = self._get_write_lock(db_path)
+
+        with write_lock:
+            if db_path in self._initialized:
+                return
+            pooled = self._acquire_writer_conn(db_path)
+            self.init_func(pooled.conn)
+            self._initialized.add(db_path)
+
+    def _acquire_writer_conn(self, db_path: str) -> _PooledConnection:
+        """获取写连接（调用方需持有该文件的写锁）"""
+        with self._lock:
+            pooled = self._writers.get(db_path)
+        if pooled is None:
+            pooled = _PooledConnection(self._connect(db_path), db_path, None)
+            with self._lock:
+                self._writers[db_path] = pooled
+        return pooled
+
+    def _close_pooled(self, pooled: _PooledConnection) -> None:
+        """关闭池中连接，忽略关闭异常"""
+        try:
+            pooled.conn.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._metrics["closed"] += 1
+
+    def _pop_idle_reader(self) -> Optional[_PooledConnection]:
+        """移除最久未使用的空闲读连接（调用方需持有 self._lock）"""
+        idle = [p for p in self._readers.values() if p.in_use == 0]
+        if not idle:
+            return None
+        victim = min(idle, key=lambda p: p.last_used)
+        del self._readers[(victim.db_path, victim.owner)]
+        return victim
+
+    def _maybe_evict_idle(self) -> None:
+        """按间隔触发空闲淘汰，避免每次借出都扫描"""
+        if self.idle_timeout <= 0:
+            return
+        now = time.monotonic()
+        if now - self._last_eviction < min(self.idle_timeout, 60.0):
+            return
+        self._last_eviction = now
+        self.evict_idle()
+
+    # === 公共接口 ===
+
+    @contextmanager
+    def reader(self, db_path: str) -> Iterator[sqlite3.Connection]:
+        """
+        借出当前线程的读连接
+
+        Args:
+            db_path: 数据库文件路径
+
+        Yields:
+            sqlite3.Connection
+        """
+        self._maybe_evict_idle()
+        self._ensure_initialized(db_path)
+
+        key = (db_path, threading.get_ident())
+        victim = None
+
+        with self._lock:
+            pooled = self._readers.get(key)
+            if pooled is not None:
+                self._metrics["reused"] += 1
+            else:
+                deadline = time.monotonic() + self.acquire_timeout
+                while len(self._readers) >= self.max_readers:
+                    victim = self._pop_idle_reader()
+                    if victim is not None:
+                        self._metrics["evicted"] += 1
+                        break
+                    self._metrics["reader_waits"] += 1
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._available.wait(remaining):
+                        raise TimeoutError(
+                            f"获取读连接超时：已达到上限 {self.max_readers}"
+                        )
+                # 先占位，连接在锁外创建
+                pooled = _PooledConnection(None, db_path, key[1])
+                self._readers[key] = pooled
+            pooled.in_use += 1
+
+        if victim is not None:
+            self._close_pooled(victim)
+
+        try:
+            if pooled.conn is None:
+                pooled.conn = self._connect(db_path)
+            yield pooled.conn
+        except BaseException:
+            if pooled.conn is None:
+                with self._lock:
+                    self._readers.pop(key, None)
+                    self._available.notify()
+            raise
+        finally:
+            with self._lock:
+                pooled.in_use -= 1
+                pooled.last_used = time.monotonic()
+                if pooled.in_use == 0:
+                    self._available.notify()
+
+    @contextmanager
+    def writer(self, db_path: str) -> Iterator[sqlite3.Connection]:
+        """
+        借出数据库文件的写连接（持有写锁，同一文件的写操作串行执行）
+
+        事务中途出现异常时自动回滚，调用方负责提交。
+
+        Args:
+            db_path: 数据库文件路径
+
+        Yields:
+            sqlite3.Connection
+        """
+        self._maybe_evict_idle()
+        self._ensure_initialized(db_path)
+
+        with self._lock:
+            write_lock = self._get_write_lock(db_path)
+
+        start = time.monotonic()
+        with write_lock:
+            with self._lock:
+                self._metrics["write_acquires"] += 1
+                self._metrics["write_wait_seconds"] += time.monotonic() - start
+
+            pooled = self._acquire_writer_conn(db_path)
+            pooled.in_use += 1
+            try:
+                yield pooled.conn
+            except BaseException:
+                try:
+                    pooled.conn.rollback()
+                except Exception:
+                    pass
+                raise
+            finally:
+                pooled.in_use -= 1
+                pooled.last_used = time.monotonic()
+
+    def evict_idle(self, max_idle: Optional[float] = None) -> int:
+        """
+        淘汰空闲时间超过阈值的连接
+
+        Args:
+            max_idle: 空闲阈值（秒），默认使用 idle_timeout
+
+        Returns:
+            淘汰的连接数量
+        """
+        max_idle = self.idle_timeout if max_idle is None else max_idle
+        cutoff = time.monotonic() - max_idle
+        victims = []
+
+        with self._lock:
+            for key, pooled in list(self._readers.items()):
+                if pooled.in_use == 0 and pooled.last_used <= cutoff:
+                    del self._readers[key]
+                    victims.append(pooled)
+
+            for db_path, pooled in list(self._writers.items()):
+                lock = self._write_locks.get(db_path)
+                if pooled.in_use or pooled.last_used > cutoff:
+                    continue
+                if lock is not None and not lock.acquire(blocking=False):
+                    continue
+                try:
+                    del self._writers[db_path]
+                    victims.append(pooled)
+                finally:
+                    if lock is not None:
+                        lock.release()
+
+            self._metrics["evicted"] += len(victims)
+            if victims:
+                self._available.notify_all()
+
+        for pooled in victims:
+            self._close_pooled(pooled)
+
+        return len(victims)
+
+    def close_path(self, db_path: str) -> int:
+        """
+        关闭指定数据库文件的所有连接（如删除文件前调用）
+
+        Args:
+            db_path: 数据库文件路径
+
+        Returns:
+            关闭的连接数量
+        """
+        with self._lock:
+            write_lock = self._get_write_lock(db_path)
+
+        with write_lock:
+            with self._lock:
+                victims = [
+                    self._readers.pop(key)
+                    for key in [k for k, p in self._readers.items() if k[0] == db_path and p.in_use == 0]
+                ]
+                writer = self._writers.pop(db_path, None)
+                if writer is not None:
+                    victims.append(writer)
+                self._initialized.discard(db_path)
+                self._available.notify_all()
+
+            for pooled in victims:
+                self._close_pooled(pooled)
+
+        return len(victims)
+
+    def close_all(self) -> Dict[str, int]:
+        """
+        关闭池中所有连接
+
+        Returns:
+            {数据库路径: 关闭的连接数量}
+        """
+        with self._lock:
+            victims = list(self._readers.values()) + list(self._writers.values())
+            self._readers.clear()
+            self._writers.clear()
+            self._initialized.clear()
+            self._available.notify_all()
+
+        closed: Dict[str, int] = {}
+        for pooled in victims:
+            if pooled.conn is None:
+                continue
+            self._close_pooled(pooled)
+            closed[pooled.db_path] = closed.get(pooled.db_path, 0) + 1
+        return closed
+
+    def get_stats(self) -> dict:
+        """
+        获取连接池统计信息
+
+        Returns:
+            统计信息字典
+        """
+        with self._lock:
+            stats = dict(self._metrics)
+            stats.update({
+                "readers": len(self._readers),
+                "readers_in_use": sum(1 for p in self._readers.values() if p.in_use),
+                "writers": len(self._writers),
+                "databases": len(self._initialized),
+                "max_readers": self.max_readers,
+            })
+        stats["write_wait_seconds"] = round(stats["write_wait_seconds"], 4)
+        return stats
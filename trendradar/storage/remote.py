@@ -8,32 +8,63 @@
 """
 
 import atexit
+import json
 import os
 import pytz
 import re
 import shutil
 import sys
 import tempfile
+import time
+import uuid
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
 
 try:
     import boto3
+    from botocore.config import Config as BotoConfig
     from botocore.exceptions import ClientError
     HAS_BOTO3 = True
 except ImportError:
     HAS_BOTO3 = False
     boto3 = None
+    BotoConfig = None
     ClientError = Exception
 
-from trendradar.storage.base import StorageBackend, NewsItem, NewsData
+from trendradar.storage.base import StorageBackend, NewsItem, NewsData, compute_title_hash
+from trendradar.storage.cache import RemoteDBCache
+from trendradar.storage.fs_s3 import FileSystemS3Client
+from trendradar.storage.manifest import (
+    RemoteManifest,
+    collect_day_stats,
+    is_conflict_error,
+    put_object_conditional,
+)
+from trendradar.storage.remote_vfs import HAS_APSW
+from trendradar.storage.schema import init_schema, iter_news_items
+from trendradar.storage.segments import (
+    apply_segment,
+    capture_marks,
+    merge_day_databases,
+    write_segment,
+)
+from trendradar.storage.transfer import (
+    META_COMPRESSION,
+    ChecksumMismatchError,
+    etag_matches_md5,
+    normalize_codec,
+    pack_file,
+    unpack_stream,
+)
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
     format_time_filename,
 )
+from trendradar.utils.tracing import span
 
 
 class RemoteStorageBackend(StorageBackend):
@@ -43,9 +74,12 @@ class RemoteStorageBackend(StorageBackend):
     特点：
     - 使用 S3 兼容 API 访问远程存储
     - 支持 Cloudflare R2、阿里云 OSS、腾讯云 COS、AWS S3、MinIO 等
-    - 下载 SQLite 到临时目录进行操作
-    - 支持数据合并和上传
-    - 支持从远程拉取历史数据到本地
+    - 下载 SQLite 到临时目录（或持久化缓存目录，按 ETag 条件请求复用）进行操作
+    - 增量上传：每次只上传本次写入的变更分段，定期压缩为基础库
+    - 传输压缩（gzip / lzma），对象元数据携带 SHA-256，下载时校验
+    - 支持数据合并和上传；多个抓取节点写入同一天时，基础库按 ETag 条件上传，冲突时合并后重试
+    - 支持从远程拉取历史数据到本地（多线程并行，按 ETag 跳过未变化的日期）
+    - 维护远程清单（news/manifest.json），列出日期、过期清理无需遍历存储桶
     - 运行结束后自动清理临时文件
     """
 
@@ -60,6 +94,13 @@ class RemoteStorageBackend(StorageBackend):
         enable_html: bool = True,
         temp_dir: Optional[str] = None,
         timezone: str = "Asia/Shanghai",
+        compact_segments: int = 8,
+        compression: str = "gzip",
+        pull_workers: int = 4,
+        cache_dir: Optional[str] = None,
+        cache_max_mb: int = 512,
+        upload_retries: int = 3,
+        s3_client: Optional[Any] = None,
     ):
         """
         初始化远程存储后端
@@ -74,8 +115,16 @@ class RemoteStorageBackend(StorageBackend):
             enable_html: 是否启用 HTML 报告
             temp_dir: 临时目录路径（默认使用系统临时目录）
             timezone: 时区配置（默认 Asia/Shanghai）
+            compact_segments: 变更分段达到该数量时压缩为新的基础库（0 = 关闭增量上传，每次上传完整数据库）
+            compression: 传输压缩方式（none / gzip / lzma）
+            pull_workers: 拉取历史数据的并行线程数
+            cache_dir: 持久化缓存目录（可选，为空时每次运行都重新下载）
+            cache_max_mb: 缓存总大小上限（MB，0 = 不限制）
+            upload_retries: 基础库条件写入冲突（其他节点已更新）时合并并重试的次数
+            s3_client: 自定义 S3 客户端（可选，默认按 endpoint_url 创建；file:// 端点使用本地目录替身）
         """
-        if not HAS_BOTO3:
+        use_local_fs = s3_client is None and (endpoint_url or "").startswith("file://")
+        if s3_client is None and not use_local_fs and not HAS_BOTO3:
             raise ImportError("远程存储后端需要安装 boto3: pip install boto3")
 
         self.bucket_name = bucket_name
@@ -84,25 +133,53 @@ class RemoteStorageBackend(StorageBackend):
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.compact_segments = compact_segments
+        self.compression = normalize_codec(compression)
+        self.pull_workers = max(1, pull_workers)
+        self.upload_retries = max(0, upload_retries)
 
         # 创建临时目录
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.mkdtemp(prefix="trendradar_"))
         self.temp_dir.mkdir(parents=True, exist_ok=True)
 
+        # 持久化缓存（当天数据库跨运行复用）
+        self._cache = RemoteDBCache(cache_dir, cache_max_mb) if cache_dir else None
+
         # 初始化 S3 客户端
-        client_kwargs = {
-            "endpoint_url": endpoint_url,
-            "aws_access_key_id": access_key_id,
-            "aws_secret_access_key": secret_access_key,
-        }
-        if region:
-            client_kwargs["region_name"] = region
+        if s3_client is not None:
+            self.s3_client = s3_client
+        elif use_local_fs:
+            self.s3_client = FileSystemS3Client(endpoint_url)
+        else:
+            client_kwargs = {
+                "endpoint_url": endpoint_url,
+                "aws_access_key_id": access_key_id,
+                "aws_secret_access_key": secret_access_key,
+            }
+            if region:
+                client_kwargs["region_name"] = region
+            # 连接池需容纳所有拉取线程；失败请求由 botocore 自动重试
+            client_kwargs["config"] = BotoConfig(
+                max_pool_connections=max(10, self.pull_workers * 2),
+                retries={"max_attempts": 5, "mode": "standard"},
+            )
 
-        self.s3_client = boto3.client("s3", **client_kwargs)
+            self.s3_client = boto3.client("s3", **client_kwargs)
 
         # 跟踪下载的文件（用于清理）
         self._downloaded_files: List[Path] = []
         self._db_connections: Dict[str, sqlite3.Connection] = {}
+        # 每个日期的基础库是否存在及其 ETag、已合并的远程分段
+        self._base_exists: Dict[str, bool] = {}
+        self._base_etags: Dict[str, Optional[str]] = {}
+        # 本次运行上传的基础库压缩后大小（写入清单）
+        self._base_stored_sizes: Dict[str, int] = {}
+        self._manifest = RemoteManifest(self.s3_client, bucket_name)
+        # 存储服务不支持条件写入时置为 False，之后的上传不再携带条件
+        self._conditional_writes = True
+        # 远程只读查询使用的 VFS（按需创建）
+        self._range_vfs = None
+        self._segment_keys: Dict[str, List[str]] = {}
 
         print(f"[远程存储] 初始化完成，存储桶: {bucket_name}")
 
@@ -131,9 +208,16 @@ class RemoteStorageBackend(StorageBackend):
         date_folder = self._format_date_folder(date)
         return f"news/{date_folder}.db"
 
+    def _get_segment_prefix(self, date: Optional[str] = None) -> str:
+        """获取当天变更分段的对象键前缀"""
+        date_folder = self._format_date_folder(date)
+        return f"news/{date_folder}/"
+
     def _get_local_db_path(self, date: Optional[str] = None) -> Path:
-        """获取本地临时 SQLite 文件路径"""
+        """获取本地 SQLite 文件路径（启用缓存时位于缓存目录）"""
         date_folder = self._format_date_folder(date)
+        if self._cache is not None:
+            return self._cache.db_path(date_folder)
         return self.temp_dir / date_folder / "news.db"
 
     def _check_object_exists(self, r2_key: str) -> bool:
@@ -161,49 +245,143 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 检查对象存在性异常 ({r2_key}): {e}")
             return False
 
-    def _download_sqlite(self, date: Optional[str] = None) -> Optional[Path]:
+    def _put_file(
+        self, local_path: Path, key: str, conditions: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, str]:
         """
-        从 R2 下载当天的 SQLite 文件到本地临时目录
+        压缩并上传文件
+
+        原始内容的 SHA-256 写入对象元数据；请求携带 ContentMD5，
+        由服务端校验传输完整性，无需再 HEAD 确认。
+
+        Args:
+            local_path: 本地文件路径
+            key: 对象键
+            conditions: 条件写入参数（IfMatch / IfNoneMatch），不满足时抛出冲突错误；
+                存储服务不支持条件写入时改为普通写入
+
+        Returns:
+            (实际上传的字节数, 对象 ETag)
+        """
+        local_path = Path(local_path)
+        packed_path = local_path.with_name(local_path.name + ".upload")
+        with span("remote.upload", key=key) as upload_span:
+            try:
+                metadata, content_md5 = pack_file(local_path, packed_path, self.compression)
+                if not self._conditional_writes:
+                    conditions = None
+                with open(packed_path, "rb") as body:
+                    response, applied = put_object_conditional(
+                        self.s3_client,
+                        conditions,
+                        Bucket=self.bucket_name,
+                        Key=key,
+                        Body=body,
+                        Metadata=metadata,
+                        ContentMD5=content_md5,
+                    )
+                if conditions and not applied:
+                    self._conditional_writes = False
+                etag = response.get("ETag", "").strip('"')
+                if not etag_matches_md5(etag, content_md5):
+                    raise ChecksumMismatchError(f"上传校验失败: {key}")
+                uploaded = packed_path.stat().st_size
+                upload_span.set(bytes=uploaded)
+                return uploaded, etag
+            finally:
+                if packed_path.exists():
+                    packed_path.unlink()
+
+    def _get_file(
+        self, key: str, local_path: Path, if_none_match: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        下载文件并按元数据解压、校验
+
+        Args:
+            key: 对象键
+            local_path: 本地目标路径
+            if_none_match: 本地已有版本的 ETag（条件请求，未变化时不下载）
+
+        Returns:
+            对象 ETag；对象不存在返回 None；未变化（304）时原样返回 if_none_match，本地文件不变
+
+        Raises:
+            ChecksumMismatchError: 内容校验失败
+        """
+        request = {"Bucket": self.bucket_name, "Key": key}
+        if if_none_match:
+            request["IfNoneMatch"] = f'"{if_none_match}"'
+        with span("remote.download", key=key) as download_span:
+            try:
+                response = self.s3_client.get_object(**request)
+            except ClientError as e:
+                error = getattr(e, "response", {})
+                error_code = error.get("Error", {}).get("Code", "")
+                status = error.get("ResponseMetadata", {}).get("HTTPStatusCode")
+                if if_none_match and (status == 304 or error_code in ("304", "NotModified")):
+                    download_span.set(bytes=0, not_modified=True)
+                    return if_none_match
+                # R2/S3 可能返回 404, NoSuchKey, 或其他变体
+                if error_code in ("404", "NoSuchKey", "Not Found"):
+                    download_span.set(bytes=0, missing=True)
+                    return None
+                print(f"[远程存储] 下载失败 (错误码: {error_code}): {e}")
+                raise
+
+            download_span.set(bytes=response.get("ContentLength", 0))
+            body = response["Body"]
+            try:
+                unpack_stream(body, Path(local_path), response.get("Metadata"))
+            finally:
+                body.close()
+            return response.get("ETag", "").strip('"')
+
+    def _download_sqlite(
+        self, date: Optional[str] = None, local_path: Optional[Path] = None
+    ) -> Optional[Path]:
+        """
+        从 R2 下载当天的 SQLite 基础库到本地临时目录
 
         Args:
             date: 日期字符串
+            local_path: 本地目标路径（默认为临时目录）
 
         Returns:
             本地文件路径，如果不存在返回 None
         """
         r2_key = self._get_remote_db_key(date)
-        local_path = self._get_local_db_path(date)
+        local_path = Path(local_path) if local_path else self._get_local_db_path(date)
+        date_folder = self._format_date_folder(date)
 
         # 确保目录存在
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 先检查文件是否存在
-        if not self._check_object_exists(r2_key):
-            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
-            return None
-
         try:
-            self.s3_client.download_file(self.bucket_name, r2_key, str(local_path))
-            self._downloaded_files.append(local_path)
-            print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
-            return local_path
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            # R2/S3 可能返回不同的错误码
-            if error_code in ("404", "NoSuchKey", "Not Found"):
-                print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
-                return None
-            else:
-                print(f"[远程存储] 下载失败 (错误码: {error_code}): {e}")
-                raise
+            etag = self._get_file(r2_key, local_path)
         except Exception as e:
             print(f"[远程存储] 下载异常: {e}")
             raise
 
+        self._base_etags[date_folder] = etag
+        if etag is None:
+            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
+            self._base_exists[date_folder] = False
+            return None
+
+        self._downloaded_files.append(local_path)
+        self._base_exists[date_folder] = True
+        print(f"[远程存储] 已下载: {r2_key} -> {local_path} ({local_path.stat().st_size} bytes)")
+        return local_path
+
     def _upload_sqlite(self, date: Optional[str] = None) -> bool:
         """
         上传本地 SQLite 文件到 R2
 
+        使用乐观并发：基础库已存在时要求 ETag 与下载时一致（If-Match），
+        不存在时要求仍不存在（If-None-Match: *）。其他节点先写入导致冲突时，
+        把远程最新的基础库和变更分段合并到本地后重试，不会覆盖对方的数据。
+
         Args:
             date: 日期字符串
 
@@ -212,30 +390,72 @@ class RemoteStorageBackend(StorageBackend):
         """
         local_path = self._get_local_db_path(date)
         r2_key = self._get_remote_db_key(date)
+        date_folder = self._format_date_folder(date)
 
         if not local_path.exists():
             print(f"[远程存储] 本地文件不存在，无法上传: {local_path}")
             return False
 
-        try:
-            # 获取本地文件大小
-            local_size = local_path.stat().st_size
-            print(f"[远程存储] 准备上传: {local_path} ({local_size} bytes) -> {r2_key}")
-
-            self.s3_client.upload_file(str(local_path), self.bucket_name, r2_key)
-            print(f"[远程存储] 已上传: {local_path} -> {r2_key}")
+        for attempt in range(self.upload_retries + 1):
+            expected_etag = self._base_etags.get(date_folder)
+            if expected_etag:
+                conditions = {"IfMatch": f'"{expected_etag}"'}
+            elif self._base_exists.get(date_folder) is False:
+                conditions = {"IfNoneMatch": "*"}
+            else:
+                # 不知道远程版本（未下载过基础库），无法做条件写入
+                conditions = {}
 
-            # 验证上传成功
-            if self._check_object_exists(r2_key):
-                print(f"[远程存储] 上传验证成功: {r2_key}")
+            try:
+                # 获取本地文件大小
+                local_size = local_path.stat().st_size
+                print(f"[远程存储] 准备上传: {local_path} ({local_size} bytes) -> {r2_key}")
+
+                sent_size, etag = self._put_file(local_path, r2_key, conditions)
+                print(f"[远程存储] 已上传: {local_path} -> {r2_key} ({self.compression}, {sent_size} bytes)")
+                self._base_etags[date_folder] = etag
+                self._base_stored_sizes[date_folder] = sent_size
+                if self._cache is not None:
+                    self._cache.update_state(date_folder, base_etag=etag)
                 return True
-            else:
-                print(f"[远程存储] 上传验证失败: 文件未在 R2 中找到")
-                return False
 
-        except Exception as e:
-            print(f"[远程存储] 上传失败: {e}")
-            return False
+            except Exception as e:
+                if not is_conflict_error(e) or attempt >= self.upload_retries:
+                    print(f"[远程存储] 上传失败: {e}")
+                    return False
+                print(f"[远程存储] 基础库已被其他节点更新，合并后重试 ({attempt + 1}/{self.upload_retries})")
+                try:
+                    self._merge_remote_base(date)
+                except Exception as merge_error:
+                    print(f"[远程存储] 合并远程基础库失败: {merge_error}")
+                    return False
+
+        return False
+
+    def _merge_remote_base(self, date: Optional[str] = None) -> None:
+        """
+        下载远程最新的基础库和变更分段并合并到本地数据库（上传冲突时使用）
+
+        合并后记录新的基础库 ETag，作为下一次条件写入的依据。
+        """
+        date_folder = self._format_date_folder(date)
+        local_path = self._get_local_db_path(date)
+        remote_path = local_path.with_name("remote-base.db")
+        conn = self._get_connection(date)
+
+        try:
+            etag = self._get_file(self._get_remote_db_key(date), remote_path)
+            if etag is not None:
+                merge_day_databases(local_path, remote_path)
+                print(f"[远程存储] 已合并其他节点写入的基础库: {self._get_remote_db_key(date)}")
+        finally:
+            if remote_path.exists():
+                remote_path.unlink()
+
+        self._base_etags[date_folder] = etag
+        self._base_exists[date_folder] = etag is not None
+        # 对方压缩时删除的分段已包含在其基础库中，剩余分段在这里合并
+        self._apply_remote_segments(conn, date)
 
     def _get_connection(self, date: Optional[str] = None) -> sqlite3.Connection:
         """获取数据库连接"""
@@ -246,37 +466,398 @@ class RemoteStorageBackend(StorageBackend):
             # 确保目录存在
             local_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # 如果本地不存在，尝试从 R2 下载
-            if not local_path.exists():
+            if self._cache is not None:
+                # 缓存中已有时只做条件请求，远程未变化则无需下载
+                self._revalidate_cache(date)
+            elif not local_path.exists():
+                # 如果本地不存在，尝试从 R2 下载
                 self._download_sqlite(date)
 
             conn = sqlite3.connect(db_path)
             conn.row_factory = sqlite3.Row
             self._init_tables(conn)
+            # 合并基础库之后上传的变更分段
+            self._apply_remote_segments(conn, date)
             self._db_connections[db_path] = conn
 
         return self._db_connections[db_path]
 
+    def _revalidate_cache(self, date: Optional[str] = None) -> None:
+        """
+        用条件请求校验缓存中的当天数据库
+
+        - 无缓存：完整下载基础库
+        - 基础库 ETag 未变化（304）：直接使用缓存（上次运行是最后写入者时无需下载）
+        - 基础库已被其他运行更新：替换缓存；若缓存中有未同步的写入，则把新基础库合并进来
+        """
+        date_folder = self._format_date_folder(date)
+        local_path = self._get_local_db_path(date)
+        r2_key = self._get_remote_db_key(date)
+
+        state = self._cache.get_state(date_folder)
+        cached_etag = state.get("base_etag")
+        dirty = bool(state.get("dirty"))
+
+        if not cached_etag and not dirty:
+            self._cache.invalidate(date_folder)
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            self._download_sqlite(date)
+            self._cache.update_state(
+                date_folder, base_etag=self._base_etags.get(date_folder), dirty=False
+            )
+            return
+
+        target = local_path.with_name("remote-base.db") if dirty else local_path
+        etag = self._get_file(r2_key, target, if_none_match=cached_etag)
+
+        if etag is None:
+            # 远程基础库已不存在，保留缓存数据，下次同步上传完整数据库
+            print(f"[远程存储] 远程基础库不存在，使用本地缓存: {r2_key}")
+            self._base_exists[date_folder] = False
+        elif etag == cached_etag:
+            print(f"[远程存储] 缓存有效（远程未变化）: {r2_key}")
+            self._base_exists[date_folder] = True
+        else:
+            self._base_exists[date_folder] = True
+            if dirty:
+                # 缓存中有未同步的写入，合并新基础库而不是覆盖
+                conn = sqlite3.connect(str(local_path))
+                base_conn = sqlite3.connect(str(target))
+                try:
+                    self._init_tables(base_conn)
+                finally:
+                    base_conn.close()
+                try:
+                    self._init_tables(conn)
+                    apply_segment(conn, target)
+                finally:
+                    conn.close()
+                print(f"[远程存储] 已将远程基础库合并到本地缓存: {r2_key}")
+            else:
+                print(f"[远程存储] 远程已更新，已刷新缓存: {r2_key}")
+
+        if target != local_path and target.exists():
+            target.unlink()
+        self._base_etags[date_folder] = etag
+        self._cache.update_state(date_folder, base_etag=etag)
+
+    # === 增量分段 ===
+
+    def _list_segments(self, date: Optional[str] = None) -> List[str]:
+        """列出当天的变更分段对象键（按上传顺序排序）"""
+        prefix = self._get_segment_prefix(date)
+        keys = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                if obj['Key'].endswith(".db"):
+                    keys.append(obj['Key'])
+        return sorted(keys)
+
+    def _apply_remote_segments(self, conn: sqlite3.Connection, date: Optional[str] = None) -> int:
+        """
+        下载并合并当天尚未合并的变更分段
+
+        Args:
+            conn: 当日数据库连接
+            date: 日期字符串
+
+        Returns:
+            本次合并的分段数量
+        """
+        date_folder = self._format_date_folder(date)
+        try:
+            keys = self._list_segments(date)
+        except Exception as e:
+            print(f"[远程存储] 列出变更分段失败: {e}")
+            keys = []
+
+        self._segment_keys[date_folder] = keys
+        if not keys:
+            return 0
+
+        segment_dir = self.temp_dir / date_folder / "segments"
+        segment_dir.mkdir(parents=True, exist_ok=True)
+
+        applied_count = 0
+        for key in keys:
+            row = conn.execute(
+                "SELECT 1 FROM applied_segments WHERE segment_key = ?", (key,)
+            ).fetchone()
+            if row:
+                continue
+
+            segment_path = segment_dir / key.rsplit("/", 1)[-1]
+            if self._get_file(key, segment_path) is None:
+                continue
+            if apply_segment(conn, segment_path, key):
+                applied_count += 1
+            segment_path.unlink()
+
+        if applied_count:
+            print(f"[远程存储] 已合并 {applied_count} 个变更分段（共 {len(keys)} 个）")
+        return applied_count
+
+    def _sync_changes(
+        self,
+        date: Optional[str],
+        marks: Dict[str, int],
+        crawl_time: Optional[str] = None,
+        push_date: Optional[str] = None,
+    ) -> bool:
+        """
+        将本次写入同步到远程
+
+        基础库不存在或关闭增量模式时上传完整数据库；否则只上传本次的变更分段，
+        分段数量达到 compact_segments 时压缩为新的基础库。
+
+        Args:
+            date: 日期字符串
+            marks: 写入前 capture_marks 的结果
+            crawl_time: 本次抓取时间
+            push_date: 推送日期
+
+        Returns:
+            是否同步成功
+        """
+        synced = self._push_changes(date, marks, crawl_time, push_date)
+        if self._cache is not None:
+            # 同步失败时标记缓存有未同步的写入，下次运行上传完整数据库
+            self._cache.update_state(self._format_date_folder(date), dirty=not synced)
+        if synced:
+            self._update_manifest(date)
+        return synced
+
+    def _update_manifest(self, date: Optional[str] = None) -> bool:
+        """把当天数据库的概要信息写入远程清单"""
+        date_folder = self._format_date_folder(date)
+        try:
+            conn = self._get_connection(date)
+            entry = collect_day_stats(conn)
+            entry["size"] = self._get_local_db_path(date).stat().st_size
+            entry["segments"] = len(self._segment_keys.get(date_folder, []))
+            if self._base_etags.get(date_folder):
+                entry["etag"] = self._base_etags[date_folder]
+            if date_folder in self._base_stored_sizes:
+                entry["stored_size"] = self._base_stored_sizes[date_folder]
+        except Exception as e:
+            print(f"[远程存储] 统计清单信息失败: {e}")
+            return False
+
+        now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+        entry["updated_at"] = now_str
+
+        def mutate(manifest: Dict[str, Any]) -> None:
+            manifest["dates"].setdefault(date_folder, {}).update(entry)
+
+        return self._manifest.update(mutate, now_str)
+
+    def get_manifest(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        读取远程清单（不存在或 refresh=True 时由对象列表重建）
+
+        Args:
+            refresh: 是否强制重建
+
+        Returns:
+            清单字典（见 trendradar.storage.manifest）
+        """
+        if not refresh:
+            manifest, _ = self._manifest.load()
+            if manifest is not None:
+                return manifest
+
+        print("[远程存储] 正在根据对象列表重建清单...")
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(Bucket=self.bucket_name, Prefix="news/")
+        now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+        return self._manifest.rebuild(pages, now_str)
+
+    def _push_changes(
+        self,
+        date: Optional[str],
+        marks: Dict[str, int],
+        crawl_time: Optional[str] = None,
+        push_date: Optional[str] = None,
+    ) -> bool:
+        """上传变更分段或完整数据库（参数同 _sync_changes）"""
+        date_folder = self._format_date_folder(date)
+        base_exists = self._base_exists.get(date_folder)
+        if base_exists is None:
+            base_exists = self._check_object_exists(self._get_remote_db_key(date))
+            self._base_exists[date_folder] = base_exists
+
+        dirty = self._cache is not None and self._cache.get_state(date_folder).get("dirty")
+        if self.compact_segments <= 0 or not base_exists or dirty:
+            return self._compact_segments(date)
+
+        conn = self._get_connection(date)
+        segment_key = (
+            f"{self._get_segment_prefix(date)}"
+            f"{time.time_ns() // 1_000_000:013d}-{uuid.uuid4().hex[:8]}.db"
+        )
+        segment_path = self.temp_dir / date_folder / "segments" / segment_key.rsplit("/", 1)[-1]
+
+        try:
+            item_count = write_segment(conn, segment_path, marks, crawl_time, push_date)
+            segment_size = segment_path.stat().st_size
+            sent_size, _ = self._put_file(segment_path, segment_key)
+            print(f"[远程存储] 已上传变更分段: {segment_key} ({item_count} 条, {segment_size} -> {sent_size} bytes)")
+        except Exception as e:
+            print(f"[远程存储] 上传变更分段失败，改为上传完整数据库: {e}")
+            return self._compact_segments(date)
+        finally:
+            if segment_path.exists():
+                segment_path.unlink()
+
+        # 本地库已包含该分段，记录下来，压缩时新的基础库可据此跳过
+        conn.execute(
+            "INSERT OR IGNORE INTO applied_segments (segment_key) VALUES (?)",
+            (segment_key,),
+        )
+        conn.commit()
+        self._segment_keys.setdefault(date_folder, []).append(segment_key)
+
+        if len(self._segment_keys[date_folder]) >= self.compact_segments:
+            return self._compact_segments(date)
+        return True
+
+    def _compact_segments(self, date: Optional[str] = None) -> bool:
+        """
+        上传完整数据库作为新的基础库，并删除已合并进来的变更分段
+
+        Args:
+            date: 日期字符串
+
+        Returns:
+            基础库是否上传成功
+        """
+        date_folder = self._format_date_folder(date)
+        if not self._upload_sqlite(date):
+            return False
+        self._base_exists[date_folder] = True
+
+        segment_keys = self._segment_keys.pop(date_folder, [])
+        if segment_keys:
+            self._delete_objects(segment_keys)
+            print(f"[远程存储] 已压缩 {len(segment_keys)} 个变更分段到基础库")
+        return True
+
+    def _delete_objects(self, keys: List[str]) -> None:
+        """批量删除远程对象（每次最多 1000 个）"""
+        batch_size = 1000
+        for i in range(0, len(keys), batch_size):
+            batch = [{'Key': key} for key in keys[i:i + batch_size]]
+            try:
+                self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': batch}
+                )
+            except Exception as e:
+                print(f"[远程存储] 批量删除失败: {e}")
+
+    def download_day_database(
+        self,
+        date: str,
+        local_path: Path,
+        segment_keys: Optional[List[str]] = None,
+    ) -> bool:
+        """
+        下载指定日期的完整数据库（基础库 + 变更分段）到本地路径
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD）
+            local_path: 本地数据库路径
+            segment_keys: 已列出的变更分段对象键（可选，默认重新列出）
+
+        Returns:
+            是否成功（远程既无基础库也无分段时返回 False）
+        """
+        local_path = Path(local_path)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = local_path.with_name(local_path.name + ".part")
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+        # 直接下载基础库而不经过 _download_sqlite：拉取在工作线程中并行执行，
+        # 且拉取的是独立副本，不能改动当天上传所依赖的 ETag/存在状态
+        r2_key = self._get_remote_db_key(date)
+        base_etag = self._get_file(r2_key, tmp_path)
+        if segment_keys is None:
+            segment_keys = self._list_segments(date)
+        if base_etag is None and not segment_keys:
+            return False
+        if base_etag is not None:
+            print(f"[远程存储] 已下载: {r2_key} -> {tmp_path} ({tmp_path.stat().st_size} bytes)")
+
+        conn = sqlite3.connect(str(tmp_path))
+        try:
+            self._init_tables(conn)
+            segment_dir = tmp_path.parent / ".segments"
+            segment_dir.mkdir(parents=True, exist_ok=True)
+            for key in segment_keys:
+                segment_path = segment_dir / key.rsplit("/", 1)[-1]
+                if self._get_file(key, segment_path) is None:
+                    continue
+                apply_segment(conn, segment_path, key)
+                segment_path.unlink()
+            shutil.rmtree(segment_dir, ignore_errors=True)
+        finally:
+            conn.close()
+
+        os.replace(tmp_path, local_path)
+        return True
+
+    def open_day_readonly(self, date: str):
+        """
+        以 HTTP 范围读取方式只读打开远程数据库（不下载整个文件）
+
+        需要 apsw，且基础库以未压缩方式存储、没有未压缩进基础库的变更分段。
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD）
+
+        Returns:
+            apsw.Connection；不满足条件时返回 None（调用方可改为完整下载）
+        """
+        if not HAS_APSW:
+            return None
+
+        key = self._get_remote_db_key(date)
+        try:
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError:
+            return None
+
+        metadata = {k.lower(): v for k, v in (head.get("Metadata") or {}).items()}
+        codec = normalize_codec(metadata.get(META_COMPRESSION, "none"))
+        if codec != "none":
+            print(f"[远程存储] {key} 以 {codec} 压缩存储，无法范围读取")
+            return None
+        if self._list_segments(date):
+            print(f"[远程存储] {date} 仍有未压缩进基础库的变更分段，无法范围读取")
+            return None
+
+        if self._range_vfs is None:
+            from trendradar.storage.remote_vfs import S3ReadOnlyVFS
+            self._range_vfs = S3ReadOnlyVFS(self.s3_client, self.bucket_name)
+
+        self._range_vfs.register_object(
+            key, head["ContentLength"], head.get("ETag", "").strip('"')
+        )
+        return self._range_vfs.open_connection(key)
+
     def _get_schema_path(self) -> Path:
         """获取 schema.sql 文件路径"""
         return Path(__file__).parent / "schema.sql"
 
     def _init_tables(self, conn: sqlite3.Connection) -> None:
         """从 schema.sql 初始化数据库表结构"""
-        schema_path = self._get_schema_path()
-        
-        if schema_path.exists():
-            with open(schema_path, "r", encoding="utf-8") as f:
-                schema_sql = f.read()
-            conn.executescript(schema_sql)
-        else:
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
-
-        conn.commit()
+        init_schema(conn, self._get_schema_path())
 
     def save_news_data(self, data: NewsData) -> bool:
         """
-        保存新闻数据到 R2（以 URL 为唯一标识，支持标题更新检测）
+        保存新闻数据到 R2（以 URL / 标题哈希为唯一标识，支持标题更新检测）
 
         流程：下载现有数据库 → 插入/更新数据 → 上传回 R2
 
@@ -289,6 +870,7 @@ class RemoteStorageBackend(StorageBackend):
         try:
             conn = self._get_connection(data.date)
             cursor = conn.cursor()
+            marks = capture_marks(conn)
 
             # 查询已有记录数
             cursor.execute("SELECT COUNT(*) as count FROM news_items")
@@ -321,78 +903,66 @@ class RemoteStorageBackend(StorageBackend):
 
                 for item in news_list:
                     try:
-                        # 检查是否已存在（通过 URL + platform_id）
+                        # 检查是否已存在（有 URL 用 URL + platform_id，无 URL 用 title_hash）
+                        title_hash = compute_title_hash(source_id, item.title)
                         if item.url:
                             cursor.execute("""
                                 SELECT id, title FROM news_items
                                 WHERE url = ? AND platform_id = ?
                             """, (item.url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
+                        else:
+                            cursor.execute("""
+                                SELECT id, title FROM news_items
+                                WHERE title_hash = ? AND url = ''
+                            """, (title_hash,))
+                        existing = cursor.fetchone()
 
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, item.url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
+                        if existing:
+                            # 已存在，更新记录
+                            existing_id, existing_title = existing
+
+                            # 检查标题是否变化
+                            if existing_title != item.title:
+                                # 记录标题变更
                                 cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
+                                    INSERT INTO title_changes
+                                    (news_item_id, old_title, new_title, changed_at)
                                     VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
+                                """, (existing_id, existing_title, item.title, now_str))
+                                title_changed_count += 1
+
+                            # 记录排名历史
+                            cursor.execute("""
+                                INSERT INTO rank_history
+                                (news_item_id, rank, crawl_time, created_at)
+                                VALUES (?, ?, ?, ?)
+                            """, (existing_id, item.rank, data.crawl_time, now_str))
+
+                            # 更新现有记录
+                            cursor.execute("""
+                                UPDATE news_items SET
+                                    title = ?,
+                                    title_hash = ?,
+                                    rank = ?,
+                                    mobile_url = ?,
+                                    last_crawl_time = ?,
+                                    crawl_count = crawl_count + 1,
+                                    updated_at = ?
+                                WHERE id = ?
+                            """, (item.title, title_hash, item.rank, item.mobile_url,
+                                  data.crawl_time, now_str, existing_id))
+                            updated_count += 1
                         else:
-                            # URL 为空的情况，直接插入（不做去重）
+                            # 不存在，插入新记录
                             cursor.execute("""
                                 INSERT INTO news_items
                                 (title, platform_id, rank, url, mobile_url,
                                  first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+                                 title_hash, created_at, updated_at)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?)
                             """, (item.title, source_id, item.rank, item.url,
                                   item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
+                                  title_hash, now_str, now_str))
                             new_id = cursor.lastrowid
                             # 记录初始排名
                             cursor.execute("""
@@ -460,8 +1030,8 @@ class RemoteStorageBackend(StorageBackend):
             log_parts.append(f"(去重后总计: {final_count} 条)")
             print("，".join(log_parts))
 
-            # 上传到 R2
-            if self._upload_sqlite(data.date):
+            # 上传到 R2（增量分段或完整数据库）
+            if self._sync_changes(data.date, marks, crawl_time=data.crawl_time):
                 print(f"[远程存储] 数据已同步到 R2")
                 return True
             else:
@@ -577,6 +1147,16 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 读取数据失败: {e}")
             return None
 
+    def iter_items(
+        self,
+        date: Optional[str] = None,
+        platforms: Optional[List[str]] = None,
+        since: Optional[str] = None,
+    ) -> Iterator[NewsItem]:
+        """逐条遍历指定日期的新闻条目（直接从游标读取，不构建 NewsData）"""
+        conn = self._get_connection(date)
+        yield from iter_news_items(conn, platforms, since)
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取最新一次抓取的数据"""
         try:
@@ -661,23 +1241,18 @@ class RemoteStorageBackend(StorageBackend):
     def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
         """检测新增的标题"""
         try:
-            historical_data = self.get_today_all_data(current_data.date)
-
-            if not historical_data:
-                new_titles = {}
-                for source_id, news_list in current_data.items.items():
-                    new_titles[source_id] = {item.title: item for item in news_list}
-                return new_titles
-
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = {item.title for item in news_list}
+            # 直接读取历史标题哈希，无需加载完整数据
+            conn = self._get_connection(current_data.date)
+            cursor = conn.execute("""
+                SELECT DISTINCT title_hash FROM news_items
+                WHERE title_hash IS NOT NULL
+            """)
+            historical_hashes = {row[0] for row in cursor.fetchall()}
 
             new_titles = {}
             for source_id, news_list in current_data.items.items():
-                hist_set = historical_titles.get(source_id, set())
                 for item in news_list:
-                    if item.title not in hist_set:
+                    if compute_title_hash(source_id, item.title) not in historical_hashes:
                         if source_id not in new_titles:
                             new_titles[source_id] = {}
                         new_titles[source_id][item.title] = item
@@ -775,6 +1350,23 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 检查首次抓取失败: {e}")
             return True
 
+    def get_crawl_times(self, date: Optional[str] = None) -> List[str]:
+        """获取指定日期的所有抓取时间列表（按时间排序）"""
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT crawl_time FROM crawl_records
+                ORDER BY crawl_time
+            """)
+
+            return [row[0] for row in cursor.fetchall()]
+
+        except Exception as e:
+            print(f"[远程存储] 获取抓取时间列表失败: {e}")
+            return []
+
     def cleanup(self) -> None:
         """清理资源（关闭连接和删除临时文件）"""
         # 检查 Python 是否正在关闭
@@ -783,6 +1375,7 @@ class RemoteStorageBackend(StorageBackend):
 
         # 关闭数据库连接
         db_connections = getattr(self, "_db_connections", {})
+        used_dates = [Path(db_path).parent.name for db_path in db_connections]
         for db_path, conn in list(db_connections.items()):
             try:
                 conn.close()
@@ -809,6 +1402,15 @@ class RemoteStorageBackend(StorageBackend):
         if downloaded_files:
             downloaded_files.clear()
 
+        # 缓存超过上限时按 LRU 淘汰（本次使用过的日期保留）
+        cache = getattr(self, "_cache", None)
+        if cache is not None:
+            try:
+                cache.evict(keep=used_dates)
+            except Exception as e:
+                if sys.meta_path is not None:
+                    print(f"[远程存储] 缓存淘汰失败: {e}")
+
     def cleanup_old_data(self, retention_days: int) -> int:
         """
         清理 R2 上的过期数据
@@ -826,6 +1428,11 @@ class RemoteStorageBackend(StorageBackend):
         cutoff_date = self._get_configured_time() - timedelta(days=retention_days)
 
         try:
+            # 有清单时直接按清单清理，无需遍历存储桶
+            manifest, _ = self._manifest.load()
+            if manifest is not None:
+                return self._cleanup_by_manifest(manifest, cutoff_date)
+
             # 列出 R2 中 news/ 前缀下的所有对象
             paginator = self.s3_client.get_paginator('list_objects_v2')
             pages = paginator.paginate(Bucket=self.bucket_name, Prefix="news/")
@@ -841,11 +1448,12 @@ class RemoteStorageBackend(StorageBackend):
                 for obj in page['Contents']:
                     key = obj['Key']
 
-                    # 解析日期（格式: news/YYYY-MM-DD.db 或 news/YYYY年MM月DD日.db）
+                    # 解析日期（格式: news/YYYY-MM-DD.db、变更分段 news/YYYY-MM-DD/*.db
+                    # 或 news/YYYY年MM月DD日.db）
                     folder_date = None
                     try:
-                        # ISO 格式: news/YYYY-MM-DD.db
-                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})\.db$', key)
+                        # ISO 格式: news/YYYY-MM-DD.db 或 news/YYYY-MM-DD/<分段>.db
+                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})(?:\.db|/[^/]+\.db)$', key)
                         if date_match:
                             folder_date = datetime(
                                 int(date_match.group(1)),
@@ -889,6 +1497,8 @@ class RemoteStorageBackend(StorageBackend):
                 deleted_count = len(deleted_dates)
                 for date_str in sorted(deleted_dates):
                     print(f"[远程存储] 清理过期数据: news/{date_str}.db")
+                    if self._cache is not None:
+                        self._cache.invalidate(date_str)
 
                 print(f"[远程存储] 共清理 {deleted_count} 个过期日期数据库文件")
 
@@ -898,6 +1508,48 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 清理过期数据失败: {e}")
             return deleted_count
 
+    def _cleanup_by_manifest(self, manifest: Dict[str, Any], cutoff_date: datetime) -> int:
+        """
+        按清单删除过期日期（基础库 + 变更分段，以及旧中文命名的数据库）并更新清单
+
+        Returns:
+            删除的日期数量
+        """
+        cutoff_str = cutoff_date.strftime("%Y-%m-%d")
+        expired = sorted(date for date in manifest["dates"] if date <= cutoff_str)
+        expired_legacy = sorted(
+            key for key, date in manifest.get("legacy", {}).items() if date <= cutoff_str
+        )
+        if not expired and not expired_legacy:
+            return 0
+
+        keys = list(expired_legacy)
+        for date_str in expired:
+            keys.append(self._get_remote_db_key(date_str))
+            keys.extend(self._list_segments(date_str))
+        self._delete_objects(keys)
+        print(f"[远程存储] 删除 {len(keys)} 个对象")
+
+        for date_str in expired:
+            print(f"[远程存储] 清理过期数据: news/{date_str}.db")
+            if self._cache is not None:
+                self._cache.invalidate(date_str)
+        for key in expired_legacy:
+            print(f"[远程存储] 清理过期数据: {key}")
+
+        def mutate(m: Dict[str, Any]) -> None:
+            for date_str in expired:
+                m["dates"].pop(date_str, None)
+            for key in expired_legacy:
+                m["legacy"].pop(key, None)
+
+        now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+        self._manifest.update(mutate, now_str)
+
+        deleted_count = len(expired) + len(expired_legacy)
+        print(f"[远程存储] 共清理 {deleted_count} 个过期日期数据库文件")
+        return deleted_count
+
     def has_pushed_today(self, date: Optional[str] = None) -> bool:
         """
         检查指定日期是否已推送过
@@ -941,6 +1593,7 @@ class RemoteStorageBackend(StorageBackend):
         try:
             conn = self._get_connection(date)
             cursor = conn.cursor()
+            marks = capture_marks(conn)
 
             target_date = self._format_date_folder(date)
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
@@ -959,7 +1612,7 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 推送记录已保存: {report_type} at {now_str}")
 
             # 上传到 R2 确保记录持久化
-            if self._upload_sqlite(date):
+            if self._sync_changes(date, marks, push_date=target_date):
                 print(f"[远程存储] 推送记录已同步到 R2")
                 return True
             else:
@@ -995,76 +1648,202 @@ class RemoteStorageBackend(StorageBackend):
         if days <= 0:
             return 0
 
-        local_dir = Path(local_data_dir)
-        local_dir.mkdir(parents=True, exist_ok=True)
-
-        pulled_count = 0
         now = self._get_configured_time()
+        dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
 
         print(f"[远程存储] 开始拉取最近 {days} 天的数据...")
+        result = self.pull_days(dates, local_data_dir)
+        print(f"[远程存储] 拉取完成，共下载 {len(result['pulled'])} 个数据库文件")
+        return len(result["pulled"])
 
-        for i in range(days):
-            date = now - timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
+    def pull_days(
+        self,
+        dates: List[str],
+        local_data_dir: str = "output",
+        max_workers: Optional[int] = None,
+        retries: int = 2,
+        progress_callback: Optional[Callable[[int, int, str, str], None]] = None,
+    ) -> Dict[str, List]:
+        """
+        并行拉取多个日期的数据库到本地
 
-            # 本地目标路径
-            local_date_dir = local_dir / date_str
-            local_db_path = local_date_dir / "news.db"
+        先一次性列出远程对象（替代逐日 HEAD 检查），再用线程池并行下载。
+        每个拉取下来的数据库旁记录远程签名（基础库 ETag + 分段列表），
+        签名未变化的日期直接跳过；本地生成或拉取后在本地修改过的数据库不会被覆盖。
 
-            # 如果本地已存在，跳过
-            if local_db_path.exists():
-                print(f"[远程存储] 跳过（本地已存在）: {date_str}")
-                continue
+        Args:
+            dates: 日期列表（YYYY-MM-DD）
+            local_data_dir: 本地数据目录
+            max_workers: 并行线程数（默认使用 pull_workers）
+            retries: 单个日期下载失败后的重试次数
+            progress_callback: 进度回调 (已完成数, 总数, 日期, 状态)
 
-            # 远程对象键
-            remote_key = f"news/{date_str}.db"
+        Returns:
+            {"pulled": [...], "unchanged": [...], "local": [...], "missing": [...],
+             "failed": [{"date": ..., "error": ...}]}
+        """
+        result: Dict[str, List] = {
+            "pulled": [], "unchanged": [], "local": [], "missing": [], "failed": [],
+        }
+        if not dates:
+            return result
 
-            # 检查远程是否存在
-            if not self._check_object_exists(remote_key):
-                print(f"[远程存储] 跳过（远程不存在）: {date_str}")
+        local_dir = Path(local_data_dir)
+        local_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            remote_index = self._list_remote_index()
+        except Exception as e:
+            print(f"[远程存储] 列出远程对象失败: {e}")
+            result["failed"] = [{"date": date, "error": str(e)} for date in dates]
+            return result
+
+        tasks = []
+        for date_str in dates:
+            local_db_path = local_dir / date_str / "news.db"
+            signature = remote_index.get(date_str)
+
+            if signature is None:
+                status = "missing"
+            elif local_db_path.exists():
+                state = self._read_pull_state(local_db_path)
+                if state is None:
+                    status = "local"
+                elif state["remote"] == signature:
+                    status = "unchanged"
+                else:
+                    tasks.append((date_str, local_db_path, signature))
+                    continue
+            else:
+                tasks.append((date_str, local_db_path, signature))
                 continue
 
-            # 下载
+            result[status].append(date_str)
+
+        skipped = len(dates) - len(tasks)
+        if skipped:
+            print(f"[远程存储] 跳过 {skipped} 天（本地已存在/未变化/远程不存在）")
+        if not tasks:
+            return result
+
+        workers = min(max_workers or self.pull_workers, len(tasks))
+        total = len(tasks)
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trendradar-pull") as executor:
+            futures = {
+                executor.submit(self._pull_one_day, date_str, path, signature, retries): date_str
+                for date_str, path, signature in tasks
+            }
+            for future in as_completed(futures):
+                date_str = futures[future]
+                done += 1
+                try:
+                    if future.result():
+                        result["pulled"].append(date_str)
+                        status = "已拉取"
+                    else:
+                        result["missing"].append(date_str)
+                        status = "远程不存在"
+                except Exception as e:
+                    result["failed"].append({"date": date_str, "error": str(e)})
+                    status = f"失败: {e}"
+
+                print(f"[远程存储] 拉取进度 {done}/{total}: {date_str} {status}")
+                if progress_callback:
+                    progress_callback(done, total, date_str, status)
+
+        result["pulled"].sort(reverse=True)
+        return result
+
+    def _pull_one_day(
+        self,
+        date_str: str,
+        local_db_path: Path,
+        signature: Dict[str, Any],
+        retries: int,
+    ) -> bool:
+        """下载单个日期并记录远程签名，失败时按指数退避重试"""
+        attempt = 0
+        while True:
             try:
-                local_date_dir.mkdir(parents=True, exist_ok=True)
-                self.s3_client.download_file(
-                    self.bucket_name,
-                    remote_key,
-                    str(local_db_path)
-                )
-                print(f"[远程存储] 已拉取: {remote_key} -> {local_db_path}")
-                pulled_count += 1
+                if not self.download_day_database(date_str, local_db_path, signature["segments"]):
+                    return False
+                self._write_pull_state(local_db_path, signature)
+                return True
             except Exception as e:
-                print(f"[远程存储] 拉取失败 ({date_str}): {e}")
-
-        print(f"[远程存储] 拉取完成，共下载 {pulled_count} 个数据库文件")
-        return pulled_count
+                if attempt >= retries:
+                    raise
+                attempt += 1
+                print(f"[远程存储] 拉取失败 ({date_str})，第 {attempt} 次重试: {e}")
+                time.sleep(min(0.5 * 2 ** attempt, 8))
 
-    def list_remote_dates(self) -> List[str]:
+    def _list_remote_index(self) -> Dict[str, Dict[str, Any]]:
         """
-        列出远程存储中所有可用的日期
+        一次列出所有远程日期的签名
 
         Returns:
-            日期字符串列表（YYYY-MM-DD 格式）
+            {date: {"base": 基础库 ETag 或 None, "segments": [分段对象键（已排序）]}}
+        """
+        index: Dict[str, Dict[str, Any]] = {}
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix="news/"):
+            for obj in page.get('Contents', []):
+                match = re.match(r'news/(\d{4}-\d{2}-\d{2})(\.db|/[^/]+\.db)$', obj['Key'])
+                if not match:
+                    continue
+                entry = index.setdefault(match.group(1), {"base": None, "segments": []})
+                if match.group(2) == ".db":
+                    entry["base"] = obj.get('ETag', "").strip('"')
+                else:
+                    entry["segments"].append(obj['Key'])
+
+        for entry in index.values():
+            entry["segments"].sort()
+        return index
+
+    @staticmethod
+    def _pull_state_path(local_db_path: Path) -> Path:
+        return Path(local_db_path).with_name(Path(local_db_path).name + ".remote.json")
+
+    def _read_pull_state(self, local_db_path: Path) -> Optional[Dict[str, Any]]:
         """
-        dates = []
+        读取拉取时记录的远程签名
 
+        Returns:
+            {"remote": 远程签名, ...}；本地生成的数据库或拉取后在本地写入过的数据库返回 None
+        """
+        state_path = self._pull_state_path(local_db_path)
+        if not state_path.exists():
+            return None
         try:
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.bucket_name, Prefix="news/")
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            stat = Path(local_db_path).stat()
+        except (OSError, ValueError):
+            return None
+        if state.get("size") != stat.st_size or state.get("mtime_ns") != stat.st_mtime_ns:
+            return None
+        return state
 
-            for page in pages:
-                if 'Contents' not in page:
-                    continue
+    def _write_pull_state(self, local_db_path: Path, signature: Dict[str, Any]) -> None:
+        """在本地数据库旁记录远程签名及本地文件状态"""
+        stat = Path(local_db_path).stat()
+        state = {"remote": signature, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        with open(self._pull_state_path(local_db_path), "w", encoding="utf-8") as f:
+            json.dump(state, f)
 
-                for obj in page['Contents']:
-                    key = obj['Key']
-                    # 解析日期
-                    date_match = re.match(r'news/(\d{4}-\d{2}-\d{2})\.db$', key)
-                    if date_match:
-                        dates.append(date_match.group(1))
+    def list_remote_dates(self) -> List[str]:
+        """
+        列出远程存储中所有可用的日期
 
-            return sorted(dates, reverse=True)
+        Returns:
+            日期字符串列表（YYYY-MM-DD 格式）
+        """
+        try:
+            # 读取清单（一次 GET），清单不存在时由对象列表重建
+            manifest = self.get_manifest()
+            return sorted(manifest["dates"], reverse=True)
 
         except Exception as e:
             print(f"[远程存储] 列出远程日期失败: {e}")
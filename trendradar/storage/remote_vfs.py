@@ -0,0 +1,242 @@
+# coding=utf-8
+"""
+远程数据库只读查询（HTTP 范围读取）
+
+基于 apsw 的自定义 SQLite VFS，把数据库页读取转换为 S3 范围请求（Range GET），
+配合块缓存，查询历史日期时只读取用到的页面，无需下载整个数据库：
+
+- RangedObject: 对象的块缓存读取器（按块对齐、合并相邻缺失块、LRU 淘汰）
+- S3ReadOnlyVFS: 只读 VFS，按对象键打开数据库
+
+限制：
+- 需要安装 apsw（pip install apsw），未安装时 HAS_APSW 为 False
+- 只能读取未压缩存储的对象（storage.remote.compression: none）
+- 只读取基础库，尚未压缩进基础库的变更分段不可见，调用方需自行判断
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import apsw
+    HAS_APSW = True
+except ImportError:
+    apsw = None
+    HAS_APSW = False
+
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+DEFAULT_CACHE_BLOCKS = 256
+
+
+class RangedObject:
+    """
+    远程对象的块缓存读取器
+
+    读取按 block_size 对齐成块，缺失的相邻块合并为一次范围请求；
+    缓存最多保留 max_blocks 个块，按最近使用淘汰。
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        key: str,
+        size: int,
+        etag: str = "",
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_blocks: int = DEFAULT_CACHE_BLOCKS,
+    ):
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.key = key
+        self.size = size
+        self.etag = etag
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+
+        self._blocks: "OrderedDict[int, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 统计信息
+        self.requests = 0
+        self.bytes_fetched = 0
+
+    def _fetch(self, first_block: int, last_block: int) -> None:
+        """用一次范围请求读取 [first_block, last_block] 并放入缓存"""
+        start = first_block * self.block_size
+        end = min((last_block + 1) * self.block_size, self.size) - 1
+        request = {
+            "Bucket": self.bucket_name,
+            "Key": self.key,
+            "Range": f"bytes={start}-{end}",
+        }
+        # 对象在查询期间被替换时请求失败，避免读到新旧混合的页面
+        if self.etag:
+            request["IfMatch"] = f'"{self.etag}"'
+        response = self.s3_client.get_object(**request)
+        body = response["Body"]
+        try:
+            data = body.read()
+        finally:
+            body.close()
+
+        if len(data) != end - start + 1:
+            raise IOError(f"范围读取长度不符: {self.key} bytes={start}-{end}, 实际 {len(data)}")
+
+        self.requests += 1
+        self.bytes_fetched += len(data)
+
+        for block in range(first_block, last_block + 1):
+            offset = (block - first_block) * self.block_size
+            self._blocks[block] = data[offset:offset + self.block_size]
+            self._blocks.move_to_end(block)
+
+    def read(self, offset: int, amount: int) -> bytes:
+        """
+        读取 [offset, offset + amount) 范围的数据
+
+        超出对象末尾的部分不返回（调用方按短读处理）。
+        """
+        if amount <= 0 or offset >= self.size:
+            return b""
+        end = min(offset + amount, self.size)
+        first_block = offset // self.block_size
+        last_block = (end - 1) // self.block_size
+
+        with self._lock:
+            # 合并相邻的缺失块
+            missing: List[Tuple[int, int]] = []
+            for block in range(first_block, last_block + 1):
+                if block in self._blocks:
+                    self._blocks.move_to_end(block)
+                elif missing and missing[-1][1] == block - 1:
+                    missing[-1] = (missing[-1][0], block)
+                else:
+                    missing.append((block, block))
+            for start_block, end_block in missing:
+                self._fetch(start_block, end_block)
+
+            chunks = [self._blocks[block] for block in range(first_block, last_block + 1)]
+
+            # 取出本次数据后再淘汰：单次读取跨越的块数超过上限时不会淘汰正在读取的块
+            while len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+
+        data = b"".join(chunks)
+        start = offset - first_block * self.block_size
+        return data[start:start + (end - offset)]
+
+
+if HAS_APSW:
+
+    class _RangedVFSFile:
+        """VFS 文件：只读，所有读取转发到 RangedObject"""
+
+        def __init__(self, ranged: RangedObject):
+            self.ranged = ranged
+
+        def xRead(self, amount: int, offset: int) -> bytes:
+            data = self.ranged.read(offset, amount)
+            if len(data) < amount:
+                # SQLite 要求短读时补零
+                data += b"\x00" * (amount - len(data))
+            return data
+
+        def xFileSize(self) -> int:
+            return self.ranged.size
+
+        def xWrite(self, data, offset: int) -> None:
+            raise apsw.ReadOnlyError("远程数据库只读")
+
+        def xTruncate(self, newsize: int) -> None:
+            raise apsw.ReadOnlyError("远程数据库只读")
+
+        def xSync(self, flags: int) -> None:
+            pass
+
+        def xLock(self, level: int) -> None:
+            pass
+
+        def xUnlock(self, level: int) -> None:
+            pass
+
+        def xCheckReservedLock(self) -> bool:
+            return False
+
+        def xFileControl(self, op: int, ptr: int) -> bool:
+            return False
+
+        def xSectorSize(self) -> int:
+            return 4096
+
+        def xDeviceCharacteristics(self) -> int:
+            return apsw.SQLITE_IOCAP_IMMUTABLE
+
+        def xClose(self) -> None:
+            pass
+
+    class S3ReadOnlyVFS(apsw.VFS):
+        """
+        S3 只读 VFS
+
+        文件名即对象键；打开前需通过 register_object 登记对象大小和 ETag。
+        """
+
+        def __init__(
+            self,
+            s3_client,
+            bucket_name: str,
+            block_size: int = DEFAULT_BLOCK_SIZE,
+            cache_blocks: int = DEFAULT_CACHE_BLOCKS,
+        ):
+            self.vfs_name = f"trendradar-s3-{uuid.uuid4().hex[:8]}"
+            self.s3_client = s3_client
+            self.bucket_name = bucket_name
+            self.block_size = block_size
+            self.cache_blocks = cache_blocks
+            self._objects: Dict[str, RangedObject] = {}
+            super().__init__(self.vfs_name, base="")
+
+        def register_object(self, key: str, size: int, etag: str = "") -> RangedObject:
+            """登记对象；ETag 变化时丢弃旧的块缓存"""
+            ranged = self._objects.get(key)
+            if ranged is None or ranged.etag != etag or ranged.size != size:
+                ranged = RangedObject(
+                    self.s3_client, self.bucket_name, key, size, etag,
+                    self.block_size, self.cache_blocks,
+                )
+                self._objects[key] = ranged
+            return ranged
+
+        def get_object(self, key: str) -> Optional[RangedObject]:
+            return self._objects.get(key)
+
+        def xOpen(self, name, flags):
+            key = name.filename() if isinstance(name, apsw.URIFilename) else name
+            key = (key or "").lstrip("/")
+            ranged = self._objects.get(key)
+            if ranged is None:
+                raise apsw.CantOpenError(f"未登记的远程对象: {key}")
+            # 只读打开，输出标志保持 SQLITE_OPEN_READONLY
+            flags[1] = apsw.SQLITE_OPEN_READONLY
+            return _RangedVFSFile(ranged)
+
+        def xAccess(self, pathname: str, flags: int) -> bool:
+            # 只读数据库不存在 -journal / -wal 等附属文件
+            return pathname.lstrip("/") in self._objects
+
+        def xFullPathname(self, name: str) -> str:
+            return "/" + name.lstrip("/")
+
+        def xDelete(self, filename: str, syncdir: bool) -> None:
+            raise apsw.ReadOnlyError("远程数据库只读")
+
+        def open_connection(self, key: str) -> "apsw.Connection":
+            """以只读、不可变方式打开已登记的对象"""
+            return apsw.Connection(
+                f"file:/{key}?immutable=1",
+                flags=apsw.SQLITE_OPEN_READONLY | apsw.SQLITE_OPEN_URI,
+                vfs=self.vfs_name,
+            )
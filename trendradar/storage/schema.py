@@ -0,0 +1,232 @@
+# coding=utf-8
+"""
+SQLite 表结构初始化、迁移与通用查询
+
+本地和远程存储后端共用：
+- init_schema: 迁移旧版数据库并执行 schema.sql
+- 旧版数据库补充 title_hash 列，并合并重复的无 URL 条目
+- iter_news_items: 从游标流式读取新闻条目（含排名历史）
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from trendradar.storage.base import NewsItem, compute_title_hash
+
+
+SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+
+
+def init_schema(conn: sqlite3.Connection, schema_path: Optional[Path] = None) -> None:
+    """
+    初始化数据库表结构（兼容旧版数据库）
+
+    Args:
+        conn: 数据库连接
+        schema_path: schema.sql 路径，默认使用模块内置文件
+    """
+    schema_path = Path(schema_path) if schema_path else SCHEMA_PATH
+    if not schema_path.exists():
+        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+
+    # 旧版数据库需先补列，schema.sql 中的索引依赖 title_hash 列
+    _ensure_title_hash_column(conn)
+    _backfill_title_hash(conn)
+
+    with open(schema_path, "r", encoding="utf-8") as f:
+        schema_sql = f.read()
+    conn.executescript(schema_sql)
+    conn.commit()
+
+
+def _ensure_title_hash_column(conn: sqlite3.Connection) -> None:
+    """为旧版 news_items 表添加 title_hash 列"""
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(news_items)")]
+    if columns and "title_hash" not in columns:
+        conn.execute("ALTER TABLE news_items ADD COLUMN title_hash INTEGER")
+        conn.commit()
+
+
+def _backfill_title_hash(conn: sqlite3.Connection) -> int:
+    """
+    为缺少 title_hash 的记录补充哈希，并合并重复的无 URL 条目
+
+    旧版本每次抓取都会为无 URL 的标题插入新行，这里将同一平台、
+    同一标题的多行合并为一行（排名历史一并迁移）。
+
+    Returns:
+        合并掉的重复记录数
+    """
+    try:
+        rows = conn.execute("""
+            SELECT id, platform_id, title, url FROM news_items
+            WHERE title_hash IS NULL
+            ORDER BY id
+        """).fetchall()
+    except sqlite3.OperationalError:
+        # 表尚未创建
+        return 0
+
+    if not rows:
+        return 0
+
+    cursor = conn.cursor()
+    keepers: Dict[int, int] = {}
+    merged_count = 0
+
+    for news_id, platform_id, title, url in rows:
+        title_hash = compute_title_hash(platform_id, title)
+
+        if url:
+            cursor.execute(
+                "UPDATE news_items SET title_hash = ? WHERE id = ?",
+                (title_hash, news_id),
+            )
+            continue
+
+        keeper_id = keepers.get(title_hash)
+        if keeper_id is None:
+            cursor.execute("""
+                SELECT id FROM news_items WHERE title_hash = ? AND url = ''
+            """, (title_hash,))
+            row = cursor.fetchone()
+            keeper_id = row[0] if row else None
+
+        if keeper_id is None:
+            cursor.execute(
+                "UPDATE news_items SET title_hash = ? WHERE id = ?",
+                (title_hash, news_id),
+            )
+            keepers[title_hash] = news_id
+        else:
+            _merge_news_item(cursor, keeper_id, news_id)
+            keepers[title_hash] = keeper_id
+            merged_count += 1
+
+    conn.commit()
+
+    if merged_count:
+        print(f"[存储] 已合并 {merged_count} 条重复的无 URL 记录")
+
+    return merged_count
+
+
+def _merge_news_item(cursor: sqlite3.Cursor, keep_id: int, dup_id: int) -> None:
+    """将重复记录 dup_id 合并到 keep_id 并删除 dup_id"""
+    cursor.execute("""
+        SELECT title, rank, mobile_url, first_crawl_time, last_crawl_time, crawl_count
+        FROM news_items WHERE id IN (?, ?)
+        ORDER BY id = ?
+    """, (keep_id, dup_id, dup_id))
+    keep, dup = cursor.fetchall()
+
+    first_time = min(keep[3], dup[3])
+    # 以最后一次出现的记录为准更新当前排名
+    latest = dup if dup[4] >= keep[4] else keep
+
+    cursor.execute("""
+        UPDATE news_items SET
+            title = ?,
+            rank = ?,
+            mobile_url = ?,
+            first_crawl_time = ?,
+            last_crawl_time = ?,
+            crawl_count = ?
+        WHERE id = ?
+    """, (latest[0], latest[1], latest[2], first_time, latest[4],
+          (keep[5] or 1) + (dup[5] or 1), keep_id))
+
+    cursor.execute(
+        "UPDATE rank_history SET news_item_id = ? WHERE news_item_id = ?",
+        (keep_id, dup_id),
+    )
+    cursor.execute(
+        "UPDATE title_changes SET news_item_id = ? WHERE news_item_id = ?",
+        (keep_id, dup_id),
+    )
+    cursor.execute("DELETE FROM news_items WHERE id = ?", (dup_id,))
+
+
+def iter_news_items(
+    conn: sqlite3.Connection,
+    platforms: Optional[List[str]] = None,
+    since: Optional[str] = None,
+    batch_size: int = 500,
+) -> Iterator[NewsItem]:
+    """
+    从数据库流式读取新闻条目
+
+    news_items 与 rank_history 在一条查询中联表，按条目分组后逐条产出，
+    内存占用与当天数据量无关。
+
+    Args:
+        conn: 数据库连接
+        platforms: 只返回这些平台的条目，None 表示全部
+        since: 只返回 last_crawl_time 不早于该时间的条目
+        batch_size: 每次从游标读取的行数
+
+    Yields:
+        NewsItem（按平台、最后出现时间排序，ranks 为去重后的排名历史）
+    """
+    conditions = []
+    params: List = []
+    if platforms is not None:
+        if not platforms:
+            return
+        conditions.append(f"n.platform_id IN ({','.join('?' * len(platforms))})")
+        params.extend(platforms)
+    if since:
+        conditions.append("n.last_crawl_time >= ?")
+        params.append(since)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    cursor = conn.execute(f"""
+        SELECT n.id, n.title, n.platform_id, p.name as platform_name,
+               n.rank, n.url, n.mobile_url,
+               n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+               rh.rank as history_rank
+        FROM news_items n
+        LEFT JOIN platforms p ON n.platform_id = p.id
+        LEFT JOIN rank_history rh ON rh.news_item_id = n.id
+        {where}
+        ORDER BY n.platform_id, n.last_crawl_time, n.id, rh.crawl_time
+    """, params)
+
+    current_id = None
+    current_row = None
+    ranks: List[int] = []
+
+    def build_item(row, ranks: List[int]) -> NewsItem:
+        platform_id = row[2]
+        return NewsItem(
+            title=row[1],
+            source_id=platform_id,
+            source_name=row[3] or platform_id,
+            rank=row[4],
+            url=row[5] or "",
+            mobile_url=row[6] or "",
+            crawl_time=row[8],  # last_crawl_time
+            ranks=ranks or [row[4]],
+            first_time=row[7],  # first_crawl_time
+            last_time=row[8],   # last_crawl_time
+            count=row[9],       # crawl_count
+        )
+
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        for row in rows:
+            if row[0] != current_id:
+                if current_row is not None:
+                    yield build_item(current_row, ranks)
+                current_id = row[0]
+                current_row = row
+                ranks = []
+            history_rank = row[10]
+            if history_rank is not None and history_rank not in ranks:
+                ranks.append(history_rank)
+
+    if current_row is not None:
+        yield build_item(current_row, ranks)
@@ -14,6 +14,7 @@ CREATE TABLE IF NOT EXISTS platforms (
 -- ============================================
 -- 新闻条目表
 -- 以 URL + platform_id 为唯一标识，支持去重存储
+-- 无 URL 的条目以 title_hash（平台 + 规范化标题的 64 位哈希）为唯一标识
 -- ============================================
 CREATE TABLE IF NOT EXISTS news_items (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -25,6 +26,7 @@ CREATE TABLE IF NOT EXISTS news_items (
     first_crawl_time TEXT NOT NULL,      -- 首次抓取时间
     last_crawl_time TEXT NOT NULL,       -- 最后抓取时间
     crawl_count INTEGER DEFAULT 1,       -- 抓取次数
+    title_hash INTEGER,                  -- 平台 + 规范化标题的 64 位哈希
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (platform_id) REFERENCES platforms(id)
@@ -93,6 +95,15 @@ CREATE TABLE IF NOT EXISTS push_records (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- ============================================
+-- 已合并分段表
+-- 远程增量模式下记录已合并进本库的变更分段，避免重复合并
+-- ============================================
+CREATE TABLE IF NOT EXISTS applied_segments (
+    segment_key TEXT PRIMARY KEY,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- ============================================
 -- 索引定义
 -- ============================================
@@ -110,6 +121,13 @@ CREATE INDEX IF NOT EXISTS idx_news_title ON news_items(title);
 CREATE UNIQUE INDEX IF NOT EXISTS idx_news_url_platform
     ON news_items(url, platform_id) WHERE url != '';
 
+-- 标题哈希索引（用于新增标题检测等整数比较）
+CREATE INDEX IF NOT EXISTS idx_news_title_hash ON news_items(title_hash);
+
+-- title_hash 唯一索引（仅对空 URL，实现去重）
+CREATE UNIQUE INDEX IF NOT EXISTS idx_news_title_hash_no_url
+    ON news_items(title_hash) WHERE url = '';
+
 -- 抓取状态索引
 CREATE INDEX IF NOT EXISTS idx_crawl_status_record ON crawl_source_status(crawl_record_id);
 
@@ -0,0 +1,372 @@
+# coding=utf-8
+"""
+SQLite 变更分段
+
+远程存储的增量模式使用"基础库 + 变更分段"布局：
+- 每次抓取只把本次写入的行导出为一个小型 SQLite 文件（分段）上传
+- 读取时先下载基础库，再按顺序合并所有未合并的分段
+- 分段累积到一定数量后，把合并结果作为新的基础库上传并删除分段
+
+合并按业务唯一键（URL + platform_id / title_hash、crawl_time、date）进行，
+不依赖各库中的自增 ID，因此同样适用于合并两个独立的当日数据库
+（如多个抓取节点各自写入的同一天数据，见 merge_day_databases）。
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from trendradar.storage.base import compute_title_hash
+from trendradar.storage.schema import init_schema
+
+
+# news_items 显式列清单（旧库迁移后的列顺序与新库不同，不能使用 SELECT *）
+NEWS_ITEM_COLUMNS = (
+    "id, title, platform_id, rank, url, mobile_url, first_crawl_time, "
+    "last_crawl_time, crawl_count, title_hash, created_at, updated_at"
+)
+
+
+def capture_marks(conn: sqlite3.Connection) -> Dict[str, int]:
+    """
+    记录当前各追加表的最大 ID，作为导出分段的起点
+
+    Returns:
+        {"rank_history": max_id, "title_changes": max_id}
+    """
+    marks = {}
+    for table in ("rank_history", "title_changes"):
+        row = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()
+        marks[table] = row[0]
+    return marks
+
+
+def write_segment(
+    conn: sqlite3.Connection,
+    segment_path: Path,
+    marks: Dict[str, int],
+    crawl_time: Optional[str] = None,
+    push_date: Optional[str] = None,
+) -> int:
+    """
+    将 marks 之后写入的行导出为分段文件
+
+    Args:
+        conn: 当日数据库连接（已提交）
+        segment_path: 分段文件路径
+        marks: capture_marks 的返回值
+        crawl_time: 本次抓取时间（导出对应的抓取记录）
+        push_date: 推送日期（导出对应的推送记录）
+
+    Returns:
+        分段中的新闻条目数
+    """
+    segment_path = Path(segment_path)
+    segment_path.parent.mkdir(parents=True, exist_ok=True)
+    if segment_path.exists():
+        segment_path.unlink()
+
+    seg_conn = sqlite3.connect(str(segment_path))
+    try:
+        # 分段只有少量行，使用小页面减小空表和索引占用的体积
+        seg_conn.execute("PRAGMA page_size = 1024")
+        init_schema(seg_conn)
+    finally:
+        seg_conn.close()
+
+    rh_mark = marks.get("rank_history", 0)
+    tc_mark = marks.get("title_changes", 0)
+
+    conn.execute("ATTACH DATABASE ? AS seg", (str(segment_path),))
+    try:
+        conn.execute("""
+            INSERT INTO seg.platforms (id, name, is_active, updated_at)
+            SELECT id, name, is_active, updated_at FROM main.platforms
+        """)
+        cursor = conn.execute(f"""
+            INSERT INTO seg.news_items ({NEWS_ITEM_COLUMNS})
+            SELECT {NEWS_ITEM_COLUMNS} FROM main.news_items
+            WHERE id IN (SELECT news_item_id FROM main.rank_history WHERE id > ?)
+               OR id IN (SELECT news_item_id FROM main.title_changes WHERE id > ?)
+        """, (rh_mark, tc_mark))
+        item_count = cursor.rowcount
+        conn.execute("""
+            INSERT INTO seg.rank_history (id, news_item_id, rank, crawl_time, created_at)
+            SELECT id, news_item_id, rank, crawl_time, created_at FROM main.rank_history
+            WHERE id > ?
+        """, (rh_mark,))
+        conn.execute("""
+            INSERT INTO seg.title_changes (id, news_item_id, old_title, new_title, changed_at)
+            SELECT id, news_item_id, old_title, new_title, changed_at FROM main.title_changes
+            WHERE id > ?
+        """, (tc_mark,))
+
+        if crawl_time:
+            conn.execute("""
+                INSERT INTO seg.crawl_records (id, crawl_time, total_items, created_at)
+                SELECT id, crawl_time, total_items, created_at FROM main.crawl_records
+                WHERE crawl_time = ?
+            """, (crawl_time,))
+            conn.execute("""
+                INSERT INTO seg.crawl_source_status (crawl_record_id, platform_id, status)
+                SELECT css.crawl_record_id, css.platform_id, css.status
+                FROM main.crawl_source_status css
+                JOIN main.crawl_records cr ON css.crawl_record_id = cr.id
+                WHERE cr.crawl_time = ?
+            """, (crawl_time,))
+
+        if push_date:
+            conn.execute("""
+                INSERT INTO seg.push_records (date, pushed, push_time, report_type, created_at)
+                SELECT date, pushed, push_time, report_type, created_at FROM main.push_records
+                WHERE date = ?
+            """, (push_date,))
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute("DETACH DATABASE seg")
+
+    return item_count
+
+
+def apply_segment(
+    conn: sqlite3.Connection,
+    segment_path: Path,
+    segment_key: Optional[str] = None,
+) -> bool:
+    """
+    将分段（或另一个当日数据库）合并到当前数据库
+
+    Args:
+        conn: 目标数据库连接
+        segment_path: 分段文件路径
+        segment_key: 分段标识，非空时记录到 applied_segments，已合并过的分段会被跳过
+
+    Returns:
+        是否执行了合并（已合并过返回 False）
+    """
+    if segment_key:
+        row = conn.execute(
+            "SELECT 1 FROM applied_segments WHERE segment_key = ?", (segment_key,)
+        ).fetchone()
+        if row:
+            return False
+
+    conn.commit()
+    conn.execute("ATTACH DATABASE ? AS seg", (str(segment_path),))
+    try:
+        _merge_attached(conn, "seg")
+        if segment_key:
+            conn.execute(
+                "INSERT OR IGNORE INTO applied_segments (segment_key) VALUES (?)",
+                (segment_key,),
+            )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute("DETACH DATABASE seg")
+
+    return True
+
+
+def merge_day_databases(target_path: Path, source_path: Path) -> Dict[str, int]:
+    """
+    把另一个同结构的当日数据库合并到目标数据库
+
+    - news_items 按 (url, platform_id) 合并，无 URL 时按 title_hash 合并
+    - rank_history 按 (条目, crawl_time) 去重合并，crawl_count 据此重新计算
+    - crawl_records 按 crawl_time 合并，total_items 取较大值
+
+    合并是幂等的，重复合并同一个源库不会产生重复数据。
+
+    Args:
+        target_path: 目标数据库路径（不存在时创建）
+        source_path: 源数据库路径（旧版结构会先迁移）
+
+    Returns:
+        合并后目标库的统计 {"news_items", "rank_history", "crawl_records"}
+    """
+    source_conn = sqlite3.connect(str(source_path))
+    try:
+        init_schema(source_conn)
+    finally:
+        source_conn.close()
+
+    conn = sqlite3.connect(str(target_path))
+    try:
+        init_schema(conn)
+        apply_segment(conn, Path(source_path))
+        return {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("news_items", "rank_history", "crawl_records")
+        }
+    finally:
+        conn.close()
+
+
+def _merge_attached(conn: sqlite3.Connection, schema: str) -> None:
+    """将已附加的数据库 schema 中的数据合并到 main（调用方负责事务）"""
+    cursor = conn.cursor()
+
+    # 平台信息
+    cursor.execute(f"""
+        INSERT INTO main.platforms (id, name, is_active, updated_at)
+        SELECT id, name, is_active, updated_at FROM {schema}.platforms WHERE true
+        ON CONFLICT(id) DO UPDATE SET
+            name = excluded.name,
+            updated_at = excluded.updated_at
+    """)
+
+    # 新闻条目：按业务唯一键映射到 main 中的 ID
+    id_map: Dict[int, int] = {}
+    seg_rows = cursor.execute(f"""
+        SELECT id, title, platform_id, rank, url, mobile_url,
+               first_crawl_time, last_crawl_time, title_hash, created_at, updated_at
+        FROM {schema}.news_items
+        ORDER BY id
+    """).fetchall()
+
+    for row in seg_rows:
+        (seg_id, title, platform_id, rank, url, mobile_url,
+         first_time, last_time, title_hash, created_at, updated_at) = row
+        if title_hash is None:
+            title_hash = compute_title_hash(platform_id, title)
+
+        if url:
+            cursor.execute("""
+                SELECT id, first_crawl_time, last_crawl_time FROM main.news_items
+                WHERE url = ? AND platform_id = ?
+            """, (url, platform_id))
+        else:
+            cursor.execute("""
+                SELECT id, first_crawl_time, last_crawl_time FROM main.news_items
+                WHERE title_hash = ? AND url = ''
+            """, (title_hash,))
+        existing = cursor.fetchone()
+
+        if existing:
+            main_id, main_first, main_last = existing
+            if last_time >= main_last:
+                # 分段中的记录更新，以分段为准
+                cursor.execute("""
+                    UPDATE main.news_items SET
+                        title = ?,
+                        title_hash = ?,
+                        rank = ?,
+                        mobile_url = ?,
+                        last_crawl_time = ?,
+                        updated_at = ?
+                    WHERE id = ?
+                """, (title, title_hash, rank, mobile_url, last_time, updated_at, main_id))
+            if first_time < main_first:
+                cursor.execute(
+                    "UPDATE main.news_items SET first_crawl_time = ? WHERE id = ?",
+                    (first_time, main_id),
+                )
+        else:
+            cursor.execute("""
+                INSERT INTO main.news_items
+                (title, platform_id, rank, url, mobile_url,
+                 first_crawl_time, last_crawl_time, crawl_count,
+                 title_hash, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?)
+            """, (title, platform_id, rank, url or "", mobile_url or "",
+                  first_time, last_time, title_hash, created_at, updated_at))
+            main_id = cursor.lastrowid
+
+        id_map[seg_id] = main_id
+
+    # 排名历史（同一条目同一抓取时间只保留一条）
+    for news_item_id, rank, crawl_time, created_at in cursor.execute(f"""
+        SELECT news_item_id, rank, crawl_time, created_at FROM {schema}.rank_history
+        ORDER BY id
+    """).fetchall():
+        main_id = id_map.get(news_item_id)
+        if main_id is None:
+            continue
+        conn.execute("""
+            INSERT INTO main.rank_history (news_item_id, rank, crawl_time, created_at)
+            SELECT ?, ?, ?, ?
+            WHERE NOT EXISTS (
+                SELECT 1 FROM main.rank_history WHERE news_item_id = ? AND crawl_time = ?
+            )
+        """, (main_id, rank, crawl_time, created_at, main_id, crawl_time))
+
+    # 标题变更历史
+    for news_item_id, old_title, new_title, changed_at in cursor.execute(f"""
+        SELECT news_item_id, old_title, new_title, changed_at FROM {schema}.title_changes
+        ORDER BY id
+    """).fetchall():
+        main_id = id_map.get(news_item_id)
+        if main_id is None:
+            continue
+        conn.execute("""
+            INSERT INTO main.title_changes (news_item_id, old_title, new_title, changed_at)
+            SELECT ?, ?, ?, ?
+            WHERE NOT EXISTS (
+                SELECT 1 FROM main.title_changes
+                WHERE news_item_id = ? AND old_title = ? AND new_title = ? AND changed_at = ?
+            )
+        """, (main_id, old_title, new_title, changed_at,
+              main_id, old_title, new_title, changed_at))
+
+    # 抓取次数以排名历史中的不同抓取时间为准，合并后依然准确
+    _recount_crawls(conn, list(set(id_map.values())))
+
+    # 抓取记录及来源状态
+    for seg_record_id, crawl_time, total_items, created_at in cursor.execute(f"""
+        SELECT id, crawl_time, total_items, created_at FROM {schema}.crawl_records
+    """).fetchall():
+        conn.execute("""
+            INSERT INTO main.crawl_records (crawl_time, total_items, created_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(crawl_time) DO UPDATE SET
+                total_items = MAX(total_items, excluded.total_items)
+        """, (crawl_time, total_items, created_at))
+        main_record_id = conn.execute(
+            "SELECT id FROM main.crawl_records WHERE crawl_time = ?", (crawl_time,)
+        ).fetchone()[0]
+        conn.execute(f"""
+            INSERT OR REPLACE INTO main.crawl_source_status (crawl_record_id, platform_id, status)
+            SELECT ?, platform_id, status FROM {schema}.crawl_source_status
+            WHERE crawl_record_id = ?
+        """, (main_record_id, seg_record_id))
+
+    # 推送记录
+    cursor.execute(f"""
+        INSERT INTO main.push_records (date, pushed, push_time, report_type, created_at)
+        SELECT date, pushed, push_time, report_type, created_at FROM {schema}.push_records WHERE true
+        ON CONFLICT(date) DO UPDATE SET
+            pushed = MAX(pushed, excluded.pushed),
+            push_time = COALESCE(excluded.push_time, push_time),
+            report_type = COALESCE(excluded.report_type, report_type)
+    """)
+
+    # 被合并的库已包含的分段，main 合并后同样包含
+    has_applied = cursor.execute(f"""
+        SELECT 1 FROM {schema}.sqlite_master WHERE type = 'table' AND name = 'applied_segments'
+    """).fetchone()
+    if has_applied:
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO main.applied_segments (segment_key, applied_at)
+            SELECT segment_key, applied_at FROM {schema}.applied_segments
+        """)
+
+
+def _recount_crawls(conn: sqlite3.Connection, news_ids: List[int], batch_size: int = 500) -> None:
+    """根据排名历史重新计算条目的抓取次数"""
+    for i in range(0, len(news_ids), batch_size):
+        batch = news_ids[i:i + batch_size]
+        placeholders = ",".join("?" * len(batch))
+        conn.execute(f"""
+            UPDATE main.news_items SET crawl_count = MAX(1, (
+                SELECT COUNT(DISTINCT crawl_time) FROM main.rank_history
+                WHERE news_item_id = news_items.id
+            ))
+            WHERE id IN ({placeholders})
+        """, batch)
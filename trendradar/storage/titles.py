@@ -0,0 +1,179 @@
+# coding=utf-8
+"""
+标题表 - 紧凑的当天标题内存模型
+
+所有标题按行存入一张列式表（整数行号），每行只保存一份排名/链接/时间数据，
+再通过只读映射视图暴露为原有的两种嵌套字典结构：
+
+- results:    {source_id: {title: {"ranks", "url", "mobileUrl"}}}
+- title_info: {source_id: {title: {"first_time", "last_time", "count", "ranks", "url", "mobileUrl"}}}
+
+视图按需生成内层字典，调用方可以像普通字典一样读取（in / [] / get / items 等），
+但不能修改。
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional
+
+
+class TitleTable:
+    """
+    当天标题表
+
+    每个 (source_id, title) 对应一个整数行号，各字段按列存储。
+    时间和平台 ID 等高重复字符串会被驻留（intern），避免重复占用内存。
+    """
+
+    __slots__ = (
+        "_index",
+        "_ranks",
+        "_urls",
+        "_mobile_urls",
+        "_first_times",
+        "_last_times",
+        "_counts",
+    )
+
+    def __init__(self):
+        self._index: Dict[str, Dict[str, int]] = {}
+        self._ranks: List[List[int]] = []
+        self._urls: List[str] = []
+        self._mobile_urls: List[str] = []
+        self._first_times: List[str] = []
+        self._last_times: List[str] = []
+        self._counts: List[int] = []
+
+    def add(
+        self,
+        source_id: str,
+        title: str,
+        ranks: List[int],
+        url: str = "",
+        mobile_url: str = "",
+        first_time: str = "",
+        last_time: str = "",
+        count: int = 1,
+    ) -> int:
+        """
+        添加或覆盖一行
+
+        同一平台下重复的标题会覆盖旧行（与原嵌套字典的赋值语义一致）。
+
+        Returns:
+            行号
+        """
+        source_id = sys.intern(source_id)
+        first_time = sys.intern(first_time or "")
+        last_time = sys.intern(last_time or "")
+
+        source_rows = self._index.get(source_id)
+        if source_rows is None:
+            source_rows = self._index[source_id] = {}
+
+        row_id = source_rows.get(title)
+        if row_id is None:
+            row_id = len(self._counts)
+            source_rows[title] = row_id
+            self._ranks.append(ranks)
+            self._urls.append(url or "")
+            self._mobile_urls.append(mobile_url or "")
+            self._first_times.append(first_time)
+            self._last_times.append(last_time)
+            self._counts.append(count)
+        else:
+            self._ranks[row_id] = ranks
+            self._urls[row_id] = url or ""
+            self._mobile_urls[row_id] = mobile_url or ""
+            self._first_times[row_id] = first_time
+            self._last_times[row_id] = last_time
+            self._counts[row_id] = count
+
+        return row_id
+
+    def add_source(self, source_id: str) -> None:
+        """登记平台（即使没有标题也会出现在视图中）"""
+        self._index.setdefault(sys.intern(source_id), {})
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def results_view(self) -> "TitleTableView":
+        """results 兼容视图"""
+        return TitleTableView(self, self._result_row)
+
+    def title_info_view(self) -> "TitleTableView":
+        """title_info 兼容视图"""
+        return TitleTableView(self, self._info_row)
+
+    def _result_row(self, row_id: int) -> Dict:
+        return {
+            "ranks": self._ranks[row_id],
+            "url": self._urls[row_id],
+            "mobileUrl": self._mobile_urls[row_id],
+        }
+
+    def _info_row(self, row_id: int) -> Dict:
+        return {
+            "first_time": self._first_times[row_id],
+            "last_time": self._last_times[row_id],
+            "count": self._counts[row_id],
+            "ranks": self._ranks[row_id],
+            "url": self._urls[row_id],
+            "mobileUrl": self._mobile_urls[row_id],
+        }
+
+
+class TitleTableView(Mapping):
+    """标题表的只读视图：{source_id: {title: row_dict}}"""
+
+    __slots__ = ("_table", "_make_row")
+
+    def __init__(self, table: TitleTable, make_row):
+        self._table = table
+        self._make_row = make_row
+
+    def __getitem__(self, source_id: str) -> "_SourceView":
+        rows = self._table._index[source_id]
+        return _SourceView(rows, self._make_row)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table._index)
+
+    def __len__(self) -> int:
+        return len(self._table._index)
+
+    def __contains__(self, source_id) -> bool:
+        return source_id in self._table._index
+
+    def __repr__(self) -> str:
+        return f"TitleTableView({len(self)} sources, {len(self._table)} titles)"
+
+
+class _SourceView(Mapping):
+    """单个平台的只读视图：{title: row_dict}"""
+
+    __slots__ = ("_rows", "_make_row")
+
+    def __init__(self, rows: Dict[str, int], make_row):
+        self._rows = rows
+        self._make_row = make_row
+
+    def __getitem__(self, title: str) -> Dict:
+        return self._make_row(self._rows[title])
+
+    def get(self, title: str, default: Optional[Dict] = None) -> Optional[Dict]:
+        row_id = self._rows.get(title)
+        return default if row_id is None else self._make_row(row_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, title) -> bool:
+        return title in self._rows
+
+    def __repr__(self) -> str:
+        return f"_SourceView({len(self)} titles)"
@@ -0,0 +1,168 @@
+# coding=utf-8
+"""
+远程传输编解码
+
+上传前压缩 SQLite 文件、下载后解压并校验：
+- 支持 none / gzip / lzma 三种压缩方式
+- 原始内容的 SHA-256 写入对象元数据，下载时校验
+- 旧版未压缩、无校验信息的对象按原样读取
+"""
+
+import base64
+import gzip
+import hashlib
+import lzma
+import os
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple
+
+
+# 支持的压缩方式
+COMPRESSION_CODECS = ("none", "gzip", "lzma")
+
+# 对象元数据键（S3 会以 x-amz-meta- 前缀存储，键名统一小写）
+META_COMPRESSION = "compression"
+META_SHA256 = "sha256"
+META_RAW_SIZE = "raw-size"
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class ChecksumMismatchError(ValueError):
+    """下载内容与元数据中的校验和不一致"""
+
+
+def normalize_codec(codec: Optional[str]) -> str:
+    """规范化压缩方式名称，未知值回退为 gzip"""
+    codec = (codec or "none").strip().lower()
+    if codec in ("", "false", "off", "no"):
+        return "none"
+    if codec not in COMPRESSION_CODECS:
+        print(f"[远程存储] 未知压缩方式 {codec}，使用 gzip")
+        return "gzip"
+    return codec
+
+
+def _open_writer(fileobj: BinaryIO, codec: str):
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=6, mtime=0)
+    if codec == "lzma":
+        return lzma.LZMAFile(fileobj, mode="wb", preset=6)
+    return None
+
+
+def _open_reader(fileobj: BinaryIO, codec: str):
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=fileobj, mode="rb")
+    if codec == "lzma":
+        return lzma.LZMAFile(fileobj, mode="rb")
+    return fileobj
+
+
+def pack_file(src_path: Path, dst_path: Path, codec: str) -> Tuple[Dict[str, str], str]:
+    """
+    压缩文件并计算校验信息
+
+    Args:
+        src_path: 原始文件路径
+        dst_path: 压缩后文件路径
+        codec: 压缩方式
+
+    Returns:
+        (对象元数据, 压缩后内容的 Base64 MD5，用于 ContentMD5 请求头)
+    """
+    codec = normalize_codec(codec)
+    sha256 = hashlib.sha256()
+    raw_size = 0
+
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        writer = _open_writer(dst, codec)
+        try:
+            while True:
+                chunk = src.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                sha256.update(chunk)
+                raw_size += len(chunk)
+                (writer or dst).write(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    md5 = hashlib.md5()
+    with open(dst_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            md5.update(chunk)
+
+    metadata = {
+        META_COMPRESSION: codec,
+        META_SHA256: sha256.hexdigest(),
+        META_RAW_SIZE: str(raw_size),
+    }
+    return metadata, base64.b64encode(md5.digest()).decode("ascii")
+
+
+def unpack_stream(body: BinaryIO, dst_path: Path, metadata: Optional[Dict[str, str]]) -> int:
+    """
+    解压下载流到目标文件并校验
+
+    先写入同目录临时文件，校验通过后原子替换目标文件。
+
+    Args:
+        body: 对象内容流（get_object 返回的 Body）
+        dst_path: 目标文件路径
+        metadata: 对象元数据
+
+    Returns:
+        解压后的字节数
+
+    Raises:
+        ChecksumMismatchError: 校验失败
+    """
+    metadata = {k.lower(): v for k, v in (metadata or {}).items()}
+    codec = normalize_codec(metadata.get(META_COMPRESSION, "none"))
+    expected = metadata.get(META_SHA256)
+
+    dst_path = Path(dst_path)
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dst_path.with_name(dst_path.name + ".download")
+
+    sha256 = hashlib.sha256()
+    raw_size = 0
+    try:
+        reader = _open_reader(body, codec)
+        with open(tmp_path, "wb") as dst:
+            while True:
+                chunk = reader.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                sha256.update(chunk)
+                raw_size += len(chunk)
+                dst.write(chunk)
+
+        if expected and sha256.hexdigest() != expected:
+            raise ChecksumMismatchError(
+                f"校验失败: 期望 {expected[:12]}…，实际 {sha256.hexdigest()[:12]}…"
+            )
+
+        os.replace(tmp_path, dst_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    return raw_size
+
+
+def etag_matches_md5(etag: Optional[str], content_md5_b64: str) -> bool:
+    """
+    检查上传返回的 ETag 是否与内容 MD5 一致
+
+    只有单段上传的 ETag 是内容 MD5；无法判断时（如分段上传的 ETag）视为一致。
+    """
+    if not etag:
+        return True
+    etag = etag.strip('"')
+    if len(etag) != 32 or "-" in etag:
+        return True
+    return etag.lower() == base64.b64decode(content_md5_b64).hex()
+
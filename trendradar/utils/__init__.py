@@ -10,6 +10,18 @@ from trendradar.utils.time import (
     get_current_time_display,
     convert_time_for_display,
 )
+from trendradar.utils.tracing import (
+    Tracer,
+    span,
+    start_trace,
+    end_trace,
+    get_tracer,
+    current_span,
+)
+from trendradar.utils.metrics import (
+    collect_run_metrics,
+    write_textfile,
+)
 
 __all__ = [
     "get_configured_time",
@@ -17,4 +29,14 @@ __all__ = [
     "format_time_filename",
     "get_current_time_display",
     "convert_time_for_display",
+    # 运行追踪
+    "Tracer",
+    "span",
+    "start_trace",
+    "end_trace",
+    "get_tracer",
+    "current_span",
+    # 指标导出
+    "collect_run_metrics",
+    "write_textfile",
 ]
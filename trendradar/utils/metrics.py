@@ -0,0 +1,184 @@
+# coding=utf-8
+"""
+Prometheus 文本指标导出
+
+每次运行结束时把本次运行的指标写为 node_exporter textfile collector 格式的文件
+（先写临时文件再原子替换，采集时不会读到半个文件）。
+
+指标全部来自运行追踪（见 trendradar.utils.tracing）中已记录的数据：
+- crawl.fetch: 各平台抓取耗时、条目数、是否失败
+- storage.save: 入库条目数
+- analysis.detect_new: 新增标题数
+- analysis.count: 各词组匹配标题数
+- report.html: HTML 报告大小
+- notify.send: 各渠道发送批次数、耗时、是否成功
+另外记录进程峰值内存（RSS）。
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    resource = None
+    HAS_RESOURCE = False
+
+from trendradar.utils.tracing import Tracer
+
+
+METRIC_PREFIX = "trendradar_"
+
+# 指标名 -> 帮助说明（输出顺序即此顺序）
+_METRIC_HELP = {
+    "run_timestamp_seconds": "Unix time when the run finished",
+    "run_duration_seconds": "Wall time of the whole run",
+    "run_success": "1 if the run finished without an exception",
+    "stage_duration_seconds": "Wall time per top-level stage (repeated stages summed)",
+    "crawl_duration_seconds": "Fetch time per platform",
+    "crawl_items": "Titles fetched per platform",
+    "crawl_failed": "1 if fetching the platform failed",
+    "crawl_failures": "Number of platforms that failed in this run",
+    "storage_items_stored": "News items written to the storage backend",
+    "new_titles": "New titles detected in the latest crawl",
+    "matched_titles": "Titles matched per keyword group",
+    "html_bytes": "Size of each generated HTML report",
+    "notification_batches": "Message batches prepared per channel",
+    "notification_send_seconds": "Send latency per channel",
+    "notification_success": "1 if any account of the channel succeeded",
+    "peak_rss_bytes": "Peak resident set size of the process",
+}
+
+
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    # 计数类保持整数，耗时等保留完整精度
+    if isinstance(value, int):
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if labels:
+        label_text = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels.items())
+        return f"{METRIC_PREFIX}{name}{{{label_text}}} {_format_value(value)}"
+    return f"{METRIC_PREFIX}{name} {_format_value(value)}"
+
+
+def get_peak_rss_bytes() -> Optional[int]:
+    """进程峰值 RSS（字节），平台不支持时返回 None"""
+    if not HAS_RESOURCE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 单位为 KB，macOS 为字节
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def collect_run_metrics(
+    tracer: Tracer, success: bool = True
+) -> List[Tuple[str, Dict[str, str], float]]:
+    """
+    从运行追踪中提取指标
+
+    Args:
+        tracer: 已结束的运行追踪
+        success: 本次运行是否成功
+
+    Returns:
+        [(指标名, 标签, 值), ...]
+    """
+    samples: List[Tuple[str, Dict[str, str], float]] = [
+        ("run_timestamp_seconds", {}, time.time()),
+        ("run_duration_seconds", {}, tracer.root.duration),
+        ("run_success", {}, 1 if success else 0),
+    ]
+
+    stage_durations: Dict[str, float] = {}
+    for stage in tracer.root.children:
+        stage_durations[stage.name] = stage_durations.get(stage.name, 0.0) + stage.duration
+    for name, duration in stage_durations.items():
+        samples.append(("stage_duration_seconds", {"stage": name}, duration))
+
+    failures = 0
+    new_titles_recorded = False
+    for current in tracer.iter_spans():
+        attrs = current.attrs
+        if current.name == "crawl.fetch":
+            labels = {"platform": attrs.get("platform", "")}
+            failed = bool(attrs.get("failed"))
+            failures += failed
+            samples.append(("crawl_duration_seconds", labels, current.duration))
+            samples.append(("crawl_items", labels, attrs.get("items", 0)))
+            samples.append(("crawl_failed", labels, 1 if failed else 0))
+        elif current.name == "storage.save":
+            samples.append(("storage_items_stored", {}, attrs.get("items", 0)))
+        elif current.name == "analysis.detect_new" and not new_titles_recorded:
+            # 后续阶段重复检测的是同一批次，只取第一次
+            samples.append(("new_titles", {}, attrs.get("items", 0)))
+            new_titles_recorded = True
+        elif current.name == "analysis.count":
+            report = "summary" if attrs.get("summary") else "realtime"
+            for group, count in attrs.get("group_counts", {}).items():
+                labels = {"report": report, "mode": attrs.get("mode", ""), "group": group}
+                samples.append(("matched_titles", labels, count))
+        elif current.name == "report.html" and "bytes" in attrs:
+            report = "summary" if attrs.get("summary") else "realtime"
+            samples.append(("html_bytes", {"report": report, "mode": attrs.get("mode", "")}, attrs["bytes"]))
+        elif current.name == "notify.send":
+            labels = {"channel": attrs.get("channel", ""), "report_type": attrs.get("report_type", "")}
+            samples.append(("notification_batches", labels, attrs.get("batches", 0)))
+            samples.append(("notification_send_seconds", labels, current.duration))
+            samples.append(("notification_success", labels, 1 if attrs.get("success") else 0))
+    samples.append(("crawl_failures", {}, failures))
+
+    peak_rss = get_peak_rss_bytes()
+    if peak_rss is not None:
+        samples.append(("peak_rss_bytes", {}, peak_rss))
+    return samples
+
+
+def render_textfile(samples: List[Tuple[str, Dict[str, str], float]]) -> str:
+    """按 Prometheus 文本格式输出（同名指标归为一组，附 HELP/TYPE）"""
+    grouped: Dict[str, List[str]] = {}
+    for name, labels, value in samples:
+        grouped.setdefault(name, []).append(_format_sample(name, labels, value))
+
+    lines = []
+    for name in list(_METRIC_HELP) + [n for n in grouped if n not in _METRIC_HELP]:
+        if name not in grouped:
+            continue
+        lines.append(f"# HELP {METRIC_PREFIX}{name} {_METRIC_HELP.get(name, name)}")
+        lines.append(f"# TYPE {METRIC_PREFIX}{name} gauge")
+        lines.extend(grouped[name])
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: str, tracer: Tracer, success: bool = True) -> str:
+    """
+    写出本次运行的指标文件（原子替换）
+
+    Args:
+        path: 目标文件路径（textfile collector 目录下的 *.prom 文件）
+        tracer: 已结束的运行追踪
+        success: 本次运行是否成功
+
+    Returns:
+        写入的文件路径
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    content = render_textfile(collect_run_metrics(tracer, success))
+
+    # 临时文件与目标同目录，保证 rename 是原子操作；collector 只读取 *.prom
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, target)
+    return str(target)
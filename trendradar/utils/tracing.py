@@ -0,0 +1,227 @@
+# coding=utf-8
+"""
+运行追踪模块
+
+轻量的阶段计时（span），记录每个阶段的耗时、条目数、字节数等属性：
+
+    from trendradar.utils.tracing import span
+
+    with span("storage.save", items=len(items)) as s:
+        ...
+        s.add(bytes=size)
+
+没有活动的追踪时 span() 返回空操作对象，各模块可以无条件埋点。
+NewsAnalyzer 每次运行开始一次追踪，结束时把 span 树写为 JSON 并打印一行摘要。
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class Span:
+    """一个计时阶段"""
+
+    __slots__ = ("name", "attrs", "start", "end", "children", "error")
+
+    def __init__(self, name: str, attrs: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.attrs: Dict[str, Any] = dict(attrs or {})
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.children: List["Span"] = []
+        self.error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """耗时（秒），未结束时为到当前为止的耗时"""
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.start
+
+    def set(self, **attrs: Any) -> None:
+        """设置属性"""
+        self.attrs.update(attrs)
+
+    def add(self, **counters: float) -> None:
+        """累加计数属性（如 items、bytes）"""
+        for key, value in counters.items():
+            self.attrs[key] = self.attrs.get(key, 0) + value
+
+    def to_dict(self, origin: float) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3),
+        }
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict(origin) for child in self.children]
+        return data
+
+
+class _NullSpan:
+    """未启用追踪时的空操作 span"""
+
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def add(self, **counters: float) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    一次运行的 span 树
+
+    每个线程维护自己的 span 栈；工作线程中新建的 span 挂在启动追踪的线程
+    当前所在的 span 下（即派发这些任务的阶段）。
+    """
+
+    def __init__(self, name: str, **attrs: Any):
+        self.root = Span(name, attrs)
+        self.started_at = datetime.now()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._main_stack: List[Span] = self._stack()
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Span]:
+        stack = self._stack()
+        if stack:
+            parent = stack[-1]
+        elif self._main_stack:
+            parent = self._main_stack[-1]
+        else:
+            parent = self.root
+
+        current = Span(name, attrs)
+        with self._lock:
+            parent.children.append(current)
+        stack.append(current)
+        try:
+            yield current
+        except BaseException as e:
+            current.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            current.end = time.perf_counter()
+            stack.pop()
+
+    def finish(self) -> None:
+        if self.root.end is None:
+            self.root.end = time.perf_counter()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "duration_ms": round(self.root.duration * 1000, 3),
+            "trace": self.root.to_dict(self.root.start),
+        }
+
+    def write_json(self, path: str) -> str:
+        """写出 span 树（先写临时文件再替换）"""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(target.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        tmp_path.replace(target)
+        return str(target)
+
+    def summary(self) -> str:
+        """一行摘要：总耗时 + 各顶层阶段耗时（同名阶段合并）"""
+        stages: Dict[str, List[float]] = {}
+        for child in self.root.children:
+            entry = stages.setdefault(child.name, [0.0, 0])
+            entry[0] += child.duration
+            entry[1] += 1
+
+        parts = [f"总耗时 {self.root.duration:.2f}s"]
+        for name, (duration, count) in stages.items():
+            suffix = f" ×{count}" if count > 1 else ""
+            parts.append(f"{name} {duration:.2f}s{suffix}")
+        errors = sum(1 for span in self.iter_spans() if span.error)
+        if errors:
+            parts.append(f"失败 {errors} 个阶段")
+        return " | ".join(parts)
+
+    def iter_spans(self) -> Iterator[Span]:
+        """深度优先遍历所有 span（不含根）"""
+        pending = list(reversed(self.root.children))
+        while pending:
+            current = pending.pop()
+            yield current
+            pending.extend(reversed(current.children))
+
+
+_active_tracer: Optional[Tracer] = None
+
+
+def start_trace(name: str, **attrs: Any) -> Tracer:
+    """开始一次追踪（替换当前活动的追踪）"""
+    global _active_tracer
+    _active_tracer = Tracer(name, **attrs)
+    return _active_tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """获取当前活动的追踪"""
+    return _active_tracer
+
+
+def end_trace() -> Optional[Tracer]:
+    """结束当前追踪并返回它"""
+    global _active_tracer
+    tracer, _active_tracer = _active_tracer, None
+    if tracer is not None:
+        tracer.finish()
+    return tracer
+
+
+def current_span():
+    """
+    获取当前线程所在的 span（用于在深层调用中补充属性）
+
+    Returns:
+        Span；未启用追踪或不在任何 span 内时为空操作对象
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        return _NULL_SPAN
+    stack = tracer._stack()
+    return stack[-1] if stack else _NULL_SPAN
+
+
+def span(name: str, **attrs: Any):
+    """
+    在当前追踪中记录一个阶段
+
+    Args:
+        name: 阶段名（建议用点分层级，如 "remote.download"）
+        **attrs: 初始属性
+
+    Returns:
+        上下文管理器，产出 Span（未启用追踪时为空操作对象）
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        return nullcontext(_NULL_SPAN)
+    return tracer.span(name, **attrs)